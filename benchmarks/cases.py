@@ -0,0 +1,152 @@
+from typing import Callable, Dict, Iterator, Tuple
+
+import os
+import json
+import shutil
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core import azure_client
+from scripts.fake_azure import FakeAzureServer
+
+
+# Cada caso es un generador de contexto que prepara datos y entrega la función a medir.
+Case = Callable[[], contextlib.AbstractContextManager]
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Callable[[], Iterator[Callable[[], None]]]], Case]:
+    def register(fn: Callable[[], Iterator[Callable[[], None]]]) -> Case:
+        CASES[name] = contextlib.contextmanager(fn)
+        return CASES[name]
+    return register
+
+
+SMALL_DOC = "# Cambios\n\nTexto con **negrita** y `código`.\n\n- uno\n- dos\n"
+HUGE_DOC = "\n\n".join(
+    f"## Sección {i}\n\nPárrafo con **énfasis**, [enlace](https://example.com/{i}) y `código`.\n\n"
+    f"- punto a\n- punto b\n\n```python\nprint({i})\n```" for i in range(2000)
+)
+GLOBAL_CONFIG = {"organization": "org", "project": "proj", "pat": "bench"}
+DOC_CONFIG = {"repository_id": "repo", "pull_request_id": "1", "work_item_id": "1"}
+
+
+@contextlib.contextmanager
+def temp_dir() -> Iterator[str]:
+    path = tempfile.mkdtemp(prefix="azure_poster_bench_")
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def make_doc_folder(path: str) -> None:
+    os.makedirs(path)
+    with open(os.path.join(path, "config.json"), "w") as f:
+        json.dump(DOC_CONFIG, f)
+
+
+@case("get_valid_folders_10k")
+def bench_get_valid_folders() -> Iterator[Callable[[], None]]:
+    from src.core import config_manager, constants
+
+    with temp_dir() as base:
+        for i in range(10_000):
+            make_doc_folder(os.path.join(base, f"doc_{i:05d}"))
+        manager = config_manager.ConfigManager(configs=constants.DEFAULT_CONFIG)
+        yield lambda: manager.get_valid_folders(base)
+
+
+@case("get_valid_folders_nested_10k")
+def bench_get_valid_folders_nested() -> Iterator[Callable[[], None]]:
+    """equipo/sprint/feature con adjuntos dentro de cada carpeta y un subárbol ignorado por equipo."""
+    from src.core import config_manager, constants
+
+    with temp_dir() as base:
+        for team in range(20):
+            for sprint in range(10):
+                for feature in range(50):
+                    path = os.path.join(base, f"team_{team}", f"sprint_{sprint}", f"feature_{feature}")
+                    make_doc_folder(path)
+                    os.mkdir(os.path.join(path, "adjuntos"))
+            os.makedirs(os.path.join(base, f"team_{team}", "venv", "lib", "site-packages"))
+        manager = config_manager.ConfigManager(configs=constants.DEFAULT_CONFIG)
+        yield lambda: manager.get_valid_folders(base)
+
+
+@contextlib.contextmanager
+def offline_client() -> Iterator[azure_client.AzureClient]:
+    """Cliente cuya sesión responde 200 sin red: recorre todo `_request` (presupuesto, métricas,
+    serialización del cuerpo) y deja fuera solo el socket."""
+    import requests
+    from requests.adapters import BaseAdapter
+
+    class OfflineAdapter(BaseAdapter):
+        def send(self, request, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response.url = request.url
+            response._content = b'{"id": 1}'
+            return response
+
+        def close(self):
+            pass
+
+    client = azure_client.AzureClient(base_url="http://bench.invalid")
+    client.session_for(client.profile_key(GLOBAL_CONFIG)).mount("http://", OfflineAdapter())
+    yield client
+
+
+@case("post_to_wi_body_small")
+def bench_post_to_wi_small() -> Iterator[Callable[[], None]]:
+    with offline_client() as client:
+        yield lambda: client.post_to_wi(GLOBAL_CONFIG, DOC_CONFIG, SMALL_DOC)
+
+
+@case("post_to_wi_body_huge")
+def bench_post_to_wi_huge() -> Iterator[Callable[[], None]]:
+    with offline_client() as client:
+        yield lambda: client.post_to_wi(GLOBAL_CONFIG, DOC_CONFIG, HUGE_DOC)
+
+
+@case("json_roundtrip_1k")
+def bench_json_roundtrip() -> Iterator[Callable[[], None]]:
+    from src.core import config_manager
+
+    with temp_dir() as base:
+        paths = [os.path.join(base, f"{i}.json") for i in range(1000)]
+
+        def run() -> None:
+            for path in paths:
+                config_manager.ConfigManager.save_json(path, DOC_CONFIG)
+                config_manager.ConfigManager.load_json(path)
+        yield run
+
+
+@case("publish_single")
+def bench_publish_single() -> Iterator[Callable[[], None]]:
+    with FakeAzureServer() as server:
+        client = azure_client.AzureClient(base_url=server.url)
+
+        def run() -> None:
+            client.post_to_pr(GLOBAL_CONFIG, DOC_CONFIG, SMALL_DOC)
+            client.post_to_wi(GLOBAL_CONFIG, DOC_CONFIG, SMALL_DOC)
+        yield run
+
+
+@case("publish_bulk_50")
+def bench_publish_bulk() -> Iterator[Callable[[], None]]:
+    with FakeAzureServer() as server:
+        client = azure_client.AzureClient(base_url=server.url)
+
+        def publish(_: int) -> Tuple[int, int]:
+            r1 = client.post_to_pr(GLOBAL_CONFIG, DOC_CONFIG, SMALL_DOC)
+            r2 = client.post_to_wi(GLOBAL_CONFIG, DOC_CONFIG, SMALL_DOC)
+            return r1.status_code, r2.status_code
+
+        def run() -> None:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(publish, range(50)))
+        yield run
@@ -0,0 +1,90 @@
+"""Ejecuta los benchmarks de las rutas críticas y compara contra la línea base.
+
+    python -m benchmarks.run                 # mide e imprime
+    python -m benchmarks.run --save          # guarda benchmarks/baselines/baseline.json
+    python -m benchmarks.run --compare       # falla (exit 1) si algo es más lento que el umbral
+
+La línea base versionada es una referencia; como los tiempos dependen de la
+máquina, conviene regenerarla con `--save` en la máquina donde corre el control.
+Sin línea base, `--compare` falla: un control que no compara nada no protege.
+"""
+from typing import List, Dict, Any
+
+import sys
+import json
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+from benchmarks.cases import CASES
+
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "baseline.json"
+
+
+def measure(name: str, repeat: int) -> Dict[str, float]:
+    with CASES[name]() as fn:
+        fn()  # calentamiento
+        samples: List[float] = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "repeat": repeat,
+    }
+
+
+def find_regressions(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Casos cuya mediana supera la de la línea base en más de `threshold` (0.2 = 20%)."""
+    regressions: List[str] = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {base['median'] * 1000:.2f}ms -> {result['median'] * 1000:.2f}ms (x{ratio:.2f})")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cases", nargs="*", help="Casos a ejecutar (por defecto todos)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="Guardar resultados como línea base")
+    parser.add_argument("--compare", action="store_true", help="Comparar contra la línea base")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Any] = {}
+    for name in args.cases or CASES:
+        results[name] = measure(name, args.repeat)
+        print(f"{name:<28} median {results[name]['median'] * 1000:9.2f}ms  min {results[name]['min'] * 1000:9.2f}ms")
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        previous = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        args.baseline.write_text(json.dumps({**previous, **results}, indent=4))
+        print(f"Línea base guardada en {args.baseline}")
+
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"❌ No existe línea base en {args.baseline}; guárdala con --save")
+            return 1
+        regressions = find_regressions(results, json.loads(args.baseline.read_text()), args.threshold)
+        for line in regressions:
+            print(f"❌ Regresión {line}")
+        if regressions:
+            return 1
+        print("✅ Sin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Servidor local que imita los endpoints de Azure DevOps usados por `AzureClient`.
+
+Permite probar publicaciones, reintentos y límites de concurrencia sin red:
+
+    python -m scripts.fake_azure --port 8080 --latency 0.05 --fault-rate 0.1 --rate-limit 200
+
+y luego ejecutar la app con `AZURE_POSTER_BASE_URL=http://127.0.0.1:8080`.
+"""
+from typing import List, Dict, Any, Optional, Tuple
+
+import re
+import json
+import base64
+import time
+import random
+import argparse
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@dataclass
+class FaultConfig:
+    latency: float = 0.0                   # segundos añadidos a cada respuesta
+    jitter: float = 0.0                    # variación aleatoria máxima sobre `latency`
+    fault_rate: float = 0.0                # probabilidad de responder 429/503
+    fault_statuses: Tuple[int, ...] = (429, 503)
+    retry_after: int = 1                   # valor del header Retry-After en fallos
+    rate_limit: int = 0                    # peticiones por ventana y PAT (0 = sin límite)
+    rate_window: float = 60.0
+    invalid_pats: set = field(default_factory=set)
+
+
+ROUTES = [
+    ("POST", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/git/repositories/(?P<repo>[^/]+)"
+                        r"/pullRequests/(?P<pr>\d+)/threads$"), "create_thread"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/git/repositories/(?P<repo>[^/]+)"
+                       r"/pullRequests/(?P<pr>\d+)/threads$"), "list_threads"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/git/repositories$"), "list_repositories"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/git/repositories/(?P<repo>[^/]+)$"),
+     "get_repository"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/git/repositories/(?P<repo>[^/]+)"
+                       r"/pullRequests/(?P<pr>\d+)$"), "get_pull_request"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/git/pullrequests$"), "list_pull_requests"),
+    ("PATCH", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/wit/workitems/(?P<wi>\d+)$"), "update_work_item"),
+    ("POST", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/wit/wiql$"), "wiql"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/wit/workitems$"), "get_work_items"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/wit/workitems/(?P<wi>\d+)$"), "get_work_item"),
+    ("POST", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/wit/\$batch$"), "batch"),
+    ("POST", re.compile(r"^/(?P<org>[^/]+)/(?P<project>[^/]+)/_apis/wit/attachments$"), "attachment"),
+    ("GET", re.compile(r"^/(?P<org>[^/]+)/_apis/projects/(?P<project>[^/]+)$"), "get_project"),
+]
+
+
+class FakeAzureState:
+    """Estado en memoria compartido por todas las peticiones del servidor."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.threads: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.history: Dict[str, List[str]] = {}
+        self.attachments: Dict[int, bytes] = {}             # id -> contenido subido
+        self.repositories: List[str] = ["repo"]
+        self.pull_requests: Dict[str, List[int]] = {}     # repo -> PRs existentes
+        self.work_items: set = set()                       # además de los que ya recibieron historial
+        self.requests: List[Tuple[str, str, int]] = []
+        self.windows: Dict[str, Tuple[float, int]] = {}
+        self.next_id = 1
+
+    def new_id(self) -> int:
+        with self.lock:
+            self.next_id += 1
+            return self.next_id
+
+    @staticmethod
+    def now() -> str:
+        return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()) + f".{int(time.time() * 1000) % 1000:03d}Z"
+
+
+class FakeAzureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "FakeAzureHTTPServer"
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, payload: Any = None, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload if payload is not None else {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.state.lock:
+            self.server.state.requests.append((self.command, self.path, status))
+
+    def _rate_headers(self, pat: str) -> Tuple[bool, Dict[str, str]]:
+        faults = self.server.faults
+        if not faults.rate_limit:
+            return True, {}
+        state = self.server.state
+        with state.lock:
+            start, used = state.windows.get(pat, (time.monotonic(), 0))
+            if time.monotonic() - start >= faults.rate_window:
+                start, used = time.monotonic(), 0
+            used += 1
+            state.windows[pat] = (start, used)
+        reset = int(time.time() + faults.rate_window - (time.monotonic() - start))
+        headers = {
+            "X-RateLimit-Resource": "Core",
+            "X-RateLimit-Limit": str(faults.rate_limit),
+            "X-RateLimit-Remaining": str(max(faults.rate_limit - used, 0)),
+            "X-RateLimit-Reset": str(reset),
+        }
+        return used <= faults.rate_limit, headers
+
+    def _handle(self) -> None:
+        faults = self.server.faults
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+
+        if faults.latency or faults.jitter:
+            time.sleep(faults.latency + random.uniform(0, faults.jitter))
+
+        auth = self.headers.get("Authorization", "")
+        pat = base64.b64decode(auth[6:]).decode("ascii", "replace").lstrip(":") if auth.startswith("Basic ") else ""
+        if not pat or pat in faults.invalid_pats:
+            return self._send(401, {"message": "Unauthorized"})
+
+        allowed, rate_headers = self._rate_headers(pat)
+        if not allowed:
+            return self._send(429, {"message": "Rate limited"},
+                              {**rate_headers, "Retry-After": str(faults.retry_after)})
+        if faults.fault_rate and random.random() < faults.fault_rate:
+            return self._send(random.choice(faults.fault_statuses), {"message": "Injected fault"},
+                              {**rate_headers, "Retry-After": str(faults.retry_after)})
+
+        parsed = urlparse(self.path)
+        for method, pattern, name in ROUTES:
+            match = pattern.match(parsed.path)
+            if method == self.command and match:
+                # Solo los cuerpos JSON se decodifican; los adjuntos llegan como bytes (octet-stream)
+                body: Any = raw or None
+                if raw and "json" in self.headers.get("Content-Type", ""):
+                    try:
+                        body = json.loads(raw)
+                    except ValueError as exc:
+                        return self._send(400, {"message": f"Invalid JSON: {exc}"}, rate_headers)
+                status, payload = getattr(self, f"route_{name}")(match.groupdict(), parse_qs(parsed.query), body)
+                return self._send(status, payload, rate_headers)
+        return self._send(404, {"message": f"No route for {self.command} {parsed.path}"})
+
+    do_GET = do_POST = do_PATCH = _handle
+
+    # --- Rutas ---
+
+    def route_create_thread(self, params, query, body):
+        state = self.server.state
+        now = state.now()
+        thread = {
+            "id": state.new_id(),
+            "status": body.get("status", "active"),
+            "publishedDate": now,
+            "lastUpdatedDate": now,
+            "comments": [
+                {"id": i + 1, "content": c.get("content", ""), "commentType": c.get("commentType", "text"),
+                 "publishedDate": now, "lastUpdatedDate": now, "author": {"displayName": "Fake"}}
+                for i, c in enumerate(body.get("comments", []))
+            ],
+        }
+        with state.lock:
+            state.threads.setdefault((params["repo"], params["pr"]), []).append(thread)
+        return 200, thread
+
+    def route_list_threads(self, params, query, body):
+        with self.server.state.lock:
+            threads = list(self.server.state.threads.get((params["repo"], params["pr"]), []))
+        return 200, {"value": threads, "count": len(threads)}
+
+    def route_list_repositories(self, params, query, body):
+        repos = [{"id": name, "name": name} for name in self.server.state.repositories]
+        return 200, {"value": repos, "count": len(repos)}
+
+    def route_list_pull_requests(self, params, query, body):
+        with self.server.state.lock:
+            prs = [
+                {"pullRequestId": pr, "title": f"PR {pr}", "status": "active", "repository": {"id": repo, "name": repo}}
+                for repo, ids in self.server.state.pull_requests.items() for pr in ids
+            ]
+        return 200, {"value": prs, "count": len(prs)}
+
+    def route_get_repository(self, params, query, body):
+        if params["repo"] not in self.server.state.repositories:
+            return 404, {"message": f"Repository {params['repo']} not found"}
+        return 200, {"id": params["repo"], "name": params["repo"]}
+
+    def route_get_pull_request(self, params, query, body):
+        if int(params["pr"]) not in self.server.state.pull_requests.get(params["repo"], []):
+            return 404, {"message": f"Pull request {params['pr']} not found"}
+        return 200, {"pullRequestId": int(params["pr"]), "status": "active"}
+
+    def route_get_work_item(self, params, query, body):
+        state = self.server.state
+        if int(params["wi"]) not in state.work_items and params["wi"] not in state.history:
+            return 404, {"message": f"Work item {params['wi']} not found"}
+        return 200, {"id": int(params["wi"]), "fields": {"System.Id": int(params["wi"])}}
+
+    def route_update_work_item(self, params, query, body):
+        state = self.server.state
+        with state.lock:
+            history = state.history.setdefault(params["wi"], [])
+            history.extend(op.get("value", "") for op in body or [] if op.get("path") == "/fields/System.History")
+        return 200, {"id": int(params["wi"]), "rev": len(history)}
+
+    def route_wiql(self, params, query, body):
+        with self.server.state.lock:
+            ids = [int(i) for i in self.server.state.history]
+        return 200, {"workItems": [{"id": i} for i in ids]}
+
+    def route_get_work_items(self, params, query, body):
+        ids = query.get("ids", [""])[0].split(",")
+        return 200, {"value": [{"id": int(i), "fields": {"System.Title": f"Work item {i}"}} for i in ids if i]}
+
+    def route_batch(self, params, query, body):
+        return 200, {"count": len(body or []), "value": [{"code": 200} for _ in body or []]}
+
+    def route_attachment(self, params, query, body):
+        attachment_id = self.server.state.new_id()
+        with self.server.state.lock:
+            self.server.state.attachments[attachment_id] = body or b""
+        return 201, {"id": str(attachment_id), "url": f"{self.server.url}/_apis/wit/attachments/{attachment_id}"}
+
+    def route_get_project(self, params, query, body):
+        return 200, {"id": params["project"], "name": params["project"], "state": "wellFormed"}
+
+
+class FakeAzureHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], faults: FaultConfig):
+        super().__init__(address, FakeAzureHandler)
+        self.faults = faults
+        self.state = FakeAzureState()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+
+class FakeAzureServer:
+    """Levanta el servidor en un hilo; usable como context manager en tests y benchmarks."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, faults: Optional[FaultConfig] = None):
+        self.httpd = FakeAzureHTTPServer((host, port), faults or FaultConfig())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return self.httpd.url
+
+    @property
+    def state(self) -> FakeAzureState:
+        return self.httpd.state
+
+    def start(self) -> "FakeAzureServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeAzureServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Latencia fija en segundos")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latencia aleatoria adicional máxima")
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="Probabilidad de responder 429/503")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--rate-limit", type=int, default=0, help="Peticiones por ventana y PAT (0 = sin límite)")
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency=args.latency, jitter=args.jitter, fault_rate=args.fault_rate, retry_after=args.retry_after,
+        rate_limit=args.rate_limit, rate_window=args.rate_window,
+    )
+    httpd = FakeAzureHTTPServer((args.host, args.port), faults)
+    print(f"Fake Azure DevOps escuchando en {httpd.url}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,187 @@
-import requests
-import base64
+"""Revisa la salud de todas las credenciales y destinos configurados.
 
-def validate_connection(organization, project, pat):
+Valida en paralelo el PAT de cada perfil y que existan los repositorios, PRs y
+work items referenciados por las carpetas de documentación; escribe un reporte JSON
+con el resultado y la latencia de cada verificación:
+
+    python -m scripts.pat_validation                       # reporte a stdout
+    python -m scripts.pat_validation --output health.json --workers 32
+
+Termina con código 1 si alguna verificación falla. Con `AZURE_POSTER_BASE_URL`
+se puede apuntar a `scripts/fake_azure.py`.
+"""
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core import azure_client, config_manager, constants, profiles
+
+
+TARGET_FIELDS = (
+    ("repository", "repository_id"),
+    ("pull_request", "pull_request_id"),
+    ("work_item", "work_item_id"),
+)
+
+
+@dataclass
+class Check:
+    profile: str
+    kind: str                              # pat | repository | pull_request | work_item
+    target: str
+    folders: List[str] = field(default_factory=list)
+    status: str = "pending"                # ok | unauthorized | missing | error | skipped
+    http_status: Optional[int] = None
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+def classify(status_code: int) -> str:
+    if 200 <= status_code < 300 and status_code != 203:
+        return "ok"
+    # Con un PAT inválido Azure puede responder 203 con la página de login en lugar de 401
+    if status_code in (203, 401, 403):
+        return "unauthorized"
+    if status_code == 404:
+        return "missing"
+    return "error"
+
+
+def run_check(check: Check, request: Callable[[], Any]) -> Check:
+    start = time.perf_counter()
     try:
-        auth_bytes = f":{pat}".encode('ascii')
-        base64_auth = base64.b64encode(auth_bytes).decode('ascii')
-
-        headers = {
-            'Authorization': f'Basic {base64_auth}',
-            'Content-Type': 'application/json'
-        }
-
-        url = f"https://dev.azure.com/{organization}/_apis/projects/{project}?api-version=7.0"
-
-        print(f"Intentando validar contra: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
-
-        if response.status_code == 200:
-            print("✅ Conexión exitosa.")
-            return True, "Conexión exitosa"
-        elif response.status_code == 401:
-            print("❌ Error 401: Token no autorizado o formato incorrecto.")
-            return False, "Token no autorizado (401)"
-        else:
-            print(f"❌ Error {response.status_code}: {response.text}")
-            return False, f"Error del servidor: {response.status_code}"
-
-    except Exception as e:
-        print("Fallo crítico en la validación")
-        return False, str(e)
-
-variables = {
-    "organization": "",
-    "project": "",
-    "pat": "",
-    "base_path": "",
-    "theme": ""
-}
-
-validate_connection(variables.get("organization"), variables.get("project"), variables.get("pat"))
+        response = request()
+        check.http_status = response.status_code
+        check.status = classify(response.status_code)
+        if check.status != "ok":
+            check.error = response.text[:200]
+    except Exception as exc:
+        check.status = "error"
+        check.error = str(exc)
+    check.latency_ms = round((time.perf_counter() - start) * 1000, 2)
+    return check
+
+
+def collect_targets(global_config: Dict[str, Any], storage: config_manager.ConfigManager,
+                    base_path: str) -> Dict[Tuple[str, str, str], Check]:
+    """Destinos únicos por (perfil, tipo, id); varias carpetas que apuntan al mismo PR se verifican una vez."""
+    targets: Dict[Tuple[str, str, str], Check] = {}
+    default = profiles.default_profile(global_config)
+    for folder in storage.get_valid_folders(base_path):
+        doc_config = storage.load_doc_config(base_path, folder)
+        profile = doc_config.get("profile") or default
+        repository = doc_config.get("repository_id", "")
+        for kind, key in TARGET_FIELDS:
+            value = str(doc_config.get(key) or "")
+            if not value:
+                continue
+            # Los PRs solo existen dentro de su repositorio
+            target = f"{repository}/{value}" if kind == "pull_request" else value
+            check = targets.setdefault((profile, kind, target), Check(profile, kind, target))
+            check.folders.append(folder)
+    return targets
+
+
+def target_request(azure: azure_client.AzureClient, profile_config: Dict[str, Any],
+                   check: Check) -> Callable[[], Any]:
+    if check.kind == "repository":
+        return lambda: azure.get_repository(profile_config, check.target)
+    if check.kind == "pull_request":
+        repository, pull_request = check.target.rsplit("/", 1)
+        return lambda: azure.get_pull_request(profile_config, repository, pull_request)
+    return lambda: azure.get_work_item(profile_config, check.target)
+
+
+def health_check(global_config: Dict[str, Any], configs: constants.AppConfig, base_path: Optional[str],
+                 workers: int = 16, only: Optional[List[str]] = None,
+                 azure: Optional[azure_client.AzureClient] = None) -> Dict[str, Any]:
+    """Verifica primero los PATs y luego, solo de los perfiles válidos, los destinos de las carpetas."""
+    started = time.perf_counter()
+    azure = azure or azure_client.AzureClient(
+        base_url=configs.azure_base_url, max_concurrency=workers, max_retry_wait=5.0
+    )
+    names = [name for name in profiles.profile_names(global_config) if not only or name in only]
+    resolved = {name: profiles.resolve(global_config, name) for name in names}
+
+    pat_checks = [Check(name, "pat", f"{cfg['organization']}/{cfg['project']}") for name, cfg in resolved.items()]
+    targets: List[Check] = []
+    if base_path and os.path.isdir(base_path):
+        storage = config_manager.ConfigManager(configs)
+        targets = [c for c in collect_targets(global_config, storage, base_path).values() if not only or c.profile in only]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda c: run_check(c, lambda: azure.get_project(resolved[c.profile])), pat_checks))
+        valid = {check.profile for check in pat_checks if check.status == "ok"}
+
+        runnable: List[Check] = []
+        for check in targets:
+            if check.profile not in resolved:
+                check.status, check.error = "error", f"El perfil '{check.profile}' no existe"
+            elif check.profile not in valid:
+                check.status, check.error = "skipped", "El PAT del perfil no es válido"
+            else:
+                runnable.append(check)
+        list(pool.map(lambda c: run_check(c, target_request(azure, resolved[c.profile], c)), runnable))
+
+    checks = pat_checks + targets
+    summary: Dict[str, int] = {}
+    for check in checks:
+        summary[check.status] = summary.get(check.status, 0) + 1
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "duration_seconds": round(time.perf_counter() - started, 3),
+        "base_path": base_path,
+        "summary": summary,
+        # Sin verificaciones no hay nada que respalde un "sano"
+        "healthy": bool(checks) and all(check.status == "ok" for check in checks),
+        "profiles": [asdict(check) for check in pat_checks],
+        "targets": [asdict(check) for check in sorted(targets, key=lambda c: (c.profile, c.kind, c.target))],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", type=Path, default=constants.DEFAULT_CONFIG.global_config_file,
+                        help="Config global de la app (perfiles y ruta de documentación)")
+    parser.add_argument("--base-path", help="Ruta de documentación (por defecto la de la config)")
+    parser.add_argument("--profile", action="append", help="Verificar solo este perfil (repetible)")
+    parser.add_argument("--workers", type=int, default=16, help="Verificaciones simultáneas")
+    parser.add_argument("--output", type=Path, help="Archivo del reporte JSON (por defecto stdout)")
+    args = parser.parse_args(argv)
+
+    global_config = config_manager.ConfigManager.load_json(str(args.config))
+    if not profiles.get_profiles(global_config):
+        print(f"No hay perfiles configurados en {args.config}", file=sys.stderr)
+        return 2
+    unknown = sorted(set(args.profile or []) - set(profiles.get_profiles(global_config)))
+    if unknown:
+        print(f"Perfiles desconocidos: {', '.join(unknown)} (disponibles: {', '.join(profiles.profile_names(global_config))})",
+              file=sys.stderr)
+        return 2
+
+    report = health_check(global_config, constants.DEFAULT_CONFIG, args.base_path or global_config.get("base_path"),
+                          workers=args.workers, only=args.profile)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    for check in report["profiles"] + report["targets"]:
+        if check["status"] != "ok":
+            print(f"❌ [{check['profile']}] {check['kind']} {check['target']}: {check['status']}"
+                  f" ({check['http_status'] or check['error']})", file=sys.stderr)
+    counts = ", ".join(f"{status}={count}" for status, count in sorted(report["summary"].items()))
+    print(f"{'✅' if report['healthy'] else '⚠️'} {counts} en {report['duration_seconds']:.2f}s", file=sys.stderr)
+    return 0 if report["healthy"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,17 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, TYPE_CHECKING
 
+import time
 import base64
-import requests
-import markdown
 import logging
+import threading
+from datetime import timedelta
+
+from src.core.metrics import METRICS
+from src.core.rate_limit import RateBudget, retry_after
+
+# `requests` y `markdown` se importan al primer uso para no pagar su costo al abrir la app.
+if TYPE_CHECKING:
+    import requests
 
 
 logger = logging.getLogger(__name__)
@@ -12,13 +20,101 @@ logger = logging.getLogger(__name__)
 class AzureClient:
     """Handles all API communication with Azure DevOps."""
 
+    def __init__(self, base_url: str = "https://dev.azure.com", max_concurrency: int = 8,
+                 max_retries: int = 2, max_retry_wait: float = 60.0) -> None:
+        self.base_url = base_url.rstrip('/')
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+        self._sessions: Dict[str, "requests.Session"] = {}
+        self._budgets: Dict[str, RateBudget] = {}
+        self._session_lock = threading.Lock()
+
+    @staticmethod
+    def profile_key(global_config: Dict[str, str]) -> str:
+        """Perfil resuelto (ver `profiles.resolve`); las configs sin perfil se agrupan por organización."""
+        return global_config.get("profile") or global_config.get("organization", "")
+
+    def session_for(self, profile: str) -> "requests.Session":
+        """Sesión del perfil: cada uno tiene su pool de conexiones (keep-alive) y mide sus fases."""
+        session = self._sessions.get(profile)
+        if session is None:
+            with self._session_lock:
+                session = self._sessions.get(profile)
+                if session is None:
+                    import requests
+                    from src.core.http_timing import TimedHTTPAdapter
+
+                    session = requests.Session()
+                    adapter = TimedHTTPAdapter(pool_maxsize=self.max_concurrency)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._sessions[profile] = session
+        return session
+
+    def budget_for(self, profile: str) -> RateBudget:
+        budget = self._budgets.get(profile)
+        if budget is None:
+            with self._session_lock:
+                budget = self._budgets.setdefault(profile, RateBudget(
+                    profile or "-", self.max_concurrency, max_wait=self.max_retry_wait
+                ))
+        return budget
+
     @staticmethod
     def get_auth_header(token: str) -> Dict[str, str]:
         auth_bytes = base64.b64encode(bytes(f':{token}', 'ascii'))
         return {'Authorization': f'Basic {auth_bytes.decode("ascii")}'}
 
-    def post_to_pr(self, global_config: Dict[str, str], doc_config: Dict[str, str], content: str) -> requests.Response:
-        url: str = (f"https://dev.azure.com/{global_config['organization']}/{global_config['project']}/"
+    def _request(self, endpoint: str, method: str, url: str, profile: str = "", **kwargs: Any) -> "requests.Response":
+        """Ejecuta la petición dentro del presupuesto del perfil, reintentando si Azure pide esperar.
+
+        Con una pausa mayor a `max_retry_wait` se devuelve la respuesta limitada y las
+        peticiones siguientes del perfil lanzan `Throttled` hasta que termine la pausa.
+        """
+        budget = self.budget_for(profile)
+        attempt = 0
+        while True:
+            with budget as waited:
+                if waited:
+                    METRICS.observe("rate_limit_wait_seconds", waited, profile=profile)
+                response = self._send(endpoint, method, url, profile, **kwargs)
+
+            delay = retry_after(response.status_code, response.headers)
+            if delay is None:
+                return response
+            budget.pause(delay)
+            if response.ok or attempt >= self.max_retries or delay > self.max_retry_wait:
+                return response
+            attempt += 1
+            logger.info(f"{endpoint}: Azure respondió {response.status_code}, reintento {attempt} en {delay:.1f}s")
+
+    def _send(self, endpoint: str, method: str, url: str, profile: str, **kwargs: Any) -> "requests.Response":
+        """Envía con la sesión del perfil y registra sus tiempos por endpoint y status."""
+        from src.core.http_timing import pop_connection_phases
+
+        pop_connection_phases()
+        start = time.perf_counter()
+        response: Optional["requests.Response"] = None
+        try:
+            response = getattr(self.session_for(profile), method)(url, **kwargs)
+            return response
+        finally:
+            total = time.perf_counter() - start
+            status = str(getattr(response, "status_code", "error"))
+            METRICS.observe("http_request_seconds", total, endpoint=endpoint, status=status)
+
+            phases = pop_connection_phases()
+            elapsed = getattr(response, "elapsed", None)
+            if isinstance(elapsed, timedelta):
+                # `elapsed` llega hasta los headers e incluye la conexión; el resto es la descarga del cuerpo
+                phases["request"] = max(elapsed.total_seconds() - sum(phases.values()), 0.0)
+                phases["response"] = max(total - elapsed.total_seconds(), 0.0)
+            for phase, seconds in phases.items():
+                METRICS.observe("http_phase_seconds", seconds, endpoint=endpoint, phase=phase)
+
+    def post_to_pr(self, global_config: Dict[str, str], doc_config: Dict[str, str], content: str) -> "requests.Response":
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
                     f"_apis/git/repositories/{doc_config['repository_id']}/pullRequests/"
                     f"{doc_config['pull_request_id']}/threads?api-version=7.1-preview.1")
 
@@ -30,28 +126,127 @@ class AzureClient:
             "comments": [{"content": content, "commentType": "text"}],
             "status": "active"
         }
-        return requests.post(url, json=body, headers=headers)
+        return self._request("pr_threads", "post", url, self.profile_key(global_config), json=body, headers=headers)
 
-    def post_to_wi(self, global_config: Dict[str, str], doc_config: Dict[str, str], content: str) -> requests.Response:
-        url: str = (f"https://dev.azure.com/{global_config['organization']}/{global_config['project']}/"
+    def get_pr_threads(self, global_config: Dict[str, str], doc_config: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Obtiene los hilos (con sus comentarios) del PR configurado en la carpeta."""
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
+                    f"_apis/git/repositories/{doc_config['repository_id']}/pullRequests/"
+                    f"{doc_config['pull_request_id']}/threads?api-version=7.1-preview.1")
+
+        response = self._request("pr_threads", "get", url, self.profile_key(global_config), headers=self.get_auth_header(global_config['pat']), timeout=30)
+        response.raise_for_status()
+        return response.json().get("value", [])
+
+    def post_to_wi(self, global_config: Dict[str, str], doc_config: Dict[str, str], content: str) -> "requests.Response":
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
                     f"_apis/wit/workitems/{doc_config['work_item_id']}?api-version=7.1-preview.3")
 
         headers: Dict[str, str] = {
             **self.get_auth_header(global_config['pat']),
             'Content-Type': 'application/json-patch+json'
         }
-        html_content: str = markdown.markdown(content)
+        import markdown
+
+        with METRICS.span("markdown_render_seconds"):
+            html_content: str = markdown.markdown(content)
         body: List[Dict[str, Any]] = [
             {"op": "add", "path": "/fields/System.History", "value": html_content}
         ]
-        return requests.patch(url, json=body, headers=headers)
+        return self._request("work_items", "patch", url, self.profile_key(global_config), json=body, headers=headers)
+
+    def iter_pages(self, url: str, pat: str, page_size: Optional[int] = None, endpoint: str = "pages",
+                   profile: str = "") -> Iterator[List[Dict[str, Any]]]:
+        """Recorre una colección paginada de Azure y entrega cada página al llegar.
+
+        Sigue el header `x-ms-continuationtoken` cuando la API lo envía; si no,
+        y se indicó `page_size`, avanza con `$top`/`$skip`.
+        """
+        skip = 0
+        token: Optional[str] = None
+        while True:
+            params: Dict[str, Any] = {}
+            if token:
+                params["continuationToken"] = token
+            elif page_size:
+                params.update({"$top": page_size, "$skip": skip})
+
+            response = self._request(endpoint, "get", url, profile, params=params, headers=self.get_auth_header(pat), timeout=30)
+            response.raise_for_status()
+            page: List[Dict[str, Any]] = response.json().get("value", [])
+            yield page
+
+            token = response.headers.get("x-ms-continuationtoken")
+            if token:
+                continue
+            if not page_size or len(page) < page_size:
+                return
+            skip += page_size
+
+    def list_repositories(self, global_config: Dict[str, str]) -> Iterator[List[Dict[str, Any]]]:
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
+                    f"_apis/git/repositories?api-version=7.1")
+        return self.iter_pages(url, global_config['pat'], endpoint="repositories", profile=self.profile_key(global_config))
+
+    def list_pull_requests(self, global_config: Dict[str, str], page_size: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
+                    f"_apis/git/pullrequests?searchCriteria.status=active&api-version=7.1")
+        return self.iter_pages(url, global_config['pat'], page_size=page_size, endpoint="pull_requests",
+                               profile=self.profile_key(global_config))
+
+    def list_work_items(self, global_config: Dict[str, str], changed_since: str,
+                        batch_size: int = 200) -> Iterator[List[Dict[str, Any]]]:
+        """Entrega por lotes los work items modificados desde `changed_since` (YYYY-MM-DD)."""
+        base: str = f"{self.base_url}/{global_config['organization']}/{global_config['project']}/_apis/wit"
+        headers: Dict[str, str] = {**self.get_auth_header(global_config['pat']), 'Content-Type': 'application/json'}
+        query: Dict[str, str] = {
+            "query": ("SELECT [System.Id] FROM WorkItems WHERE [System.TeamProject] = @project "
+                      f"AND [System.ChangedDate] >= '{changed_since}' ORDER BY [System.ChangedDate] DESC")
+        }
+        profile = self.profile_key(global_config)
+        response = self._request("wiql", "post", f"{base}/wiql?api-version=7.1", profile, json=query, headers=headers, timeout=30)
+        response.raise_for_status()
+        ids: List[int] = [item["id"] for item in response.json().get("workItems", [])]
+
+        for start in range(0, len(ids), batch_size):
+            chunk = ",".join(str(i) for i in ids[start:start + batch_size])
+            page = self._request(
+                "work_items", "get", f"{base}/workitems?ids={chunk}&fields=System.Id,System.Title,System.ChangedDate&api-version=7.1",
+                profile, headers=headers, timeout=30
+            )
+            page.raise_for_status()
+            yield page.json().get("value", [])
+
+    def get_project(self, global_config: Dict[str, str]) -> "requests.Response":
+        """Proyecto de la config; además valida que el PAT siga vigente."""
+        url = f"{self.base_url}/{global_config['organization']}/_apis/projects/{global_config['project']}?api-version=7.0"
+        return self._request("projects", "get", url, self.profile_key(global_config),
+                             headers=self.get_auth_header(global_config['pat']), timeout=10)
+
+    def get_repository(self, global_config: Dict[str, str], repository_id: str) -> "requests.Response":
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
+                    f"_apis/git/repositories/{repository_id}?api-version=7.1")
+        return self._request("repositories", "get", url, self.profile_key(global_config),
+                             headers=self.get_auth_header(global_config['pat']), timeout=10)
+
+    def get_pull_request(self, global_config: Dict[str, str], repository_id: str,
+                         pull_request_id: str) -> "requests.Response":
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
+                    f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}?api-version=7.1")
+        return self._request("pull_requests", "get", url, self.profile_key(global_config),
+                             headers=self.get_auth_header(global_config['pat']), timeout=10)
+
+    def get_work_item(self, global_config: Dict[str, str], work_item_id: str) -> "requests.Response":
+        url: str = (f"{self.base_url}/{global_config['organization']}/{global_config['project']}/"
+                    f"_apis/wit/workitems/{work_item_id}?fields=System.Id&api-version=7.1")
+        return self._request("work_items", "get", url, self.profile_key(global_config),
+                             headers=self.get_auth_header(global_config['pat']), timeout=10)
 
     def verify_connection(self, organization: str, project: str, pat: str) -> bool:
         """Intenta conectar con la API de Azure para validar el PAT."""
-        url = f"https://dev.azure.com/{organization}/_apis/projects/{project}?api-version=7.0"
-        logger.info(f"Intentando validar contra: {url}")
+        logger.info(f"Intentando validar contra: {self.base_url}/{organization}/_apis/projects/{project}")
         try:
-            response = requests.get(url, headers=self.get_auth_header(pat), timeout=10)
+            response = self.get_project({"organization": organization, "project": project, "pat": pat})
             return response.ok
         except Exception as exc:
             logger.error(f"Fallo en la comunicación con Azure: {str(exc)}")
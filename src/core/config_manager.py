@@ -1,33 +1,49 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Tuple
 
 import os
 import re
 import json
-import pathlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from src.core import constants
+from src.core.ignore_rules import IgnoreRules
+from src.core.workspace_index import WorkspaceIndex, hash_text
+from src.core.metrics import METRICS
 
 
 logger = logging.getLogger(__name__)
 
 
+def _overlaps(path: str, other: str) -> bool:
+    """Indica si una de las dos rutas (absolutas y resueltas) es la otra o la contiene."""
+    return path == other or path.startswith(other + os.sep) or other.startswith(path + os.sep)
+
+
 class ConfigManager:
     """Handles file system operations and JSON configurations."""
 
-    def __init__(self, configs: constants.AppConfig):
+    def __init__(self, configs: constants.AppConfig, index: Optional[WorkspaceIndex] = None,
+                 max_workers: int = 8):
         self.configs = configs
+        self.index = index
+        self.max_workers = max_workers
+        self._rules: Dict[str, Tuple[Optional[float], IgnoreRules]] = {}
+        self._rules_lock = threading.Lock()
+        # Se llama con (base_path, carpeta, texto) justo antes de escribir un Markdown
+        self.on_markdown_write: Optional[Callable[[str, str, str], None]] = None
 
     @staticmethod
     def load_json(path: str) -> Dict[str, Any]:
         if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
+            with METRICS.span("file_io_seconds", op="read"), open(path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         return {}
 
     @staticmethod
     def save_json(path: str, data: Dict[str, Any]) -> None:
-        with open(path, 'w', encoding='utf-8') as f:
+        with METRICS.span("file_io_seconds", op="write"), open(path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4)
 
     def create_doc_folder(self, base_path: str, name: str, data: Dict[str, str]) -> str:
@@ -40,19 +56,125 @@ class ConfigManager:
             raise FileExistsError(f"La carpeta '{folder_name}' ya existe en esa ruta.")
 
         os.makedirs(full_path)
-        self.save_json(os.path.join(full_path, self.configs.doc_config_file), data)
-        pathlib.Path(os.path.join(full_path, self.configs.md_file)).touch()
+        self.save_doc_config(base_path, folder_name, data)
+        self.save_markdown(base_path, folder_name, "")
         return full_path
 
+    def load_doc_config(self, base_path: str, folder: str) -> Dict[str, Any]:
+        return self.load_json(os.path.join(base_path, folder, self.configs.doc_config_file))
+
+    def save_doc_config(self, base_path: str, folder: str, data: Dict[str, Any]) -> None:
+        """Guarda el config.json de la carpeta y actualiza su fila en el índice."""
+        path = os.path.join(base_path, folder, self.configs.doc_config_file)
+        self.save_json(path, data)
+        if self.index:
+            self.index.upsert_folder(base_path, folder, data, config_mtime=os.path.getmtime(path))
+
+    def save_markdown(self, base_path: str, folder: str, text: str) -> str:
+        """Escribe el Markdown de la carpeta y actualiza hash y mtime en el índice."""
+        path = os.path.join(base_path, folder, self.configs.md_file)
+        if self.on_markdown_write:
+            self.on_markdown_write(base_path, folder, text)
+        with METRICS.span("file_io_seconds", op="write"), open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if self.index:
+            self.index.upsert_folder(base_path, folder, content_hash=hash_text(text), mtime=os.path.getmtime(path))
+        return path
+
+    def reconcile_index(self, base_path: str) -> int:
+        """Recorre el disco una vez y pone el índice al día (carpetas nuevas, borradas o editadas fuera)."""
+        if not self.index:
+            return 0
+        return self.index.reconcile(
+            base_path, self.get_valid_folders(base_path), self.configs.md_file, self.configs.doc_config_file
+        )
+
+    def list_folders(self, base_path: str, order: str = "name", unpublished_only: bool = False) -> List[str]:
+        """Consulta el índice, que `reconcile_index` llena en segundo plano; nunca recorre el disco.
+
+        Sin índice solo se puede recorrer el disco, ordenado por nombre; como entonces no
+        se sabe qué se publicó, `unpublished_only` devuelve una lista vacía.
+        """
+        if self.index:
+            return self.index.list_folders(base_path, order, unpublished_only)
+        if unpublished_only:
+            return []
+        return self.get_valid_folders(base_path)
+
+    def ignore_rules(self, base_path: str) -> IgnoreRules:
+        """Compila las reglas de la ruta una sola vez; se recompilan solo si cambia el archivo de ignorados."""
+        ignore_path = os.path.join(base_path, self.configs.ignore_file)
+        mtime = os.path.getmtime(ignore_path) if os.path.exists(ignore_path) else None
+        with self._rules_lock:
+            cached = self._rules.get(base_path)
+            if cached is None or cached[0] != mtime:
+                rules = IgnoreRules.for_workspace(base_path, self.configs.ignore_file, self.configs.ignore_folders)
+                cached = self._rules[base_path] = (mtime, rules)
+            return cached[1]
+
+    def _scan_dirs(self, base_path: str, rules: IgnoreRules,
+                   relpaths: List[str]) -> Tuple[List[str], List[Tuple[str, Optional[str]]]]:
+        """Lee un lote de directorios; devuelve las carpetas de documentación y los subdirectorios a recorrer.
+
+        Los subdirectorios que son enlaces simbólicos van con la ruta real a la que apuntan.
+        """
+        found: List[str] = []
+        pending: List[Tuple[str, Optional[str]]] = []
+        marker = self.configs.doc_config_file
+        for relpath in relpaths:
+            dirs: List[Tuple[str, Optional[str]]] = []
+            is_doc = False
+            try:
+                with os.scandir(os.path.join(base_path, relpath)) as entries:
+                    for entry in entries:
+                        # Sigue enlaces simbólicos, como `os.path.isdir`
+                        if entry.is_dir():
+                            dirs.append((entry.name, os.path.realpath(entry.path) if entry.is_symlink() else None))
+                        elif relpath and entry.name == marker:
+                            is_doc = True
+            except OSError as exc:
+                logger.warning(f"No se pudo leer {os.path.join(base_path, relpath)}: {exc}")
+                continue
+            # Una carpeta de documentación es una hoja: sus subcarpetas (imágenes, adjuntos) no se recorren
+            if is_doc:
+                found.append(relpath)
+                continue
+            prefix = f"{relpath}/" if relpath else ""
+            pending.extend((prefix + name, target) for name, target in dirs if not rules.ignored(prefix + name))
+        return found, pending
+
     def get_valid_folders(self, base_path: str) -> List[str]:
-        """Lista carpetas solo dentro de la ruta configurada."""
-        if not base_path or not os.path.exists(base_path):
+        """Busca recursivamente las carpetas con `doc_config_file` y las devuelve como rutas relativas.
+
+        Recorre el árbol por niveles repartiendo lotes de directorios entre hilos;
+        los directorios ignorados se descartan antes de leerlos.
+
+        Los enlaces simbólicos a directorios fuera de la ruta se siguen una sola vez por
+        destino (gana la ruta que ordena primero). Se saltan los que apuntan dentro de la
+        ruta (la carpeta real ya aparece con su nombre) o a un directorio que la contiene o
+        contiene otro destino ya seguido, así que un ciclo no cuelga el recorrido.
+        """
+        if not base_path or not os.path.isdir(base_path):
             return []
-        return sorted(
-            [
-                d for d in os.listdir(base_path)
-                if os.path.isdir(os.path.join(base_path, d))
-                   and d not in self.configs.ignore_folders
-                   and not d.startswith('.')
-            ]
-        )
+        rules = self.ignore_rules(base_path)
+        root = os.path.realpath(base_path)
+        followed: set[str] = set()
+        folders: List[str] = []
+        with METRICS.span("folder_discovery_seconds"), ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            frontier = [""]
+            while frontier:
+                size = max(16, len(frontier) // (self.max_workers * 4) + 1)
+                batches = [frontier[i:i + size] for i in range(0, len(frontier), size)]
+                children: List[Tuple[str, Optional[str]]] = []
+                for found, pending in pool.map(lambda batch: self._scan_dirs(base_path, rules, batch), batches):
+                    folders.extend(found)
+                    children.extend(pending)
+                frontier = []
+                # En orden, para que el resultado no dependa de qué hilo terminó primero
+                for child, target in sorted(children):
+                    if target is not None:
+                        if any(_overlaps(target, path) for path in (root, *followed)):
+                            continue
+                        followed.add(target)
+                    frontier.append(child)
+        return sorted(folders)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -12,10 +13,19 @@ class AppConfig:
     md_file: str
     doc_config_file: str
     ignore_folders: set[str]
+    replies_file: str = "replies.jsonl"
+    sync_state_file: str = ".sync_state.json"
+    resource_index_file: str = "resource_index.json"
+    workspace_index_file: str = "workspace.db"
+    history_dir: str = ".azure_poster/objects"
+    ignore_file: str = ".azure_posterignore"
+    azure_base_url: str = "https://dev.azure.com"
 
 
 APP_ID = "com.vmgabriel.azure_poster"
 CONFIG_DIR: Path = Path(GLib.get_user_config_dir()) / APP_ID
+# Permite apuntar a un servidor local (ver scripts/fake_azure.py) en lugar de dev.azure.com
+AZURE_BASE_URL: str = os.environ.get("AZURE_POSTER_BASE_URL", "https://dev.azure.com")
 IGNORE_FOLDERS: set[str] = {
     'venv',
     '__pycache__',
@@ -33,4 +43,5 @@ DEFAULT_CONFIG = AppConfig(
     md_file="content.md",
     doc_config_file="config.json",
     ignore_folders=IGNORE_FOLDERS,
+    azure_base_url=AZURE_BASE_URL,
 )
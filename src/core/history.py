@@ -0,0 +1,94 @@
+from typing import List, Dict, Any
+
+import os
+import zlib
+import difflib
+import logging
+import tempfile
+import threading
+
+from src.core import constants
+from src.core.metrics import METRICS
+from src.core.workspace_index import WorkspaceIndex, hash_text
+
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectStore:
+    """Almacén direccionado por contenido: cada texto distinto se guarda una sola vez, comprimido.
+
+    El nombre del objeto es el sha256 del texto (el mismo `content_hash` del índice),
+    así que publicar de nuevo un contenido ya visto, en cualquier carpeta, no ocupa espacio.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:])
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def put(self, text: str) -> str:
+        digest = hash_text(text)
+        path = self.path(digest)
+        if os.path.exists(path):
+            return digest
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Escritura atómica: nunca queda un objeto a medio escribir con el nombre definitivo
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with METRICS.span("file_io_seconds", op="write"), os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(text.encode('utf-8'), 6))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return digest
+
+    def get(self, digest: str) -> str:
+        try:
+            with METRICS.span("file_io_seconds", op="read"), open(self.path(digest), 'rb') as f:
+                return zlib.decompress(f.read()).decode('utf-8')
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+
+class DocumentHistory:
+    """Versiones publicadas de cada carpeta: el registro vive en el índice y el contenido en el almacén."""
+
+    def __init__(self, configs: constants.AppConfig, index: WorkspaceIndex):
+        self.configs = configs
+        self.index = index
+        self._stores: Dict[str, ObjectStore] = {}
+        self._lock = threading.Lock()
+
+    def store(self, base_path: str) -> ObjectStore:
+        with self._lock:
+            if base_path not in self._stores:
+                self._stores[base_path] = ObjectStore(os.path.join(base_path, self.configs.history_dir))
+            return self._stores[base_path]
+
+    def snapshot(self, base_path: str, content: str) -> str:
+        return self.store(base_path).put(content)
+
+    def versions(self, base_path: str, folder: str) -> List[Dict[str, Any]]:
+        """Publicaciones de la carpeta (la más reciente primero) con `available` si hay contenido guardado."""
+        store = self.store(base_path)
+        return [
+            {**row, "available": bool(row["content_hash"]) and store.has(row["content_hash"])}
+            for row in self.index.publish_history(base_path, folder)
+        ]
+
+    def load(self, base_path: str, digest: str) -> str:
+        return self.store(base_path).get(digest)
+
+    @staticmethod
+    def diff(old: str, new: str, old_label: str = "publicado", new_label: str = "actual",
+             context: int = 3) -> str:
+        return "\n".join(difflib.unified_diff(
+            old.splitlines(), new.splitlines(), fromfile=old_label, tofile=new_label, n=context, lineterm="",
+        ))
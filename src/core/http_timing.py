@@ -0,0 +1,71 @@
+from typing import Dict, Any
+
+import time
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# requests no expone las fases de la conexión; las medimos en las clases de
+# conexión de urllib3 y las dejamos en un thread-local para quien hizo la petición.
+
+_phases = threading.local()
+
+
+def pop_connection_phases() -> Dict[str, float]:
+    """Devuelve y limpia las fases de conexión medidas en el hilo actual."""
+    phases = getattr(_phases, "values", {})
+    _phases.values = {}
+    return phases
+
+
+def _record_phase(name: str, seconds: float) -> None:
+    if not hasattr(_phases, "values"):
+        _phases.values = {}
+    _phases.values[name] = _phases.values.get(name, 0.0) + seconds
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._socket_seconds = time.perf_counter() - start
+            _record_phase("connect", self._socket_seconds)
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        handshake = time.perf_counter() - start - getattr(self, "_socket_seconds", 0.0)
+        if isinstance(self, HTTPSConnection):
+            _record_phase("tls", max(handshake, 0.0))
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Adapter de requests que mide conexión (DNS + TCP) y handshake TLS de cada socket nuevo."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
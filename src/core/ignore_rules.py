@@ -0,0 +1,109 @@
+from typing import Iterable, List, Tuple, Optional
+
+import os
+import re
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# Las carpetas ocultas (.git, .azure_poster, ...) nunca son documentación
+DEFAULT_PATTERNS: Tuple[str, ...] = (".*/",)
+
+
+def _translate(pattern: str) -> str:
+    """Traduce un glob estilo gitignore a una expresión regular sobre rutas relativas con `/`."""
+    parts: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            parts.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif c == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif c == "?":
+            parts.append("[^/]")
+            i += 1
+        elif c == "[" and pattern.find("]", i + 2 if pattern[i + 1:i + 2] in ("!", "]") else i + 1) != -1:
+            end = pattern.find("]", i + 2 if pattern[i + 1:i + 2] in ("!", "]") else i + 1)
+            body = pattern[i + 1:end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        elif c == "\\" and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+    return "".join(parts)
+
+
+def compile_pattern(line: str) -> Optional[Tuple[str, bool]]:
+    """Devuelve (regex, es_negación) para una línea del archivo de ignorados, o None si no aplica."""
+    line = line.rstrip("\n").rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate or line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+    # Solo se evalúan directorios, así que la barra final no cambia nada
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # Con una barra al inicio o en medio, el patrón es relativo a la raíz; si no, vale a cualquier profundidad
+    anchored = "/" in line
+    body = _translate(line.lstrip("/"))
+    return (body if anchored else f"(?:.*/)?{body}"), negate
+
+
+class IgnoreRules:
+    """Patrones estilo gitignore compilados una sola vez.
+
+    Las reglas consecutivas del mismo signo se unen en una sola regex, así que decidir
+    si se ignora un directorio cuesta una o dos búsquedas aunque haya muchos patrones.
+    Como en git, gana la última regla que coincide.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(patterns)
+        groups: List[Tuple[List[str], bool]] = []
+        for pattern in self.patterns:
+            compiled = compile_pattern(pattern)
+            if compiled is None:
+                continue
+            regex, negate = compiled
+            if groups and groups[-1][1] == negate:
+                groups[-1][0].append(regex)
+            else:
+                groups.append(([regex], negate))
+        # Se evalúan de la última a la primera: el primer grupo que coincide decide
+        self._groups = [
+            (re.compile("(?:" + "|".join(regexes) + r")\Z"), negate) for regexes, negate in reversed(groups)
+        ]
+
+    @classmethod
+    def for_workspace(cls, base_path: str, ignore_file: str, folders: Iterable[str] = ()) -> "IgnoreRules":
+        """Reglas por defecto, las carpetas de `ignore_folders` y el archivo de ignorados del espacio de trabajo."""
+        patterns: List[str] = list(DEFAULT_PATTERNS) + [f"{name}/" for name in sorted(folders)]
+        path = os.path.join(base_path, ignore_file)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                patterns.extend(f.read().splitlines())
+        return cls(patterns)
+
+    def ignored(self, relpath: str) -> bool:
+        """`relpath` es la ruta del directorio relativa a la raíz, separada por `/`."""
+        for regex, negate in self._groups:
+            if regex.match(relpath):
+                return not negate
+        return False
@@ -0,0 +1,101 @@
+from typing import Optional, List
+
+import os
+import copy
+import json
+import time
+import queue
+import logging
+import logging.handlers
+
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+MAX_BYTES = 5 * 1024 * 1024   # 5 MB
+ROTATE_INTERVAL = 24 * 60 * 60  # 1 día
+BACKUP_COUNT = 5
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rota el archivo al superar `maxBytes` o cuando pasa `interval` segundos, lo que ocurra primero."""
+
+    def __init__(self, filename: str, maxBytes: int = MAX_BYTES, interval: float = ROTATE_INTERVAL,
+                 backupCount: int = BACKUP_COUNT, encoding: Optional[str] = 'utf-8') -> None:
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self.interval = interval
+        started = os.path.getmtime(filename) if os.path.exists(filename) and os.path.getsize(filename) else time.time()
+        self.rollover_at = started + interval
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.interval and time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self.rollover_at = time.time() + self.interval
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Una línea JSON por registro, para procesar los logs con herramientas."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Registros que pasaron por `TracebackQueueHandler`: el traceback ya viene formateado
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class TracebackQueueHandler(logging.handlers.QueueHandler):
+    """Encola el registro con el traceback en `exc_text` en lugar de mezclarlo en el mensaje.
+
+    `QueueHandler.prepare` formatea el traceback dentro de `msg` y borra `exc_info`
+    (no se puede enviar entre hilos); así el formateador del listener lo sigue
+    viendo aparte y `JsonLinesFormatter` lo escribe en `exc`.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = logging.Formatter().formatException(record.exc_info)
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+
+def start_queued_logging(log_file: str, structured: bool = False,
+                         level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Configura el logger raíz para encolar registros y escribirlos desde un hilo aparte.
+
+    Los callbacks de GTK solo pagan el costo de encolar; la escritura a disco y la
+    rotación ocurren en el hilo del `QueueListener`. Hay que llamar a `stop()` al salir
+    para vaciar la cola.
+    """
+    file_handler = SizeAndTimeRotatingFileHandler(log_file)
+    file_handler.setFormatter(JsonLinesFormatter() if structured else logging.Formatter(LOG_FORMAT))
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(TracebackQueueHandler(log_queue))
+    root.setLevel(level)
+
+    handlers: List[logging.Handler] = [file_handler, stream_handler]
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
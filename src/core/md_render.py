@@ -0,0 +1,81 @@
+from typing import List
+
+import re
+import threading
+from collections import OrderedDict
+
+from src.core.metrics import METRICS
+
+
+# Construcciones que dependen de todo el documento (definiciones de referencias,
+# HTML en bloque): con ellas se renderiza completo para no cambiar el resultado.
+_GLOBAL_CONSTRUCTS = re.compile(r'^ {0,3}(\[[^\]]+\]:|<)', re.MULTILINE)
+_LIST_ITEM = re.compile(r'^ {0,3}([*+-]|\d+\.)[ \t]')
+_BLANK_LINES = re.compile(r'\n(?:[ \t]*\n)+')
+
+
+def _continues(previous: str, chunk: str) -> bool:
+    """Indica si `chunk` pertenece al mismo bloque de nivel superior que `previous`."""
+    first_line = chunk.split('\n', 1)[0]
+    if first_line[:1] in (' ', '\t'):
+        return True  # continuación indentada: lista con párrafos o bloque de código
+    if _LIST_ITEM.match(first_line) and any(_LIST_ITEM.match(line) for line in previous.split('\n')):
+        return True  # lista "suelta" separada por líneas en blanco
+    if first_line.startswith('>') and '\n>' in f"\n{previous}":
+        return True
+    return False
+
+
+def split_blocks(text: str) -> List[str]:
+    """Divide el Markdown en bloques de nivel superior separados por líneas en blanco."""
+    blocks: List[str] = []
+    text = text.replace('\r\n', '\n').strip('\n')
+    start = 0
+    separator = ""
+    # Se conserva el separador original: en un bloque de código las líneas en blanco son contenido
+    for match in [*_BLANK_LINES.finditer(text), None]:
+        end = match.start() if match else len(text)
+        chunk = text[start:end]
+        if chunk.strip():
+            if blocks and _continues(blocks[-1], chunk):
+                blocks[-1] = f"{blocks[-1]}{separator}{chunk}"
+            else:
+                blocks.append(chunk)
+        if match:
+            start, separator = match.end(), match.group()
+    return blocks
+
+
+class IncrementalRenderer:
+    """Renderiza Markdown a HTML reutilizando el HTML de los bloques que no cambiaron.
+
+    El resultado es el mismo que `markdown.markdown(text)` (lo que envía `post_to_wi`);
+    solo se vuelven a convertir los bloques tocados por la edición.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _render_block(self, block: str) -> str:
+        import markdown
+
+        with self._lock:
+            if block in self._cache:
+                self._cache.move_to_end(block)
+                return self._cache[block]
+        html = markdown.markdown(block)
+        with self._lock:
+            self._cache[block] = html
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return html
+
+    def render(self, text: str) -> str:
+        import markdown
+
+        with METRICS.span("markdown_render_seconds", mode="preview"):
+            if _GLOBAL_CONSTRUCTS.search(text):
+                return markdown.markdown(text)
+            return "\n".join(html for html in map(self._render_block, split_blocks(text)) if html)
@@ -0,0 +1,109 @@
+from typing import List, Dict, Any, Tuple, Iterator
+
+import json
+import time
+import bisect
+import threading
+import contextlib
+
+
+# Límites superiores (segundos) de los buckets de los histogramas.
+BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Histograma de latencias con buckets fijos, compatible con el formato de Prometheus."""
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Estimación del cuantil por interpolación lineal dentro del bucket."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= target and n:
+                lower = BUCKETS[i - 1] if i else 0.0
+                upper = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return lower + (upper - lower) * (target - seen) / n
+            seen += n
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], self.counts)),
+        }
+
+
+class Metrics:
+    """Registro en memoria de histogramas por nombre y etiquetas."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        key: Labels = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            self._histograms.setdefault(name, {}).setdefault(key, Histogram()).observe(seconds)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        with self._lock:
+            return {
+                name: [{"labels": dict(key), **hist.to_dict()} for key, hist in sorted(series.items())]
+                for name, series in sorted(self._histograms.items())
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=4)
+
+    def to_prometheus(self, prefix: str = "azure_poster_") -> str:
+        """Formato de texto de Prometheus (apto para el textfile collector de node_exporter)."""
+        lines: List[str] = []
+        for name, series in self.snapshot().items():
+            metric = f"{prefix}{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for item in series:
+                labels = [f'{k}="{v}"' for k, v in item["labels"].items()]
+                cumulative = 0
+                for le, n in item["buckets"].items():
+                    cumulative += n
+                    bucket_labels = ",".join(labels + [f'le="{le}"'])
+                    lines.append(f"{metric}_bucket{{{bucket_labels}}} {cumulative}")
+                suffix = f"{{{','.join(labels)}}}" if labels else ""
+                lines.append(f"{metric}_sum{suffix} {item['sum']}")
+                lines.append(f"{metric}_count{suffix} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
@@ -0,0 +1,77 @@
+from typing import List, Dict, Any, Optional
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+PROFILE_FIELDS = ("organization", "project", "pat")
+
+
+def get_profiles(global_config: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Perfiles con nombre; una config sin `profiles` (formato anterior) cuenta como un único perfil."""
+    profiles = global_config.get("profiles")
+    if profiles:
+        return profiles
+    if any(global_config.get(field) for field in PROFILE_FIELDS):
+        return {DEFAULT_PROFILE: {field: global_config.get(field, "") for field in PROFILE_FIELDS}}
+    return {}
+
+
+def default_profile(global_config: Dict[str, Any]) -> str:
+    profiles = get_profiles(global_config)
+    name = global_config.get("default_profile", DEFAULT_PROFILE)
+    if name not in profiles and profiles:
+        return next(iter(profiles))
+    return name
+
+
+def profile_names(global_config: Dict[str, Any]) -> List[str]:
+    default = default_profile(global_config)
+    return sorted(get_profiles(global_config), key=lambda name: name != default)
+
+
+def resolve(global_config: Dict[str, Any], name: Optional[str] = None) -> Dict[str, Any]:
+    """Config global con organización, proyecto y PAT del perfil pedido (o del perfil por defecto).
+
+    El resultado se pasa tal cual a `AzureClient`; la clave `profile` le indica qué
+    pool de conexiones y qué presupuesto de peticiones usar.
+    """
+    profiles = get_profiles(global_config)
+    name = name or default_profile(global_config)
+    if name not in profiles:
+        raise KeyError(f"El perfil '{name}' no existe")
+    return {**global_config, **profiles[name], "profile": name}
+
+
+def for_doc(global_config: Dict[str, Any], doc_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Perfil al que está asociada la carpeta; las carpetas sin `profile` usan el perfil por defecto."""
+    return resolve(global_config, doc_config.get("profile"))
+
+
+def save_profile(global_config: Dict[str, Any], name: str, data: Dict[str, str],
+                 make_default: bool = False) -> Dict[str, Any]:
+    """Devuelve una copia de la config con el perfil creado o actualizado.
+
+    Los campos del perfil por defecto se replican en el nivel superior para que las
+    herramientas que leen el formato anterior sigan funcionando.
+    """
+    config = dict(global_config)
+    profiles = {key: dict(value) for key, value in get_profiles(global_config).items()}
+    profiles[name] = {field: data.get(field, "") for field in PROFILE_FIELDS}
+    config["profiles"] = profiles
+    current = default_profile(global_config)
+    config["default_profile"] = name if make_default or current not in profiles else current
+    config.update(profiles[config["default_profile"]])
+    return config
+
+
+def remove_profile(global_config: Dict[str, Any], name: str) -> Dict[str, Any]:
+    config = dict(global_config)
+    profiles = {key: dict(value) for key, value in get_profiles(global_config).items() if key != name}
+    config["profiles"] = profiles
+    current = default_profile(global_config)
+    config["default_profile"] = current if current in profiles else next(iter(profiles), DEFAULT_PROFILE)
+    config.update(profiles.get(config["default_profile"], {field: "" for field in PROFILE_FIELDS}))
+    return config
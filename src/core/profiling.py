@@ -0,0 +1,212 @@
+from typing import List, Any, Callable, Iterator, Optional
+
+import io
+import os
+import sys
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import functools
+import traceback
+import contextlib
+import tracemalloc
+from pathlib import Path
+from collections import Counter
+
+
+logger = logging.getLogger(__name__)
+
+# AZURE_POSTER_PROFILE=1 activa el perfilado desde el arranque; también se puede activar desde el menú
+PROFILE_ENV = "AZURE_POSTER_PROFILE"
+STALL_ENV = "AZURE_POSTER_STALL_MS"
+STALL_THRESHOLD = 0.2
+TOP_N = 25
+
+
+def enabled_from_env() -> bool:
+    return os.environ.get(PROFILE_ENV, "").lower() not in ("", "0", "false", "no")
+
+
+def stall_threshold_from_env() -> float:
+    try:
+        return float(os.environ[STALL_ENV]) / 1000
+    except (KeyError, ValueError):
+        return STALL_THRESHOLD
+
+
+def _stamp() -> str:
+    now = time.time()
+    return time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1000) % 1000:03d}"
+
+
+class Profiler:
+    """Perfilado opcional (cProfile + tracemalloc) de las rutas lentas de la app.
+
+    Cada sección perfilada deja en `output_dir` un `.prof` (para snakeviz o pstats)
+    y un `.txt` con las funciones más costosas y las asignaciones de memoria netas.
+    Desactivado no hace nada más que revisar un booleano.
+    """
+
+    def __init__(self, output_dir: Path, enabled: bool = False, top_n: int = TOP_N):
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self.enabled = False
+        self._local = threading.local()
+        self._started_tracemalloc = False
+        if enabled:
+            self.enable()
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+        logger.info(f"Perfilado activado; resultados en {self.output_dir}")
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        logger.info("Perfilado desactivado")
+
+    @contextlib.contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Perfila el bloque; las secciones anidadas en el mismo hilo quedan dentro de la exterior."""
+        if not self.enabled or getattr(self._local, "active", False):
+            yield
+            return
+
+        before = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Desde Python 3.12 solo puede haber un cProfile activo en todo el proceso
+            logger.debug(f"Otro perfil está activo; '{name}' se ejecuta sin perfilar")
+            yield
+            return
+
+        self._local.active = True
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            self._local.active = False
+            after = tracemalloc.take_snapshot() if before is not None and tracemalloc.is_tracing() else None
+            try:
+                self._dump(name, profile, elapsed, before, after)
+            except OSError as exc:
+                logger.error(f"No se pudo guardar el perfil de '{name}': {exc}")
+
+    def _dump(self, name: str, profile: cProfile.Profile, elapsed: float,
+              before: Optional[tracemalloc.Snapshot], after: Optional[tracemalloc.Snapshot]) -> Path:
+        base = self.output_dir / f"{_stamp()}-{name}"
+        profile.dump_stats(str(base.with_suffix(".prof")))
+
+        stream = io.StringIO()
+        stream.write(f"# {name}: {elapsed * 1000:.1f} ms (hilo {threading.current_thread().name})\n\n")
+        stream.write(f"## CPU: top {self.top_n} por tiempo acumulado\n")
+        pstats.Stats(profile, stream=stream).strip_dirs().sort_stats("cumulative").print_stats(self.top_n)
+        if before is not None and after is not None:
+            stream.write(f"## Memoria: top {self.top_n} asignaciones netas\n")
+            for stat in after.compare_to(before, "lineno")[:self.top_n]:
+                stream.write(f"{stat}\n")
+            current, peak = tracemalloc.get_traced_memory()
+            stream.write(f"\nmemoria trazada: {current / 1024:.0f} KiB (pico {peak / 1024:.0f} KiB)\n")
+
+        summary = base.with_suffix(".txt")
+        summary.write_text(stream.getvalue(), encoding="utf-8")
+        logger.info(f"Perfil '{name}': {elapsed * 1000:.1f} ms -> {summary}")
+        return summary
+
+    def record_stall(self, duration: float, samples: "Counter[str]") -> Path:
+        """Guarda las pilas del hilo principal muestreadas durante un bloqueo del main loop."""
+        path = self.output_dir / f"{_stamp()}-stall.txt"
+        lines = [f"# Main loop bloqueado {duration * 1000:.0f} ms ({sum(samples.values())} muestras)\n"]
+        for stack, count in samples.most_common(self.top_n):
+            lines.append(f"\n## {count} muestras\n{stack}")
+        path.write_text("".join(lines), encoding="utf-8")
+        logger.warning(f"Main loop bloqueado {duration * 1000:.0f} ms -> {path}")
+        return path
+
+
+def profiled(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decora métodos de objetos con atributo `profiler` para perfilarlos como la sección `name`."""
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with self.profiler.section(name):
+                return fn(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class StallWatchdog:
+    """Detecta bloqueos del main loop de GTK y muestrea qué estaba ejecutando.
+
+    El main loop llama `beat()` periódicamente (GLib.timeout_add). Un hilo aparte
+    revisa el último latido; si se atrasa más que `threshold`, toma la pila del hilo
+    principal en cada intervalo. Al volver el latido se reporta el bloqueo completo.
+    """
+
+    def __init__(self, on_stall: Callable[[float, "Counter[str]"], Any], threshold: float = STALL_THRESHOLD,
+                 interval: float = 0.05, thread_id: Optional[int] = None):
+        self.on_stall = on_stall
+        self.threshold = threshold
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._samples: "Counter[str]" = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self._thread:
+            return
+        self._stop.clear()
+        self._last_beat = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def beat(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            gap, samples = now - self._last_beat, self._samples
+            self._last_beat = now
+            self._samples = Counter()
+        if samples:
+            self.on_stall(gap, samples)
+        return not self._stop.is_set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                if time.monotonic() - self._last_beat < self.threshold:
+                    continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            with self._lock:
+                self._samples[stack] += 1
@@ -0,0 +1,118 @@
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
+
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.core import azure_client, config_manager, constants, profiles, thread_sync
+from src.core.history import DocumentHistory
+from src.core.rate_limit import Throttled, retry_after
+from src.core.workspace_index import WorkspaceIndex, hash_text
+
+
+logger = logging.getLogger(__name__)
+
+
+class Publisher:
+    """Publica el contenido de una carpeta de documentación en su PR y su Work Item."""
+
+    def __init__(self, configs: constants.AppConfig, azure: azure_client.AzureClient,
+                 sync: thread_sync.ThreadSync, index: Optional[WorkspaceIndex] = None,
+                 history: Optional[DocumentHistory] = None):
+        self.configs = configs
+        self.azure = azure
+        self.sync = sync
+        self.index = index
+        self.history = history
+
+    def folder_path(self, base_path: str, folder: str) -> str:
+        return os.path.join(base_path, folder)
+
+    def read_content(self, folder_path: str) -> str:
+        md_path = os.path.join(folder_path, self.configs.md_file)
+        if not os.path.exists(md_path):
+            return ""
+        with open(md_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def publish(self, global_config: Dict[str, Any], base_path: str, folder: str,
+                content: Optional[str] = None) -> Tuple[Any, Any]:
+        """Envía el comentario al PR y el historial al Work Item; devuelve ambas respuestas.
+
+        Si no se pasa `content` se usa el Markdown guardado en disco.
+        """
+        folder_path = self.folder_path(base_path, folder)
+        doc_config = config_manager.ConfigManager.load_json(
+            os.path.join(folder_path, self.configs.doc_config_file)
+        )
+        if content is None:
+            content = self.read_content(folder_path)
+
+        # Se guarda antes de enviar: si la publicación sale mal, la versión queda para restaurarla
+        if self.history:
+            try:
+                self.history.snapshot(base_path, content)
+            except OSError as exc:
+                logger.warning(f"No se pudo guardar la versión en el historial: {exc}")
+
+        profile_config = profiles.for_doc(global_config, doc_config)
+        r1 = r2 = None
+        try:
+            r1 = self.azure.post_to_pr(profile_config, doc_config, content)
+            if r1.ok and r1.json().get("id"):
+                self.sync.register_thread(folder_path, r1.json()["id"])
+            # Si Azure limitó el PR no se insiste con el Work Item: la carpeta queda pendiente
+            delay = retry_after(r1.status_code, r1.headers)
+            if not r1.ok and delay is not None:
+                raise Throttled(self.azure.profile_key(profile_config), delay)
+            r2 = self.azure.post_to_wi(profile_config, doc_config, content)
+        finally:
+            # También se registra si el envío lanza (red, timeout): la versión aparece en el historial sin estado
+            if self.index:
+                self.index.record_publish(
+                    base_path, folder, hash_text(content),
+                    r1.status_code if r1 is not None else None, r2.status_code if r2 is not None else None,
+                )
+        return r1, r2
+
+    def publish_many(self, global_config: Dict[str, Any], base_path: str, folders: List[str],
+                     workers_per_profile: int = 4,
+                     on_result: Optional[Callable[[str, Union[Tuple[Any, Any], Exception]], None]] = None
+                     ) -> Dict[str, Union[Tuple[Any, Any], Exception]]:
+        """Publica varias carpetas a la vez; cada perfil tiene sus propios hilos.
+
+        Si Azure limita a una organización, solo se quedan esperando los hilos de ese
+        perfil y las demás organizaciones siguen publicando. Las carpetas que fallan
+        devuelven la excepción en lugar de las respuestas.
+        """
+        groups: Dict[str, List[str]] = {}
+        for folder in folders:
+            doc_config = config_manager.ConfigManager.load_json(
+                os.path.join(self.folder_path(base_path, folder), self.configs.doc_config_file)
+            )
+            name = doc_config.get("profile") or profiles.default_profile(global_config)
+            groups.setdefault(name, []).append(folder)
+
+        results: Dict[str, Union[Tuple[Any, Any], Exception]] = {}
+        pools = {
+            name: ThreadPoolExecutor(max_workers=min(workers_per_profile, len(group)), thread_name_prefix=f"publish-{name}")
+            for name, group in groups.items()
+        }
+        try:
+            futures = {
+                pools[name].submit(self.publish, global_config, base_path, folder): folder
+                for name, group in groups.items() for folder in group
+            }
+            for future in as_completed(futures):
+                folder = futures[future]
+                try:
+                    results[folder] = future.result()
+                except Exception as exc:
+                    logger.error(f"No se pudo publicar '{folder}': {exc}")
+                    results[folder] = exc
+                if on_result:
+                    on_result(folder, results[folder])
+        finally:
+            for pool in pools.values():
+                pool.shutdown()
+        return results
@@ -0,0 +1,87 @@
+from typing import Any, Callable, Mapping, Optional
+
+import time
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+
+
+logger = logging.getLogger(__name__)
+
+THROTTLED_STATUSES = (429, 503)
+
+
+def retry_after(status_code: Any, headers: Mapping[str, str]) -> Optional[float]:
+    """Segundos que Azure pide esperar, o None si la respuesta no es un aviso de límite.
+
+    Azure DevOps envía `Retry-After` en los 429/503 y también cuando
+    `X-RateLimit-Remaining` llega a 0 aunque la petición haya pasado.
+    """
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    if status_code not in THROTTLED_STATUSES and headers.get("X-RateLimit-Remaining") != "0":
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class Throttled(Exception):
+    """Azure pidió esperar más de lo que vale la pena bloquear un hilo; se falla de inmediato."""
+
+    def __init__(self, name: str, seconds: float):
+        self.name = name
+        self.seconds = seconds
+        self.until = time.time() + seconds
+        until = time.strftime("%H:%M:%S", time.localtime(self.until))
+        super().__init__(f"Perfil '{name}' limitado por Azure hasta las {until} ({seconds:.0f}s)")
+
+
+class RateBudget:
+    """Presupuesto de peticiones de un perfil: concurrencia máxima y pausa pedida por Azure.
+
+    Cada perfil tiene el suyo, así que el throttling de una organización solo
+    frena los hilos que le hablan a esa organización.
+    """
+
+    def __init__(self, name: str, max_concurrency: int = 4, max_wait: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.name = name
+        self.max_wait = max_wait
+        self.clock = clock
+        self.sleep = sleep
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self.clock() + seconds)
+        logger.warning(f"Perfil '{self.name}' limitado por Azure: pausa de {seconds:.1f}s")
+
+    def remaining_pause(self) -> float:
+        with self._lock:
+            return max(self._blocked_until - self.clock(), 0.0)
+
+    def __enter__(self) -> float:
+        """Espera la pausa vigente y un turno libre; devuelve los segundos esperados por la pausa.
+
+        Si la pausa supera `max_wait` lanza `Throttled` en lugar de dormir.
+        """
+        waited = 0.0
+        while (delay := self.remaining_pause()) > 0:
+            if self.max_wait is not None and delay > self.max_wait:
+                raise Throttled(self.name, delay)
+            self.sleep(delay)
+            waited += delay
+        self._slots.acquire()
+        return waited
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._slots.release()
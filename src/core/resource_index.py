@@ -0,0 +1,116 @@
+from typing import List, Dict, Any, Callable, Optional
+
+import threading
+import logging
+from datetime import date, timedelta
+
+from src.core import azure_client, config_manager, constants
+
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("repositories", "pull_requests", "work_items")
+
+# Ventana inicial de work items cuando aún no hay cursor guardado.
+WORK_ITEMS_WINDOW_DAYS = 30
+
+
+class ResourceIndex:
+    """Índice local de repositorios, PRs activos y work items recientes de un proyecto."""
+
+    def __init__(self, configs: constants.AppConfig, azure: azure_client.AzureClient):
+        self.path = configs.config_dir / configs.resource_index_file
+        self.azure = azure
+        self._lock = threading.Lock()
+        self._data: Dict[str, Any] = {}
+
+    @staticmethod
+    def scope(global_config: Dict[str, str]) -> str:
+        return f"{global_config.get('organization', '')}/{global_config.get('project', '')}"
+
+    @staticmethod
+    def _entry(kind: str, item: Dict[str, Any]) -> Dict[str, str]:
+        if kind == "repositories":
+            return {"id": item["name"], "label": item["name"]}
+        if kind == "pull_requests":
+            repository = item.get("repository") or {}
+            return {
+                "id": str(item["pullRequestId"]),
+                "label": f"{item['pullRequestId']} — {item.get('title', '')}",
+                "repository": repository.get("name", ""),
+                "repository_id": repository.get("id", ""),
+            }
+        fields = item.get("fields", {})
+        return {"id": str(item["id"]), "label": f"{item['id']} — {fields.get('System.Title', '')}"}
+
+    def load(self) -> None:
+        data = config_manager.ConfigManager.load_json(str(self.path))
+        with self._lock:
+            self._data = data
+
+    def _bucket(self, scope: str) -> Dict[str, Any]:
+        bucket = self._data.setdefault(scope, {})
+        for kind in KINDS:
+            bucket.setdefault(kind, {})
+        return bucket
+
+    @staticmethod
+    def in_repository(entries: List[Dict[str, str]], repository: Optional[str]) -> List[Dict[str, str]]:
+        """PRs del repositorio indicado (por nombre o id, sin distinguir mayúsculas); sin repositorio, todos."""
+        wanted = (repository or "").strip().lower()
+        if not wanted:
+            return entries
+        return [e for e in entries if wanted in (e.get("repository", "").lower(), e.get("repository_id", "").lower())]
+
+    def entries(self, global_config: Dict[str, str], kind: str,
+                repository: Optional[str] = None) -> List[Dict[str, str]]:
+        """Entradas en caché de un tipo, sin tocar la red; los PRs se pueden limitar a un repositorio."""
+        with self._lock:
+            entries = list(self._bucket(self.scope(global_config))[kind].values())
+        return self.in_repository(entries, repository) if kind == "pull_requests" else entries
+
+    def lookup(self, global_config: Dict[str, str], kind: str, text: str, limit: int = 20,
+               repository: Optional[str] = None) -> List[Dict[str, str]]:
+        """Coincidencias por subcadena (sin distinguir mayúsculas) sobre id y título."""
+        needle = text.strip().lower()
+        matches = [e for e in self.entries(global_config, kind, repository) if needle in e["label"].lower()]
+        return matches[:limit]
+
+    def refresh(self, global_config: Dict[str, str],
+                on_page: Optional[Callable[[str, List[Dict[str, str]]], None]] = None) -> None:
+        """Actualiza el índice desde Azure entregando cada página a `on_page` apenas llega.
+
+        Repositorios y PRs activos se reemplazan completos (los cerrados desaparecen);
+        los work items se piden solo desde el último cursor y se fusionan.
+        """
+        scope = self.scope(global_config)
+        with self._lock:
+            cursor: str = self._bucket(scope).get("work_items_cursor") or str(
+                date.today() - timedelta(days=WORK_ITEMS_WINDOW_DAYS)
+            )
+
+        sources = {
+            "repositories": self.azure.list_repositories(global_config),
+            "pull_requests": self.azure.list_pull_requests(global_config),
+            "work_items": self.azure.list_work_items(global_config, changed_since=cursor),
+        }
+        for kind, pages in sources.items():
+            seen: Dict[str, Dict[str, str]] = {}
+            for page in pages:
+                entries = [self._entry(kind, item) for item in page]
+                with self._lock:
+                    bucket = self._bucket(scope)[kind]
+                    for entry in entries:
+                        bucket[entry["id"]] = entry
+                        seen[entry["id"]] = entry
+                if on_page and entries:
+                    on_page(kind, entries)
+            if kind != "work_items":
+                with self._lock:
+                    self._bucket(scope)[kind] = seen
+
+        with self._lock:
+            self._bucket(scope)["work_items_cursor"] = str(date.today())
+            snapshot = dict(self._data)
+        config_manager.ConfigManager.save_json(str(self.path), snapshot)
+        logger.info(f"Índice de recursos actualizado para {scope}")
@@ -0,0 +1,40 @@
+from typing import List, Tuple
+
+import time
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Marca hitos del arranque (imports, activación, primer frame) relativos al inicio del proceso."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.reported = False
+
+    def mark(self, name: str) -> float:
+        elapsed = time.perf_counter() - self.started
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def summary(self) -> str:
+        parts: List[str] = []
+        previous = 0.0
+        for name, elapsed in self.marks:
+            parts.append(f"{name}={elapsed * 1000:.0f}ms (+{(elapsed - previous) * 1000:.0f})")
+            previous = elapsed
+        return ", ".join(parts)
+
+    def report(self) -> None:
+        """Registra el desglose una sola vez (al pintar el primer frame)."""
+        if self.reported:
+            return
+        self.reported = True
+        logger.info(f"Arranque: {self.summary()}")
+
+
+# Se crea al importar el módulo; `src.main` lo importa antes que todo lo demás.
+TIMER = StartupTimer()
@@ -0,0 +1,111 @@
+from typing import List, Dict, Any, Optional
+
+import os
+import re
+import json
+import logging
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core import azure_client, config_manager, constants, profiles
+
+
+logger = logging.getLogger(__name__)
+
+_FRACTION = re.compile(r'\.(\d+)')
+
+
+def parse_azure_date(value: Optional[str]) -> datetime:
+    """Convierte las fechas ISO de Azure (con 'Z' y hasta 7 decimales) a datetime."""
+    if not value:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    normalized = value.replace('Z', '+00:00')
+    normalized = _FRACTION.sub(lambda m: '.' + m.group(1)[:6].ljust(6, '0'), normalized, count=1)
+    parsed = datetime.fromisoformat(normalized)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class ThreadSync:
+    """Trae de forma incremental las respuestas de los hilos de PR hacia cada carpeta."""
+
+    def __init__(self, configs: constants.AppConfig, azure: azure_client.AzureClient, max_workers: int = 8):
+        self.configs = configs
+        self.azure = azure
+        self.max_workers = max_workers
+
+    def _state_path(self, folder_path: str) -> str:
+        return os.path.join(folder_path, self.configs.sync_state_file)
+
+    def register_thread(self, folder_path: str, thread_id: int) -> None:
+        """Recuerda el hilo creado por `post_to_pr` para sincronizar solo sus respuestas."""
+        state = config_manager.ConfigManager.load_json(self._state_path(folder_path))
+        thread_ids: List[int] = state.get("thread_ids", [])
+        if thread_id not in thread_ids:
+            thread_ids.append(thread_id)
+        state["thread_ids"] = thread_ids
+        config_manager.ConfigManager.save_json(self._state_path(folder_path), state)
+
+    @staticmethod
+    def _is_user_thread(thread: Dict[str, Any]) -> bool:
+        comments = thread.get("comments", [])
+        return bool(comments) and comments[0].get("commentType") != "system"
+
+    def sync_folder(self, global_config: Dict[str, str], folder_path: str) -> int:
+        """Agrega al archivo de respuestas los comentarios cambiados desde el último cursor."""
+        doc_config = config_manager.ConfigManager.load_json(
+            os.path.join(folder_path, self.configs.doc_config_file)
+        )
+        if not doc_config.get("repository_id") or not doc_config.get("pull_request_id"):
+            return 0
+
+        state = config_manager.ConfigManager.load_json(self._state_path(folder_path))
+        cursor_raw: Optional[str] = state.get("cursor")
+        cursor = parse_azure_date(cursor_raw)
+        tracked = set(state.get("thread_ids", []))
+
+        new_cursor = cursor
+        new_cursor_raw = cursor_raw
+        lines: List[str] = []
+        for thread in self.azure.get_pr_threads(profiles.for_doc(global_config, doc_config), doc_config):
+            if tracked and thread.get("id") not in tracked:
+                continue
+            if not tracked and not self._is_user_thread(thread):
+                continue
+            if parse_azure_date(thread.get("lastUpdatedDate")) <= cursor:
+                continue
+
+            for comment in thread.get("comments", []):
+                updated_raw = comment.get("lastUpdatedDate") or comment.get("publishedDate")
+                updated = parse_azure_date(updated_raw)
+                if updated <= cursor:
+                    continue
+                if updated > new_cursor:
+                    new_cursor, new_cursor_raw = updated, updated_raw
+                lines.append(json.dumps({
+                    "thread": thread.get("id"),
+                    "comment": comment.get("id"),
+                    "author": comment.get("author", {}).get("displayName", ""),
+                    "updated": updated_raw,
+                    "deleted": comment.get("isDeleted", False),
+                    "content": comment.get("content", ""),
+                }, ensure_ascii=False, separators=(',', ':')))
+
+        if lines:
+            with open(os.path.join(folder_path, self.configs.replies_file), 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+        if new_cursor_raw != cursor_raw:
+            state["cursor"] = new_cursor_raw
+            config_manager.ConfigManager.save_json(self._state_path(folder_path), state)
+        return len(lines)
+
+    def sync_all(self, global_config: Dict[str, str], base_path: str, folders: List[str]) -> Dict[str, int]:
+        """Sincroniza varias carpetas en paralelo; las que fallan se registran y devuelven -1."""
+        def task(folder: str) -> int:
+            try:
+                return self.sync_folder(global_config, os.path.join(base_path, folder))
+            except Exception as exc:
+                logger.error(f"No se pudo sincronizar '{folder}': {exc}")
+                return -1
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(folders, pool.map(task, folders)))
@@ -0,0 +1,273 @@
+from typing import List, Dict, Callable, Optional, Set
+
+import os
+import time
+import hashlib
+import logging
+import threading
+
+from gi.repository import Gio, GLib
+
+from src.core import constants
+
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE_MS = 1500
+MIN_INTERVAL = 60.0
+
+WATCHED_EVENTS = {
+    Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+    Gio.FileMonitorEvent.CREATED,
+    Gio.FileMonitorEvent.MOVED_IN,
+    Gio.FileMonitorEvent.RENAMED,
+}
+
+
+def content_hash(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_hash(text: str) -> str:
+    """Mismo hash que `content_hash` para el texto que se va a escribir en UTF-8."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class PublishThrottle:
+    """Decide si una carpeta cambiada se publica ya, luego o nunca (contenido idéntico)."""
+
+    def __init__(self, min_interval: float = MIN_INTERVAL, clock: Callable[[], float] = time.monotonic):
+        self.min_interval = min_interval
+        self.clock = clock
+        self.last_hash: Dict[str, Optional[str]] = {}
+        self.last_time: Dict[str, float] = {}
+
+    def remember(self, folder: str, digest: Optional[str]) -> None:
+        """Registra el contenido actual como ya publicado, sin contar para el intervalo."""
+        self.last_hash[folder] = digest
+
+    def mark_published(self, folder: str, digest: Optional[str]) -> None:
+        self.last_hash[folder] = digest
+        self.last_time[folder] = self.clock()
+
+    def mark_attempt(self, folder: str) -> None:
+        """Un intento fallido cuenta para el intervalo pero deja el contenido pendiente."""
+        self.last_time[folder] = self.clock()
+
+    def decide(self, folder: str, digest: Optional[str]) -> Optional[float]:
+        """None si no hay cambios; 0 si se debe publicar ya; si no, segundos a esperar."""
+        if digest is None or digest == self.last_hash.get(folder):
+            return None
+        elapsed = self.clock() - self.last_time.get(folder, float("-inf"))
+        return max(self.min_interval - elapsed, 0.0)
+
+
+class FolderWatcher:
+    """Vigila `content.md` de cada carpeta y agrupa ráfagas de eventos antes de publicar."""
+
+    def __init__(self, configs: constants.AppConfig, on_publish: Callable[[str], None],
+                 list_folders: Callable[[str], List[str]], debounce_ms: int = DEBOUNCE_MS,
+                 min_interval: float = MIN_INTERVAL):
+        self.configs = configs
+        self.on_publish = on_publish
+        self.list_folders = list_folders
+        self.debounce_ms = debounce_ms
+        self.throttle = PublishThrottle(min_interval)
+        self.base_path: Optional[str] = None
+        self._monitors: Dict[str, Gio.FileMonitor] = {}
+        self._tree_monitors: Dict[str, Gio.FileMonitor] = {}
+        self._pending: Set[str] = set()
+        # Carpetas con una publicación automática en curso y el hash que se está publicando
+        self._publishing: Dict[str, Optional[str]] = {}
+        self._timeout_id: Optional[int] = None
+        self._sync_timeout_id: Optional[int] = None
+        # El recorrido del disco corre en un hilo; `stop()` cambia la generación para descartar resultados viejos
+        self._generation = 0
+        self._scanning = False
+        self._rescan = False
+
+    @property
+    def running(self) -> bool:
+        return self.base_path is not None
+
+    def _md_path(self, folder: str) -> str:
+        return os.path.join(self.base_path, folder, self.configs.md_file)
+
+    def start(self, base_path: str) -> None:
+        self.stop()
+        self.base_path = base_path
+        self._request_sync()
+        logger.info(f"Modo vigilancia activo en {base_path}")
+
+    def stop(self) -> None:
+        for monitor in [*self._monitors.values(), *self._tree_monitors.values()]:
+            monitor.cancel()
+        self._monitors.clear()
+        self._tree_monitors.clear()
+        self._pending.clear()
+        self._publishing.clear()
+        for source_id in (self._timeout_id, self._sync_timeout_id):
+            if source_id is not None:
+                GLib.source_remove(source_id)
+        self._timeout_id = self._sync_timeout_id = None
+        self._generation += 1
+        self._scanning = self._rescan = False
+        self.base_path = None
+
+    def _monitor(self, relpath: str) -> Gio.FileMonitor:
+        path = os.path.join(self.base_path, relpath)
+        return Gio.File.new_for_path(path).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+
+    def _request_sync(self) -> None:
+        """Recorre el disco en un hilo (no en el main loop) y aplica el resultado con `GLib.idle_add`.
+
+        Si llega otro pedido mientras se recorre, se repite una vez al terminar.
+        """
+        if self._scanning:
+            self._rescan = True
+            return
+        self._scanning = True
+        generation, base_path, known = self._generation, self.base_path, set(self._monitors)
+
+        def thread_target():
+            folders: Optional[List[str]] = None
+            digests: Dict[str, Optional[str]] = {}
+            try:
+                folders = self.list_folders(base_path)
+                digests = {
+                    folder: content_hash(os.path.join(base_path, folder, self.configs.md_file))
+                    for folder in folders if folder not in known
+                }
+            except Exception as exc:
+                logger.error(f"No se pudieron recorrer las carpetas de {base_path}: {exc}")
+            GLib.idle_add(self._apply_sync, generation, folders, digests)
+
+        threading.Thread(target=thread_target, name="watcher-scan", daemon=True).start()
+
+    def _apply_sync(self, generation: int, folders: Optional[List[str]], digests: Dict[str, Optional[str]]) -> bool:
+        if generation != self._generation:
+            return GLib.SOURCE_REMOVE
+        self._scanning = False
+        # Si el recorrido falló se conservan los monitores actuales
+        if folders is not None:
+            self._sync_monitors(set(folders), digests)
+        if self._rescan:
+            self._rescan = False
+            self._request_sync()
+        return GLib.SOURCE_REMOVE
+
+    def _sync_monitors(self, folders: Set[str], digests: Dict[str, Optional[str]]) -> None:
+        """Agrega monitores para carpetas nuevas y quita los de carpetas que ya no existen.
+
+        Además de cada carpeta de documentación se vigilan la raíz y los directorios
+        intermedios (equipo/sprint), donde aparecen las carpetas nuevas.
+        """
+        tree = {""} | {os.path.dirname(folder) for folder in folders}
+        tree |= {parent for relpath in tree for parent in self._ancestors(relpath)}
+        for relpath in set(self._tree_monitors) - tree:
+            self._tree_monitors.pop(relpath).cancel()
+        for relpath in tree - set(self._tree_monitors):
+            monitor = self._monitor(relpath)
+            monitor.connect("changed", lambda *args: self._schedule_sync())
+            self._tree_monitors[relpath] = monitor
+
+        for folder in set(self._monitors) - folders:
+            self._monitors.pop(folder).cancel()
+        for folder in folders - set(self._monitors):
+            monitor = self._monitor(folder)
+            monitor.connect("changed", self._on_event, folder)
+            self._monitors[folder] = monitor
+            digest = digests[folder] if folder in digests else content_hash(self._md_path(folder))
+            self.throttle.remember(folder, digest)
+        logger.debug(f"Vigilancia: {len(self._monitors)} carpetas, {len(self._tree_monitors)} directorios")
+
+    def _schedule_sync(self) -> None:
+        """Agrupa los cambios de estructura: crear una carpeta y su config.json llega como varios eventos."""
+        if self._sync_timeout_id is not None:
+            GLib.source_remove(self._sync_timeout_id)
+        self._sync_timeout_id = GLib.timeout_add(self.debounce_ms, self._flush_sync)
+
+    def _flush_sync(self) -> bool:
+        self._sync_timeout_id = None
+        self._request_sync()
+        return GLib.SOURCE_REMOVE
+
+    @staticmethod
+    def _ancestors(relpath: str) -> List[str]:
+        parents: List[str] = []
+        while relpath:
+            relpath = os.path.dirname(relpath)
+            parents.append(relpath)
+        return parents
+
+    def expect_write(self, base_path: str, folder: str, text: str) -> None:
+        """Registra el contenido que la app está por escribir para que su propio evento no se publique.
+
+        Solo se publican automáticamente las ediciones hechas fuera de la app; lo que
+        se guarda con "Guardar", "Restaurar" o antes de "Ejecutar" no dispara nada.
+        """
+        if self.running and os.path.abspath(base_path) == os.path.abspath(self.base_path):
+            self.throttle.remember(folder, text_hash(text))
+
+    def mark_published(self, folder: str, content: Optional[str] = None) -> None:
+        """Avisa que la carpeta se publicó con éxito, automáticamente o por otra vía (Ejecutar, `--publish`)."""
+        if not self.running:
+            return
+        digest = self._publishing.pop(folder, None)
+        if content is not None:
+            digest = text_hash(content)
+        elif digest is None:
+            digest = content_hash(self._md_path(folder))
+        self.throttle.mark_published(folder, digest)
+
+    def publish_failed(self, folder: str) -> None:
+        """Si falló una publicación automática, se reintenta cuando se cumpla el intervalo mínimo."""
+        if not self.running or folder not in self._publishing:
+            return
+        del self._publishing[folder]
+        self.throttle.mark_attempt(folder)
+        self._pending.add(folder)
+        self._schedule(int(self.throttle.min_interval * 1000) + 1)
+
+    def _on_event(self, monitor: Gio.FileMonitor, file: Gio.File, other: Optional[Gio.File],
+                  event: Gio.FileMonitorEvent, folder: str) -> None:
+        names = {f.get_basename() for f in (file, other) if f is not None}
+        if event in WATCHED_EVENTS and self.configs.md_file in names:
+            self._pending.add(folder)
+            self._schedule(self.debounce_ms)
+
+    def _schedule(self, delay_ms: int) -> None:
+        if self._timeout_id is not None:
+            GLib.source_remove(self._timeout_id)
+        self._timeout_id = GLib.timeout_add(delay_ms, self._flush)
+
+    def _flush(self) -> bool:
+        self._timeout_id = None
+        waiting: Dict[str, float] = {}
+        for folder in sorted(self._pending):
+            if folder in self._publishing:
+                # Se vuelve a revisar cuando termine la publicación en curso
+                waiting[folder] = self.debounce_ms / 1000
+                continue
+            digest = content_hash(self._md_path(folder))
+            wait = self.throttle.decide(folder, digest)
+            if wait is None:
+                continue
+            if wait > 0:
+                waiting[folder] = wait
+                continue
+            logger.info(f"Cambio detectado en '{folder}', publicando automáticamente")
+            # Se marca como publicada recién cuando la app confirma el éxito (`mark_published`)
+            self._publishing[folder] = digest
+            self.on_publish(folder)
+
+        self._pending = set(waiting)
+        if waiting:
+            self._schedule(int(min(waiting.values()) * 1000) + 1)
+        return GLib.SOURCE_REMOVE
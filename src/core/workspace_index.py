@@ -0,0 +1,201 @@
+from typing import List, Dict, Any, Optional
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+
+from src.core.metrics import METRICS
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS folders (
+    base_path TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    repository_id TEXT,
+    pull_request_id TEXT,
+    work_item_id TEXT,
+    content_hash TEXT,
+    mtime REAL,
+    config_mtime REAL,
+    last_published REAL,
+    PRIMARY KEY (base_path, folder)
+);
+CREATE INDEX IF NOT EXISTS folders_by_pr ON folders (base_path, pull_request_id);
+CREATE INDEX IF NOT EXISTS folders_by_wi ON folders (base_path, work_item_id);
+CREATE INDEX IF NOT EXISTS folders_by_mtime ON folders (base_path, mtime);
+CREATE INDEX IF NOT EXISTS folders_by_published ON folders (base_path, last_published);
+
+CREATE TABLE IF NOT EXISTS publishes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    base_path TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    published_at REAL NOT NULL,
+    content_hash TEXT,
+    pr_status INTEGER,
+    wi_status INTEGER
+);
+CREATE INDEX IF NOT EXISTS publishes_by_folder ON publishes (base_path, folder, published_at);
+"""
+
+ORDERS = {
+    "name": "folder COLLATE NOCASE ASC",
+    "mtime": "mtime DESC, folder COLLATE NOCASE ASC",
+    "published": "last_published DESC, folder COLLATE NOCASE ASC",
+}
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+class WorkspaceIndex:
+    """Índice SQLite con la metadata de cada carpeta de documentación y su historial de publicaciones."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    # --- Escrituras ---
+
+    def upsert_folder(self, base_path: str, folder: str, doc_config: Optional[Dict[str, Any]] = None,
+                      content_hash: Optional[str] = None, mtime: Optional[float] = None,
+                      config_mtime: Optional[float] = None) -> None:
+        """Crea o actualiza la fila de la carpeta; los valores `None` conservan lo que ya había."""
+        doc_config = doc_config or {}
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO folders (base_path, folder, repository_id, pull_request_id, work_item_id,
+                                     content_hash, mtime, config_mtime)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (base_path, folder) DO UPDATE SET
+                    repository_id = COALESCE(excluded.repository_id, repository_id),
+                    pull_request_id = COALESCE(excluded.pull_request_id, pull_request_id),
+                    work_item_id = COALESCE(excluded.work_item_id, work_item_id),
+                    content_hash = COALESCE(excluded.content_hash, content_hash),
+                    mtime = COALESCE(excluded.mtime, mtime),
+                    config_mtime = COALESCE(excluded.config_mtime, config_mtime)
+                """,
+                (base_path, folder, doc_config.get("repository_id"), doc_config.get("pull_request_id"),
+                 doc_config.get("work_item_id"), content_hash, mtime, config_mtime),
+            )
+
+    def record_publish(self, base_path: str, folder: str, content_hash: str,
+                       pr_status: Optional[int], wi_status: Optional[int],
+                       published_at: Optional[float] = None) -> None:
+        """Registra un intento de publicación; un estado `None` indica que el envío no obtuvo respuesta."""
+        published_at = published_at or time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO publishes (base_path, folder, published_at, content_hash, pr_status, wi_status) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (base_path, folder, published_at, content_hash, pr_status, wi_status),
+            )
+            if 200 <= (pr_status or 0) < 300 and 200 <= (wi_status or 0) < 300:
+                self._conn.execute(
+                    "UPDATE folders SET last_published = ? WHERE base_path = ? AND folder = ?",
+                    (published_at, base_path, folder),
+                )
+
+    def remove_folders(self, base_path: str, folders: List[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM folders WHERE base_path = ? AND folder = ?", [(base_path, f) for f in folders]
+            )
+
+    def reconcile(self, base_path: str, folders: List[str], md_file: str, doc_config_file: str) -> int:
+        """Sincroniza el índice con el disco leyendo solo las carpetas cuyo mtime cambió.
+
+        Devuelve la cantidad de carpetas que tuvieron que releerse.
+        """
+        with METRICS.span("index_reconcile_seconds"):
+            known = {row["folder"]: row for row in self._query(
+                "SELECT folder, mtime, config_mtime FROM folders WHERE base_path = ?", (base_path,)
+            )}
+            present = set(folders)
+            self.remove_folders(base_path, [f for f in known if f not in present])
+
+            changed = 0
+            for folder in folders:
+                folder_path = os.path.join(base_path, folder)
+                md_path = os.path.join(folder_path, md_file)
+                config_path = os.path.join(folder_path, doc_config_file)
+                mtime, config_mtime = _mtime(md_path), _mtime(config_path)
+                row = known.get(folder)
+                if row and row["mtime"] == mtime and row["config_mtime"] == config_mtime:
+                    continue
+
+                changed += 1
+                content_hash = None
+                doc_config: Dict[str, Any] = {}
+                try:
+                    if mtime is not None and (not row or row["mtime"] != mtime):
+                        with open(md_path, 'r', encoding='utf-8') as f:
+                            content_hash = hash_text(f.read())
+                    if config_mtime is not None:
+                        with open(config_path, 'r', encoding='utf-8') as f:
+                            doc_config = json.load(f)
+                except (ValueError, OSError) as exc:
+                    # La carpeta sigue en la lista; sin mtimes nuevos se vuelve a leer en la próxima pasada
+                    logger.warning(f"No se pudo indexar '{folder}' en {base_path}: {exc}")
+                    self.upsert_folder(base_path, folder)
+                    continue
+                self.upsert_folder(base_path, folder, doc_config, content_hash, mtime, config_mtime)
+        if changed:
+            logger.info(f"Índice del espacio de trabajo: {changed} carpetas actualizadas en {base_path}")
+        return changed
+
+    # --- Consultas ---
+
+    def has_folders(self, base_path: str) -> bool:
+        return bool(self._query("SELECT 1 FROM folders WHERE base_path = ? LIMIT 1", (base_path,)))
+
+    def get_folder(self, base_path: str, folder: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT * FROM folders WHERE base_path = ? AND folder = ?", (base_path, folder))
+        return rows[0] if rows else None
+
+    def list_folders(self, base_path: str, order: str = "name", unpublished_only: bool = False) -> List[str]:
+        where = " AND last_published IS NULL" if unpublished_only else ""
+        rows = self._query(
+            f"SELECT folder FROM folders WHERE base_path = ?{where} ORDER BY {ORDERS[order]}", (base_path,)
+        )
+        return [row["folder"] for row in rows]
+
+    def folders_for_pr(self, base_path: str, pull_request_id: str) -> List[str]:
+        rows = self._query(
+            "SELECT folder FROM folders WHERE base_path = ? AND pull_request_id = ? ORDER BY folder",
+            (base_path, str(pull_request_id)),
+        )
+        return [row["folder"] for row in rows]
+
+    def publish_history(self, base_path: str, folder: str) -> List[Dict[str, Any]]:
+        return self._query(
+            "SELECT * FROM publishes WHERE base_path = ? AND folder = ? ORDER BY published_at DESC, id DESC",
+            (base_path, folder),
+        )
@@ -1,22 +1,22 @@
 import os
 import sys
+import atexit
 import logging
 import pathlib
 
-from src.core import constants
+from src.core.startup import TIMER
+from src.core import constants, log_handlers
+TIMER.mark("import_core")
 from src.ui import app as gnome_app
+TIMER.mark("import_ui")
 
 
 def setup_logging(config_path: pathlib.Path):
     log_file = config_path.parent / "app.log"
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(),
-        ]
-    )
+    # AZURE_POSTER_LOG_FORMAT=json escribe el log como JSON lines
+    structured = os.environ.get("AZURE_POSTER_LOG_FORMAT", "").lower() == "json"
+    listener = log_handlers.start_queued_logging(str(log_file), structured=structured)
+    atexit.register(listener.stop)
     logging.info("--- Iniciando Azure Docs Creator ---")
 
 
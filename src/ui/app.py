@@ -4,22 +4,66 @@ import gi
 import os
 import logging
 
-from src.core import azure_client, config_manager, constants
+from src.core import azure_client, config_manager, constants, history, md_render, profiles, profiling, publisher, resource_index, thread_sync, watcher, workspace_index
+from src.core.metrics import METRICS
+from src.core.startup import TIMER
 
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, Gio, Gdk, GLib
+from gi.repository import Gtk, Adw, Gio, Gdk, GLib, GObject
 
 
 logger = logging.getLogger(__name__)
 
+PREVIEW_DEBOUNCE_MS = 250
+PREVIEW_STYLE = (
+    "<style>body{font-family:sans-serif;margin:16px;line-height:1.5}"
+    "@media (prefers-color-scheme: dark){body{background:#1e1e1e;color:#ddd}a{color:#78aeed}}"
+    "pre,code{background:rgba(127,127,127,.15)}</style>"
+)
+
 
 class AzureDevOpsApp(Adw.Application):
     def __init__(self, configs: constants.AppConfig) -> None:
-        super().__init__(application_id=configs.app_id, flags=Gio.ApplicationFlags.FLAGS_NONE)
+        # HANDLES_COMMAND_LINE: si ya hay una instancia corriendo, GApplication le reenvía
+        # los argumentos por D-Bus y el comando se ejecuta allí (conexiones y cachés ya calientes).
+        super().__init__(application_id=configs.app_id, flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE)
+        self.add_main_option("open", ord("o"), GLib.OptionFlags.NONE, GLib.OptionArg.STRING,
+                             "Abrir la carpeta de documentación en el editor", "CARPETA")
+        self.add_main_option("publish", ord("p"), GLib.OptionFlags.NONE, GLib.OptionArg.STRING,
+                             "Publicar la carpeta de documentación en Azure", "CARPETA")
         self.configurations = configs
-        self.azure: azure_client.AzureClient = azure_client.AzureClient()
-        self.storage: config_manager.ConfigManager = config_manager.ConfigManager(configs=self.configurations)
+        self.azure: azure_client.AzureClient = azure_client.AzureClient(base_url=configs.azure_base_url)
+        self.workspace: workspace_index.WorkspaceIndex = workspace_index.WorkspaceIndex(
+            str(configs.config_dir / configs.workspace_index_file)
+        )
+        self.storage: config_manager.ConfigManager = config_manager.ConfigManager(
+            configs=self.configurations, index=self.workspace
+        )
+        self.sync: thread_sync.ThreadSync = thread_sync.ThreadSync(configs=self.configurations, azure=self.azure)
+        self.history: history.DocumentHistory = history.DocumentHistory(configs=self.configurations, index=self.workspace)
+        self.publisher: publisher.Publisher = publisher.Publisher(
+            configs=self.configurations, azure=self.azure, sync=self.sync, index=self.workspace, history=self.history
+        )
+        self.index: resource_index.ResourceIndex = resource_index.ResourceIndex(configs=self.configurations, azure=self.azure)
+        self.watcher: watcher.FolderWatcher = watcher.FolderWatcher(
+            configs=self.configurations,
+            on_publish=lambda folder: self.publish_folder(folder),
+            list_folders=self.storage.get_valid_folders
+        )
+        # Los guardados de la propia app no cuentan como ediciones externas
+        self.storage.on_markdown_write = self.watcher.expect_write
+        # Perfilado opcional (AZURE_POSTER_PROFILE=1 o menú); los resultados quedan junto a app.log
+        self.profiler: profiling.Profiler = profiling.Profiler(
+            configs.config_dir / "profiles", enabled=profiling.enabled_from_env()
+        )
+        self.stall_watchdog: profiling.StallWatchdog = profiling.StallWatchdog(
+            on_stall=self.profiler.record_stall, threshold=profiling.stall_threshold_from_env()
+        )
+        self.stall_source: Optional[int] = None
+        self.pickers: Dict[str, Any] = {}
+        self.refreshed_profiles: set[str] = set()
+        self.reconciling: set[str] = set()
         self.config: Dict[str, Any] = {}
         self.current_folder: Optional[str] = None
 
@@ -30,20 +74,37 @@ class AzureDevOpsApp(Adw.Application):
         self.text_view: Any = None
         self.folders_list: Any = None
 
+        # Vista previa de Markdown
+        self.renderer: md_render.IncrementalRenderer = md_render.IncrementalRenderer()
+        self.preview_widget: Any = None
+        self.preview_timeout: Optional[int] = None
+        self.preview_generation: int = 0
+
         # Entry rows for settings
+        self.profile_row: Any = None
+        self.profile_name_entry: Any = None
+        self.default_profile_row: Any = None
         self.org_entry: Any = None
         self.proj_entry: Any = None
         self.pat_entry: Any = None
         self.theme_row: Any = None # Nuevo widget para el tema
+        self.watch_row: Any = None
+        self.watch_interval_row: Any = None
 
         # Entry rows for documentation
         self.name_entry: Any = None
         self.repo_entry: Any = None
         self.pr_entry: Any = None
         self.wi_entry: Any = None
+        self.doc_profile_row: Any = None
 
+    @profiling.profiled("do_activate")
     def do_activate(self) -> None:
+        if self.window:
+            self.window.present()
+            return
         logger.info("Activando aplicación...")
+        TIMER.mark("activate")
         self.config = self.storage.load_json(self.configurations.global_config_file)
 
         self.apply_stored_theme()
@@ -67,11 +128,51 @@ class AzureDevOpsApp(Adw.Application):
         self.stack.connect("notify::visible-child-name", self.on_stack_changed)
 
         if not self.config.get("pat"):
-            self.stack.set_visible_child_name("config_view")
+            self.show_view("config_view")
         else:
             self.refresh_folder_list()
 
+        self.apply_watch_mode()
+        self.apply_profiling()
+        self.reconcile_workspace()
+
+        TIMER.mark("window_built")
         self.window.present()
+        self.window.add_tick_callback(self.on_first_frame)
+
+    def on_first_frame(self, widget: Any, frame_clock: Any) -> bool:
+        TIMER.mark("first_frame")
+        TIMER.report()
+        return GLib.SOURCE_REMOVE
+
+    def do_command_line(self, command_line: Gio.ApplicationCommandLine) -> int:
+        """Atiende `--open`/`--publish`, tanto locales como reenviados desde otra invocación."""
+        options: Dict[str, Any] = command_line.get_options_dict().end().unpack()
+        self.activate()
+
+        if "open" in options:
+            self.ui_open_editor(self.resolve_folder(options["open"], command_line.get_cwd()))
+
+        if "publish" in options:
+            folder = self.resolve_folder(options["publish"], command_line.get_cwd())
+            logger.info(f"Publicación solicitada por línea de comandos: {folder}")
+
+            # Mantener la referencia a `command_line` hace que el proceso remoto espere
+            # hasta conocer el resultado y salga con 0 o 1.
+            def on_done(ok: bool) -> None:
+                command_line.set_exit_status(0 if ok else 1)
+
+            self.publish_folder(folder, on_done=on_done)
+        return 0
+
+    def resolve_folder(self, arg: str, cwd: Optional[str]) -> str:
+        """Convierte la ruta recibida (relativa al cwd del invocador) en carpeta relativa a `base_path`."""
+        base_path = os.path.abspath(self.config.get("base_path", os.getcwd()))
+        candidate = os.path.abspath(os.path.join(cwd or "", os.path.expanduser(arg)))
+        if not os.path.isdir(candidate):
+            return arg
+        relative = os.path.relpath(candidate, base_path)
+        return candidate if relative.startswith("..") else relative
 
     def apply_stored_theme(self) -> None:
         """Aplica el esquema de color basado en la configuración guardada."""
@@ -85,6 +186,63 @@ class AzureDevOpsApp(Adw.Application):
         }
         style_manager.set_color_scheme(mapping.get(theme_pref, Adw.ColorScheme.DEFAULT))
 
+    def apply_watch_mode(self) -> None:
+        """Inicia o detiene la vigilancia de carpetas según la configuración guardada."""
+        self.watcher.stop()
+        self.watcher.throttle.min_interval = float(self.config.get("watch_min_interval", watcher.MIN_INTERVAL))
+        if self.config.get("watch") and self.config.get("pat"):
+            self.watcher.start(self.config.get("base_path", os.getcwd()))
+
+    def apply_profiling(self) -> None:
+        """Con el perfilado activo, vigila bloqueos del main loop con un latido periódico."""
+        if self.profiler.enabled and not self.stall_watchdog.running:
+            self.stall_watchdog.start()
+            self.stall_source = GLib.timeout_add(int(self.stall_watchdog.interval * 1000), self.stall_watchdog.beat)
+        elif not self.profiler.enabled and self.stall_watchdog.running:
+            GLib.source_remove(self.stall_source)
+            self.stall_source = None
+            self.stall_watchdog.stop()
+
+    def ui_toggle_profiling(self, action: Any, value: Any) -> None:
+        action.set_state(value)
+        if value.get_boolean():
+            self.profiler.enable()
+            self.show_toast(f"⏱️ Perfilado activo: {self.profiler.output_dir}")
+        else:
+            self.profiler.disable()
+            self.show_toast("⏱️ Perfilado desactivado")
+        self.apply_profiling()
+
+    def reconcile_workspace(self) -> None:
+        """Pone al día el índice SQLite con el disco en segundo plano y refresca la lista.
+
+        Solo compara mtimes, así que se llama cada vez que se vuelve a la lista para
+        recoger carpetas creadas o borradas fuera de la app. Sin `base_path` configurado
+        no se hace nada: recorrer el cwd (normalmente el home) sería lento e inútil.
+        """
+        base_path = self.config.get("base_path")
+        if not base_path or base_path in self.reconciling:
+            return
+        self.reconciling.add(base_path)
+
+        import threading
+
+        def thread_target():
+            changed = 0
+            try:
+                changed = self.storage.reconcile_index(base_path)
+            except Exception as exc:
+                logger.error(f"No se pudo actualizar el índice del espacio de trabajo: {exc}")
+            GLib.idle_add(self.on_workspace_reconciled, base_path, changed)
+
+        threading.Thread(target=thread_target, daemon=True).start()
+
+    def on_workspace_reconciled(self, base_path: str, changed: int) -> bool:
+        self.reconciling.discard(base_path)
+        if changed and self.stack.get_visible_child_name() == "list_view":
+            self.refresh_folder_list()
+        return GLib.SOURCE_REMOVE
+
     def init_ui_components(self) -> None:
         self.view: Any = Adw.ToolbarView()
         self.header: Any = Adw.HeaderBar()
@@ -100,13 +258,35 @@ class AzureDevOpsApp(Adw.Application):
         self.header.pack_end(self.spinner)
 
         menu: Any = Gio.Menu()
+        menu.append("Publicar pendientes", "app.publish-pending")
+        menu.append("Sincronizar respuestas", "app.sync")
+        menu.append("Diagnóstico", "app.diagnostics")
+        menu.append("Modo de perfilado", "app.profiling")
         menu.append("Ayuda", "app.help")
         menu.append("Acerca de", "app.about")
 
         self.menu_btn: Any = Gtk.MenuButton(icon_name="view-more-symbolic", menu_model=menu)
 
         self.settings_btn: Any = Gtk.Button(icon_name="emblem-system-symbolic")
-        self.settings_btn.connect("clicked", lambda x: self.stack.set_visible_child_name("config_view"))
+        self.settings_btn.connect("clicked", lambda x: self.show_view("config_view"))
+
+        publish_pending_action: Any = Gio.SimpleAction.new("publish-pending", None)
+        publish_pending_action.connect("activate", self.ui_publish_pending)
+        self.add_action(publish_pending_action)
+
+        sync_action: Any = Gio.SimpleAction.new("sync", None)
+        sync_action.connect("activate", self.ui_sync_replies)
+        self.add_action(sync_action)
+
+        diagnostics_action: Any = Gio.SimpleAction.new("diagnostics", None)
+        diagnostics_action.connect("activate", self.ui_show_diagnostics)
+        self.add_action(diagnostics_action)
+
+        profiling_action: Any = Gio.SimpleAction.new_stateful(
+            "profiling", None, GLib.Variant.new_boolean(self.profiler.enabled)
+        )
+        profiling_action.connect("change-state", self.ui_toggle_profiling)
+        self.add_action(profiling_action)
 
         help_action: Any = Gio.SimpleAction.new("help", None)
         help_action.connect("activate", self.ui_show_help)
@@ -121,15 +301,28 @@ class AzureDevOpsApp(Adw.Application):
         self.header.pack_end(self.menu_btn)
         self.header.pack_end(self.settings_btn)
 
-        self.setup_config_view()
-        self.setup_main_view()
-        self.setup_list_view()
-        self.setup_editor_view()
+        # Las vistas se construyen la primera vez que se muestran (ver `ensure_view`)
+        self.view_builders: Dict[str, Callable[[], None]] = {
+            "config_view": self.setup_config_view,
+            "main_view": self.setup_main_view,
+            "list_view": self.setup_list_view,
+            "editor_view": self.setup_editor_view,
+        }
+        self.built_views: set[str] = set()
 
         self.toast_overlay: Any = Adw.ToastOverlay(child=self.stack)
         self.view.set_content(self.toast_overlay)
         self.window.set_content(self.view)
 
+    def ensure_view(self, name: str) -> None:
+        if name not in self.built_views:
+            self.built_views.add(name)
+            self.view_builders[name]()
+
+    def show_view(self, name: str) -> None:
+        self.ensure_view(name)
+        self.stack.set_visible_child_name(name)
+
     def create_margin_box(self) -> Any:
         box: Any = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         box.set_margin_top(20); box.set_margin_bottom(20)
@@ -140,9 +333,23 @@ class AzureDevOpsApp(Adw.Application):
         box: Any = self.create_margin_box()
         group: Any = Adw.PreferencesGroup(title="Ajustes Globales")
 
-        self.org_entry = Adw.EntryRow(title="Organización", text=self.config.get("organization", ""))
-        self.proj_entry = Adw.EntryRow(title="Proyecto", text=self.config.get("project", ""))
-        self.pat_entry = Adw.PasswordEntryRow(title="PAT", text=self.config.get("pat", ""))
+        # --- SECCIÓN DE PERFILES (una organización/proyecto/PAT por perfil) ---
+        self.profile_row = Adw.ComboRow(title="Perfil", model=Gtk.StringList())
+        add_profile_btn = Gtk.Button(icon_name="list-add-symbolic", tooltip_text="Nuevo perfil",
+                                     valign=Gtk.Align.CENTER, css_classes=["flat"])
+        add_profile_btn.connect("clicked", self.ui_new_profile)
+        remove_profile_btn = Gtk.Button(icon_name="user-trash-symbolic", tooltip_text="Eliminar perfil",
+                                        valign=Gtk.Align.CENTER, css_classes=["flat"])
+        remove_profile_btn.connect("clicked", self.ui_remove_profile)
+        self.profile_row.add_suffix(add_profile_btn)
+        self.profile_row.add_suffix(remove_profile_btn)
+
+        self.profile_name_entry = Adw.EntryRow(title="Nombre del perfil")
+        self.default_profile_row = Adw.SwitchRow(title="Perfil por defecto",
+                                                 subtitle="Se usa en las carpetas que no eligen perfil")
+        self.org_entry = Adw.EntryRow(title="Organización")
+        self.proj_entry = Adw.EntryRow(title="Proyecto")
+        self.pat_entry = Adw.PasswordEntryRow(title="PAT")
 
         self.path_entry = Adw.EntryRow(
             title="Ruta de Documentación",
@@ -174,11 +381,28 @@ class AzureDevOpsApp(Adw.Application):
         self.check_btn.connect("clicked", self.ui_on_verify_pat)
         self.pat_entry.add_suffix(self.check_btn)
 
-        items = [self.org_entry, self.proj_entry, self.pat_entry, self.path_entry, self.theme_row]
+        # --- SECCIÓN DE VIGILANCIA ---
+        self.watch_row = Adw.SwitchRow(
+            title="Publicación automática",
+            subtitle="Publica al detectar cambios en content.md hechos con otro editor",
+            active=self.config.get("watch", False)
+        )
+        self.watch_interval_row = Adw.SpinRow.new_with_range(10, 3600, 10)
+        self.watch_interval_row.set_title("Intervalo mínimo por carpeta (s)")
+        self.watch_interval_row.set_value(self.config.get("watch_min_interval", watcher.MIN_INTERVAL))
+        self.watch_row.bind_property("active", self.watch_interval_row, "sensitive", GObject.BindingFlags.SYNC_CREATE)
+
+        items = [self.profile_row, self.profile_name_entry, self.default_profile_row,
+                 self.org_entry, self.proj_entry, self.pat_entry, self.path_entry, self.theme_row,
+                 self.watch_row, self.watch_interval_row]
 
         for e in items: group.add(e)
         box.append(group)
 
+        self.fill_profile_rows()
+        self.profile_row.connect("notify::selected", lambda *args: self.ui_load_profile())
+        self.ui_load_profile()
+
         btn: Any = Gtk.Button(label="Guardar Configuración", css_classes=["suggested-action"])
         btn.connect("clicked", self.ui_save_global_config)
         box.append(btn)
@@ -203,18 +427,169 @@ class AzureDevOpsApp(Adw.Application):
         self.repo_entry = Adw.EntryRow(title="Repository ID")
         self.pr_entry = Adw.EntryRow(title="PR ID")
         self.wi_entry = Adw.EntryRow(title="Work Item ID")
+        self.doc_profile_row = Adw.ComboRow(title="Perfil", model=Gtk.StringList())
 
-        for e in [self.name_entry, self.repo_entry, self.pr_entry, self.wi_entry]: self.doc_group.add(e)
+        for e in [self.name_entry, self.doc_profile_row, self.repo_entry, self.pr_entry, self.wi_entry]:
+            self.doc_group.add(e)
         box.append(self.doc_group)
+        self.fill_profile_rows()
+        # Los selectores muestran los recursos de la organización del perfil elegido
+        self.doc_profile_row.connect("notify::selected", lambda *args: self.load_pickers())
+
+        self.attach_picker(self.repo_entry, "repositories")
+        self.attach_picker(self.pr_entry, "pull_requests")
+        self.repo_entry.connect("changed", self.ui_refill_pr_picker)
+        self.attach_picker(self.wi_entry, "work_items")
 
         self.doc_action_btn: Any = Gtk.Button(label="Acción", css_classes=["accent"])
         box.append(self.doc_action_btn)
         self.stack.add_named(box, "main_view")
 
+    def attach_picker(self, entry: Any, kind: str) -> None:
+        """Agrega a la fila un selector con autocompletado sobre el índice local."""
+        store: Any = Gtk.StringList()
+        string_filter: Any = Gtk.StringFilter(
+            expression=Gtk.PropertyExpression.new(Gtk.StringObject, None, "string"),
+            match_mode=Gtk.StringFilterMatchMode.SUBSTRING,
+            ignore_case=True
+        )
+        filtered: Any = Gtk.FilterListModel(model=store, filter=string_filter)
+
+        factory: Any = Gtk.SignalListItemFactory()
+        factory.connect("setup", lambda f, item: item.set_child(Gtk.Label(xalign=0)))
+        factory.connect("bind", lambda f, item: item.get_child().set_label(item.get_item().get_string()))
+
+        list_view: Any = Gtk.ListView(model=Gtk.NoSelection(model=filtered), factory=factory,
+                                      single_click_activate=True)
+        scrolled: Any = Gtk.ScrolledWindow(child=list_view, min_content_height=240, min_content_width=320)
+        popover: Any = Gtk.Popover(child=scrolled)
+        picker_btn: Any = Gtk.MenuButton(icon_name="view-list-symbolic", popover=popover,
+                                         valign=Gtk.Align.CENTER, css_classes=["flat"])
+
+        def on_activate(view: Any, position: int) -> None:
+            label: str = filtered.get_item(position).get_string()
+            entry.set_text(label.split(" — ")[0])
+            popover.popdown()
+
+        list_view.connect("activate", on_activate)
+        entry.connect("changed", lambda e: string_filter.set_search(e.get_text()))
+        entry.add_suffix(picker_btn)
+        self.pickers[kind] = {"store": store, "labels": set()}
+
+    def fill_picker(self, kind: str, entries: List[Dict[str, str]], replace: bool = False) -> bool:
+        picker = self.pickers[kind]
+        if replace:
+            picker["labels"] = set()
+        labels = [e["label"] for e in entries if e["label"] not in picker["labels"]]
+        picker["labels"].update(labels)
+        start = 0 if replace else picker["store"].get_n_items()
+        removed = picker["store"].get_n_items() if replace else 0
+        picker["store"].splice(start, removed, labels)
+        return False
+
+    def load_pickers(self) -> None:
+        """Muestra el índice en caché y lo actualiza una vez por sesión y perfil en segundo plano."""
+        try:
+            profile_config = profiles.resolve(self.config, self.selected_doc_profile())
+        except KeyError:
+            return
+        if not self.refreshed_profiles:
+            self.index.load()
+        for kind in self.pickers:
+            self.fill_picker(kind, self.picker_entries(profile_config, kind), replace=True)
+        if profile_config["profile"] in self.refreshed_profiles or not profile_config.get("pat"):
+            return
+        self.refreshed_profiles.add(profile_config["profile"])
+
+        import threading
+
+        def on_page(kind: str, entries: List[Dict[str, str]]) -> None:
+            if kind == "pull_requests":
+                entries = self.index.in_repository(entries, self.repo_entry.get_text())
+            GLib.idle_add(self.fill_picker, kind, entries)
+
+        def thread_target():
+            try:
+                self.index.refresh(profile_config, on_page=on_page)
+                for kind in self.pickers:
+                    GLib.idle_add(self.fill_picker, kind, self.picker_entries(profile_config, kind), True)
+            except Exception as exc:
+                logger.error(f"No se pudo actualizar el índice de recursos: {exc}")
+
+        threading.Thread(target=thread_target, daemon=True).start()
+
+    def picker_entries(self, profile_config: Dict[str, Any], kind: str) -> List[Dict[str, str]]:
+        """Entradas en caché del selector; los PRs se limitan al repositorio escrito en el formulario."""
+        return self.index.entries(profile_config, kind, repository=self.repo_entry.get_text())
+
+    def ui_refill_pr_picker(self, entry: Any) -> None:
+        try:
+            profile_config = profiles.resolve(self.config, self.selected_doc_profile())
+        except KeyError:
+            return
+        self.fill_picker("pull_requests", self.picker_entries(profile_config, "pull_requests"), replace=True)
+
+    def fill_profile_rows(self, selected: Optional[str] = None) -> None:
+        """Carga los nombres de perfil (el por defecto primero) en los combos ya construidos."""
+        names = profiles.profile_names(self.config) or [profiles.DEFAULT_PROFILE]
+        for row in (self.profile_row, self.doc_profile_row):
+            if row is None:
+                continue
+            current = selected or self.selected_profile(row)
+            row.set_model(Gtk.StringList.new(names))
+            row.set_selected(names.index(current) if current in names else 0)
+
+    @staticmethod
+    def selected_profile(row: Any) -> Optional[str]:
+        item = row.get_selected_item()
+        return item.get_string() if item else None
+
+    def selected_doc_profile(self) -> Optional[str]:
+        return self.selected_profile(self.doc_profile_row) if self.doc_profile_row else None
+
+    def ui_load_profile(self) -> None:
+        name = self.selected_profile(self.profile_row) or profiles.DEFAULT_PROFILE
+        data = profiles.get_profiles(self.config).get(name, {})
+        self.profile_name_entry.set_text(name)
+        self.org_entry.set_text(data.get("organization", ""))
+        self.proj_entry.set_text(data.get("project", ""))
+        self.pat_entry.set_text(data.get("pat", ""))
+        self.default_profile_row.set_active(name == profiles.default_profile(self.config))
+
+    def ui_new_profile(self, btn: Any) -> None:
+        """Limpia el formulario: al guardar con otro nombre se crea un perfil nuevo."""
+        for e in [self.profile_name_entry, self.org_entry, self.proj_entry, self.pat_entry]:
+            e.set_text("")
+        self.default_profile_row.set_active(False)
+        self.profile_name_entry.grab_focus()
+
+    def ui_remove_profile(self, btn: Any) -> None:
+        name = self.selected_profile(self.profile_row)
+        if not name or len(profiles.get_profiles(self.config)) <= 1:
+            self.show_toast("❌ Debe quedar al menos un perfil")
+            return
+        self.config = profiles.remove_profile(self.config, name)
+        self.storage.save_json(self.configurations.global_config_file, self.config)
+        logger.info(f"Perfil eliminado: {name}")
+        self.fill_profile_rows(profiles.default_profile(self.config))
+        self.ui_load_profile()
+        self.show_toast(f"🗑️ Perfil '{name}' eliminado")
+
     def setup_list_view(self) -> None:
         scroll: Any = Gtk.ScrolledWindow()
         box: Any = self.create_margin_box()
         self.folders_group: Any = Adw.PreferencesGroup(title="Documentaciones Existentes")
+
+        # Orden y filtro: consultas sobre el índice, sin recorrer el disco
+        self.folder_orders = [("Nombre", "name", False), ("Última edición", "mtime", False),
+                              ("Última publicación", "published", False), ("Sin publicar", "name", True)]
+        self.order_dropdown: Any = Gtk.DropDown(
+            model=Gtk.StringList.new([label for label, _, _ in self.folder_orders]),
+            valign=Gtk.Align.CENTER
+        )
+        self.order_dropdown.connect("notify::selected", lambda *args: self.refresh_folder_list())
+        self.folders_group.set_header_suffix(self.order_dropdown)
+
         self.folders_list = Gtk.ListBox(css_classes=["boxed-list"], selection_mode=Gtk.SelectionMode.NONE)
         self.folders_group.add(self.folders_list)
 
@@ -231,6 +606,7 @@ class AzureDevOpsApp(Adw.Application):
         btns: List[Any] = [
             ("media-playback-start-symbolic", "success", self.ui_run_azure, "Ejecutar"),
             ("settings-symbolic", "", self.ui_edit_folder_config, "Configurar"),
+            ("document-open-recent-symbolic", "", self.ui_show_history, "Historial"),
             ("document-save-symbolic", "suggested-action", self.ui_save_markdown, "Guardar")
         ]
         for icon, cls, call, tip in btns:
@@ -239,6 +615,10 @@ class AzureDevOpsApp(Adw.Application):
             b.connect("clicked", call)
             bar.append(b)
 
+        self.preview_btn: Any = Gtk.ToggleButton(icon_name="view-dual-symbolic", tooltip_text="Vista previa")
+        self.preview_btn.connect("toggled", self.ui_toggle_preview)
+        bar.append(self.preview_btn)
+
         box.append(bar)
 
         scrolled: Any = Gtk.ScrolledWindow(vexpand=True, has_frame=True)
@@ -254,10 +634,73 @@ class AzureDevOpsApp(Adw.Application):
         self.text_view.set_margin_start(20)
         self.text_view.set_margin_end(20)
         scrolled.set_child(self.text_view)
-        box.append(scrolled)
+        self.text_view.get_buffer().connect("changed", self.on_editor_changed)
+
+        self.editor_paned: Any = Gtk.Paned(orientation=Gtk.Orientation.HORIZONTAL, vexpand=True, wide_handle=True)
+        self.editor_paned.set_start_child(scrolled)
+        self.editor_paned.set_shrink_start_child(False)
+        box.append(self.editor_paned)
 
         self.stack.add_named(box, "editor_view")
 
+    def create_preview_widget(self) -> Any:
+        """Usa WebKit si está disponible; si no, muestra el HTML generado como texto."""
+        try:
+            gi.require_version('WebKit', '6.0')
+            from gi.repository import WebKit
+            return WebKit.WebView(vexpand=True, hexpand=True)
+        except (ValueError, ImportError):
+            logger.info("WebKit no disponible, la vista previa mostrará el HTML generado")
+            view = Gtk.TextView(editable=False, monospace=True, wrap_mode=Gtk.WrapMode.WORD_CHAR)
+            view.add_css_class("view")
+            return Gtk.ScrolledWindow(child=view, vexpand=True, hexpand=True, has_frame=True)
+
+    def ui_toggle_preview(self, btn: Any) -> None:
+        if btn.get_active():
+            if self.preview_widget is None:
+                self.preview_widget = self.create_preview_widget()
+            self.editor_paned.set_end_child(self.preview_widget)
+            self.render_preview()
+        else:
+            self.editor_paned.set_end_child(None)
+
+    def on_editor_changed(self, buffer: Any) -> None:
+        if not self.preview_btn.get_active():
+            return
+        # Debounce: se renderiza cuando el usuario deja de escribir por un momento
+        if self.preview_timeout is not None:
+            GLib.source_remove(self.preview_timeout)
+        self.preview_timeout = GLib.timeout_add(PREVIEW_DEBOUNCE_MS, self.render_preview)
+
+    def render_preview(self) -> bool:
+        self.preview_timeout = None
+        buffer: Any = self.text_view.get_buffer()
+        text: str = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
+        self.preview_generation += 1
+        generation = self.preview_generation
+
+        import threading
+
+        def thread_target():
+            try:
+                html = self.renderer.render(text)
+                GLib.idle_add(self.on_preview_rendered, generation, html)
+            except Exception as exc:
+                logger.error(f"No se pudo renderizar la vista previa: {exc}")
+
+        threading.Thread(target=thread_target, daemon=True).start()
+        return GLib.SOURCE_REMOVE
+
+    def on_preview_rendered(self, generation: int, html: str) -> bool:
+        # Descarta resultados de ediciones anteriores que terminaron tarde
+        if generation != self.preview_generation or self.preview_widget is None:
+            return GLib.SOURCE_REMOVE
+        if isinstance(self.preview_widget, Gtk.ScrolledWindow):
+            self.preview_widget.get_child().get_buffer().set_text(html)
+        else:
+            self.preview_widget.load_html(f"<html><head>{PREVIEW_STYLE}</head><body>{html}</body></html>", None)
+        return GLib.SOURCE_REMOVE
+
     # ... [ on_stack_changed, show_toast, refresh_folder_list, ui_show_about, ui_show_help, ui_on_browse_clicked, ui_open_editor, ui_open_creation_mode, ui_edit_folder_config, ui_save_folder_config, ui_save_markdown, ui_run_azure, ui_create_documentation permanecen iguales ] ...
 
     def on_stack_changed(self, stack: Any, pspec: Any) -> None:
@@ -266,11 +709,15 @@ class AzureDevOpsApp(Adw.Application):
         self.back_btn.set_visible(not is_list)
         self.add_btn.set_visible(is_list)
         self.settings_btn.set_visible(is_list)
+        if is_list:
+            self.reconcile_workspace()
 
     def show_toast(self, message: str) -> None:
         self.toast_overlay.add_toast(Adw.Toast.new(message))
 
+    @profiling.profiled("refresh_folder_list")
     def refresh_folder_list(self) -> None:
+        self.ensure_view("list_view")
         # Limpiar la lista actual
         while child := self.folders_list.get_first_child():
             self.folders_list.remove(child)
@@ -280,7 +727,8 @@ class AzureDevOpsApp(Adw.Application):
         base_path = self.config.get("base_path", os.getcwd())
 
         # PASAMOS el base_path al servicio
-        folders: List[str] = self.storage.get_valid_folders(base_path)
+        _, order, unpublished_only = self.folder_orders[self.order_dropdown.get_selected()]
+        folders: List[str] = self.storage.list_folders(base_path, order, unpublished_only)
 
         self.empty_label.set_visible(not folders)
         self.folders_group.set_visible(bool(folders))
@@ -297,7 +745,7 @@ class AzureDevOpsApp(Adw.Application):
             row.add_suffix(btn)
             self.folders_list.append(row)
 
-        self.stack.set_visible_child_name("list_view")
+        self.show_view("list_view")
 
     def ui_on_verify_pat(self, btn):
         org = self.org_entry.get_text()
@@ -336,6 +784,166 @@ class AzureDevOpsApp(Adw.Application):
         )
         about.present()
 
+    def ui_show_diagnostics(self, action: Any, param: Any) -> None:
+        """Muestra los histogramas de latencia en memoria y permite exportarlos."""
+        window = Adw.Window(
+            transient_for=self.window,
+            default_width=520,
+            default_height=580,
+            modal=True,
+            title="Diagnóstico"
+        )
+        view = Adw.ToolbarView()
+        header = Adw.HeaderBar()
+        view.add_top_bar(header)
+
+        toast_overlay = Adw.ToastOverlay()
+        scrolled = Gtk.ScrolledWindow()
+        clamp = Adw.Clamp(maximum_size=460)
+        box = self.create_margin_box()
+
+        titles = {
+            "http_request_seconds": "Peticiones a Azure",
+            "http_phase_seconds": "Fases de red",
+            "markdown_render_seconds": "Render de Markdown",
+            "file_io_seconds": "Disco local",
+        }
+
+        def render() -> None:
+            while child := box.get_first_child():
+                box.remove(child)
+            snapshot = METRICS.snapshot()
+            if not snapshot:
+                box.append(Gtk.Label(label="Aún no hay mediciones", css_classes=["dim-label"]))
+            for name, series in snapshot.items():
+                group = Adw.PreferencesGroup(title=titles.get(name, name))
+                for item in series:
+                    row = Adw.ActionRow(
+                        title=" · ".join(item["labels"].values()) or name,
+                        subtitle=(f"n={item['count']}  p50={item['p50'] * 1000:.1f}ms  "
+                                  f"p95={item['p95'] * 1000:.1f}ms  máx={item['max'] * 1000:.1f}ms")
+                    )
+                    group.add(row)
+                box.append(group)
+
+        def export(btn: Any, filename: str, content: Callable[[], str]) -> None:
+            path = self.configurations.config_dir / filename
+            try:
+                path.write_text(content(), encoding='utf-8')
+                logger.info(f"Métricas exportadas en: {path}")
+                toast_overlay.add_toast(Adw.Toast.new(f"💾 Exportado en {path}"))
+            except OSError as exc:
+                logger.error(f"No se pudieron exportar las métricas: {exc}")
+                toast_overlay.add_toast(Adw.Toast.new("❌ Error al exportar"))
+
+        refresh_btn = Gtk.Button(icon_name="view-refresh-symbolic", tooltip_text="Actualizar")
+        refresh_btn.connect("clicked", lambda x: render())
+        json_btn = Gtk.Button(label="JSON", tooltip_text="Exportar como JSON")
+        json_btn.connect("clicked", export, "metrics.json", METRICS.to_json)
+        prom_btn = Gtk.Button(label="Prometheus", tooltip_text="Exportar como textfile de Prometheus")
+        prom_btn.connect("clicked", export, "metrics.prom", METRICS.to_prometheus)
+        header.pack_start(refresh_btn)
+        header.pack_end(prom_btn)
+        header.pack_end(json_btn)
+
+        render()
+        clamp.set_child(box)
+        scrolled.set_child(clamp)
+        toast_overlay.set_child(scrolled)
+        view.set_content(toast_overlay)
+        window.set_content(view)
+        window.present()
+
+    def ui_show_history(self, btn: Any) -> None:
+        """Lista las publicaciones de la carpeta, muestra el diff contra el editor y permite restaurar."""
+        if not self.current_folder: return
+        folder = self.current_folder
+        base_path = self.config.get("base_path", os.getcwd())
+        buffer = self.text_view.get_buffer()
+        current = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
+
+        window = Adw.Window(
+            transient_for=self.window,
+            default_width=720,
+            default_height=600,
+            modal=True,
+            title=f"Historial: {folder}"
+        )
+        view = Adw.ToolbarView()
+        header = Adw.HeaderBar()
+        view.add_top_bar(header)
+        restore_btn = Gtk.Button(label="Restaurar", sensitive=False)
+        restore_btn.add_css_class("suggested-action")
+        header.pack_end(restore_btn)
+
+        versions_list = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
+        versions_list.add_css_class("navigation-sidebar")
+        diff_view = Gtk.TextView(monospace=True, editable=False, cursor_visible=False, wrap_mode=Gtk.WrapMode.NONE)
+        diff_view.set_left_margin(12)
+        diff_view.set_top_margin(12)
+
+        list_scrolled = Gtk.ScrolledWindow(hscrollbar_policy=Gtk.PolicyType.NEVER)
+        list_scrolled.set_child(versions_list)
+        diff_scrolled = Gtk.ScrolledWindow(hexpand=True)
+        diff_scrolled.add_css_class("view")
+        diff_scrolled.set_child(diff_view)
+        paned = Gtk.Paned(orientation=Gtk.Orientation.HORIZONTAL, position=240)
+        paned.set_start_child(list_scrolled)
+        paned.set_end_child(diff_scrolled)
+        paned.set_shrink_start_child(False)
+
+        versions = self.history.versions(base_path, folder)
+        if not versions:
+            diff_view.get_buffer().set_text("Esta carpeta aún no tiene publicaciones.")
+        for version in versions:
+            ok = 200 <= (version["pr_status"] or 0) < 300 and 200 <= (version["wi_status"] or 0) < 300
+            when = GLib.DateTime.new_from_unix_local(int(version["published_at"])).format("%Y-%m-%d %H:%M:%S")
+            row = Adw.ActionRow(
+                title=when,
+                subtitle=f"{'✅' if ok else '⚠️'} PR {version['pr_status']} · WI {version['wi_status']}",
+                sensitive=version["available"],
+            )
+            versions_list.append(row)
+
+        def on_selected(listbox: Any, row: Any) -> None:
+            if row is None:
+                return
+            version = versions[row.get_index()]
+            try:
+                old = self.history.load(base_path, version["content_hash"])
+            except (KeyError, OSError) as exc:
+                logger.error(f"No se pudo leer la versión {version['content_hash']}: {exc}")
+                restore_btn.set_sensitive(False)
+                return
+            diff = self.history.diff(old, current)
+            diff_view.get_buffer().set_text(diff or "Sin diferencias con el editor.")
+            restore_btn.set_sensitive(bool(diff))
+
+        def on_restore(btn: Any) -> None:
+            row = versions_list.get_selected_row()
+            if row is None:
+                return
+            version = versions[row.get_index()]
+            try:
+                text = self.history.load(base_path, version["content_hash"])
+                self.storage.save_markdown(base_path, folder, text)
+            except (KeyError, OSError) as exc:
+                logger.error(f"No se pudo restaurar la versión {version['content_hash']}: {exc}")
+                self.show_toast("❌ Error al restaurar")
+                return
+            logger.info(f"Versión {version['content_hash'][:12]} restaurada en '{folder}'")
+            if self.current_folder == folder:
+                self.text_view.get_buffer().set_text(text)
+            self.show_toast("⏪ Versión restaurada")
+            window.close()
+
+        versions_list.connect("row-selected", on_selected)
+        restore_btn.connect("clicked", on_restore)
+
+        view.set_content(paned)
+        window.set_content(view)
+        window.present()
+
     def ui_show_help(self, action: Any, param: Any) -> None:
         """Versión compacta manual: elimina el scroll excesivo controlando cada píxel."""
         help_window = Adw.Window(
@@ -436,71 +1044,86 @@ class AzureDevOpsApp(Adw.Application):
         # 3. Lanzamos el diálogo de selección de carpeta
         dialog.select_folder(self.window, None, on_open_finish)
 
+    @profiling.profiled("ui_open_editor")
     def ui_open_editor(self, folder: str) -> None:
+        self.ensure_view("editor_view")
         self.current_folder = folder
         base_path = self.config.get("base_path", os.getcwd())
 
         # Unimos la ruta base con la carpeta seleccionada
         full_path = os.path.join(base_path, folder)
         md_path: str = os.path.join(full_path, self.configurations.md_file)
+        if not os.path.isdir(full_path):
+            # Fila vieja: la carpeta se borró o movió fuera de la app
+            logger.warning(f"La carpeta '{folder}' ya no existe en {base_path}")
+            self.current_folder = None
+            self.show_toast("⚠️ La carpeta ya no existe")
+            self.reconcile_workspace()
+            return
 
         content: str = ""
         if os.path.exists(md_path):
-            with open(md_path, 'r', encoding='utf-8') as f:
+            with METRICS.span("file_io_seconds", op="read"), open(md_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
         self.text_view.get_buffer().set_text(content)
-        self.stack.set_visible_child_name("editor_view")
+        self.show_view("editor_view")
 
     def ui_open_creation_mode(self, btn: Optional[Any] = None) -> None:
+        self.ensure_view("main_view")
         self.current_folder = None
         for e in [self.name_entry, self.repo_entry, self.pr_entry, self.wi_entry]:
             e.set_text("")
 
         self.name_entry.set_sensitive(True)
+        self.fill_profile_rows(profiles.default_profile(self.config))
         self.doc_group.set_title("Nueva Documentación")
         self.doc_action_btn.set_label("Crear Carpeta")
 
         self.reconnect_action_btn(self.ui_create_documentation)
-        self.stack.set_visible_child_name("main_view")
+        self.load_pickers()
+        self.show_view("main_view")
 
     def ui_edit_folder_config(self, btn: Any) -> None:
         if not self.current_folder: return
-        data: Dict[str, Any] = self.storage.load_json(os.path.join(self.current_folder, self.configurations.doc_config_file))
+        self.ensure_view("main_view")
+        base_path = self.config.get("base_path", os.getcwd())
+        data: Dict[str, Any] = self.storage.load_doc_config(base_path, self.current_folder)
         self.name_entry.set_text(self.current_folder)
         self.name_entry.set_sensitive(False)
         self.repo_entry.set_text(data.get("repository_id", ""))
         self.pr_entry.set_text(data.get("pull_request_id", ""))
         self.wi_entry.set_text(data.get("work_item_id", ""))
+        self.fill_profile_rows(data.get("profile") or profiles.default_profile(self.config))
 
         self.doc_group.set_title(f"Configurando: {self.current_folder}")
         self.doc_action_btn.set_label("Actualizar")
         self.reconnect_action_btn(self.ui_save_folder_config)
-        self.stack.set_visible_child_name("main_view")
+        self.load_pickers()
+        self.show_view("main_view")
 
     def ui_save_folder_config(self, btn: Any) -> None:
         if not self.current_folder: return
         data: Dict[str, str] = {
             "repository_id": self.repo_entry.get_text(),
             "pull_request_id": self.pr_entry.get_text(),
-            "work_item_id": self.wi_entry.get_text()
+            "work_item_id": self.wi_entry.get_text(),
+            "profile": self.selected_doc_profile() or profiles.DEFAULT_PROFILE
         }
-        self.storage.save_json(os.path.join(self.current_folder, self.configurations.doc_config_file), data)
+        base_path = self.config.get("base_path", os.getcwd())
+        self.storage.save_doc_config(base_path, self.current_folder, data)
         self.show_toast("✅ Configuración de carpeta actualizada")
-        self.stack.set_visible_child_name("editor_view")
+        self.show_view("editor_view")
 
     def ui_save_markdown(self, btn: Optional[Any]) -> None:
         if not self.current_folder: return
 
-        # Obtener ruta completa
         base_path = self.config.get("base_path", os.getcwd())
-        full_path = os.path.join(base_path, self.current_folder, self.configurations.md_file)
 
         buffer: Any = self.text_view.get_buffer()
         text: str = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            full_path = self.storage.save_markdown(base_path, self.current_folder, text)
             logger.info(f"Contenido Markdown guardado en: {full_path}")
             self.show_toast("💾 Guardado")
         except Exception as exc:
@@ -512,9 +1135,14 @@ class AzureDevOpsApp(Adw.Application):
         if not self.current_folder: return
         self.ui_save_markdown(None)
 
-        doc_conf = self.storage.load_json(os.path.join(self.current_folder, self.configurations.doc_config_file))
         buffer = self.text_view.get_buffer()
         md_content = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
+        self.publish_folder(self.current_folder, md_content)
+
+    def publish_folder(self, folder: str, content: Optional[str] = None,
+                       on_done: Optional[Callable[[bool], None]] = None) -> None:
+        """Publica la carpeta en un hilo; `content=None` usa el Markdown guardado en disco."""
+        base_path = self.config.get("base_path", os.getcwd())
 
         # 1. Feedback visual de inicio
         self.set_busy(True)
@@ -524,31 +1152,113 @@ class AzureDevOpsApp(Adw.Application):
 
         def thread_target():
             try:
-                r1 = self.azure.post_to_pr(self.config, doc_conf, md_content)
-                r2 = self.azure.post_to_wi(self.config, doc_conf, md_content)
+                with self.profiler.section("publish"):
+                    r1, r2 = self.publisher.publish(self.config, base_path, folder, content)
 
                 # Volvemos al hilo principal para tocar la UI
-                GLib.idle_add(self.on_azure_response, r1, r2)
+                GLib.idle_add(self.on_azure_response, r1, r2, folder, on_done, content)
             except Exception as e:
-                GLib.idle_add(self.on_azure_error, str(e))
+                GLib.idle_add(self.on_azure_error, str(e), on_done, folder)
 
         threading.Thread(target=thread_target, daemon=True).start()
 
-    def on_azure_response(self, r1, r2):
+    def on_azure_response(self, r1, r2, folder=None, on_done=None, content=None):
         self.set_busy(False)
-        if r1.ok and r2.ok:
-            logger.info(f"Publicación exitosa en Azure para la carpeta: {self.current_folder}")
+        ok = r1.ok and r2.ok
+        if ok:
+            logger.info(f"Publicación exitosa en Azure para la carpeta: {folder}")
+            self.watcher.mark_published(folder, content)
             self.show_toast("🚀 Publicado con éxito")
         else:
+            self.watcher.publish_failed(folder)
             # Capturamos el detalle del error para el log
             msg = f"Error en Azure. PR: {r1.status_code}, WI: {r2.status_code}. Respuestas: {r1.text[:100]} | {r2.text[:100]}"
             logger.warning(msg)
             self.show_toast("⚠️ Error de Azure")
+        if on_done:
+            on_done(ok)
+
+    def ui_sync_replies(self, action: Any, param: Any) -> None:
+        """Trae en segundo plano las respuestas nuevas de los hilos de PR de cada carpeta."""
+        base_path = self.config.get("base_path", os.getcwd())
+        folders: List[str] = self.storage.get_valid_folders(base_path)
+        if not folders:
+            return
+        self.set_busy(True)
+
+        import threading
+
+        def thread_target():
+            results = self.sync.sync_all(self.config, base_path, folders)
+            GLib.idle_add(self.on_sync_finished, results)
 
-    def on_azure_error(self, error_msg):
+        threading.Thread(target=thread_target, daemon=True).start()
+
+    def on_sync_finished(self, results: Dict[str, int]) -> None:
         self.set_busy(False)
+        new_replies = sum(n for n in results.values() if n > 0)
+        failed = [f for f, n in results.items() if n < 0]
+        logger.info(f"Sincronización terminada: {new_replies} respuestas nuevas, {len(failed)} carpetas con error")
+        if failed:
+            self.show_toast(f"⚠️ {new_replies} respuestas nuevas, {len(failed)} carpetas con error")
+        else:
+            self.show_toast(f"🔄 {new_replies} respuestas nuevas")
+
+    def on_azure_error(self, error_msg, on_done=None, folder=None):
+        self.set_busy(False)
+        self.watcher.publish_failed(folder)
         logger.error(f"Fallo en la comunicación con Azure: {error_msg}")
         self.show_toast(f"❌ Error de red: {error_msg}")
+        if on_done:
+            on_done(False)
+
+    def ui_publish_pending(self, action: Any, param: Any) -> None:
+        """Publica todas las carpetas sin publicar, en paralelo entre perfiles, tras confirmar."""
+        base_path = self.config.get("base_path", os.getcwd())
+        if base_path in self.reconciling:
+            # El índice aún no refleja el disco: "sin pendientes" podría ser falso
+            self.show_toast("⏳ Actualizando la lista de carpetas, intenta en un momento")
+            return
+        folders: List[str] = self.storage.list_folders(base_path, unpublished_only=True)
+        if not folders:
+            self.show_toast("✅ No hay carpetas pendientes")
+            return
+
+        dialog = Adw.MessageDialog(
+            transient_for=self.window,
+            heading="Publicar pendientes",
+            body=f"Se publicarán {len(folders)} carpetas en sus PRs y Work Items."
+        )
+        dialog.add_response("cancel", "Cancelar")
+        dialog.add_response("publish", "Publicar")
+        dialog.set_response_appearance("publish", Adw.ResponseAppearance.SUGGESTED)
+
+        def on_response(dialog: Any, response: str) -> None:
+            if response != "publish":
+                return
+            self.set_busy(True)
+
+            import threading
+
+            def thread_target():
+                results = self.publisher.publish_many(self.config, base_path, folders)
+                GLib.idle_add(self.on_publish_pending_finished, results)
+
+            threading.Thread(target=thread_target, daemon=True).start()
+
+        dialog.connect("response", on_response)
+        dialog.present()
+
+    def on_publish_pending_finished(self, results: Dict[str, Any]) -> None:
+        self.set_busy(False)
+        published = [folder for folder, result in results.items()
+                     if not isinstance(result, Exception) and result[0].ok and result[1].ok]
+        for folder in published:
+            self.watcher.mark_published(folder)
+        failed = len(results) - len(published)
+        logger.info(f"Publicación en lote: {len(published)} publicadas, {failed} con error")
+        self.show_toast(f"🚀 {len(published)} publicadas" + (f", ⚠️ {failed} con error" if failed else ""))
+        self.refresh_folder_list()
 
     def ui_create_documentation(self, btn: Any) -> None:
         try:
@@ -563,7 +1273,8 @@ class AzureDevOpsApp(Adw.Application):
             data: Dict[str, str] = {
                 "repository_id": self.repo_entry.get_text(),
                 "pull_request_id": self.pr_entry.get_text(),
-                "work_item_id": self.wi_entry.get_text()
+                "work_item_id": self.wi_entry.get_text(),
+                "profile": self.selected_doc_profile() or profiles.DEFAULT_PROFILE
             }
 
             # PASAMOS los 3 argumentos
@@ -591,18 +1302,30 @@ class AzureDevOpsApp(Adw.Application):
         themes = ["Sistema", "Claro", "Oscuro"]
         selected_theme = themes[self.theme_row.get_selected()]
 
-        self.config = {
+        profile_name = self.profile_name_entry.get_text().strip() or profiles.DEFAULT_PROFILE
+        profile_data = {
             "organization": self.org_entry.get_text(),
             "project": self.proj_entry.get_text(),
             "pat": self.pat_entry.get_text(),
+        }
+        self.config = {
+            **profiles.save_profile(self.config, profile_name, profile_data,
+                                    make_default=self.default_profile_row.get_active()),
             "base_path": new_path,
-            "theme": selected_theme # GUARDAR EN EL DICCIONARIO
+            "theme": selected_theme, # GUARDAR EN EL DICCIONARIO
+            "watch": self.watch_row.get_active(),
+            "watch_min_interval": int(self.watch_interval_row.get_value())
         }
 
         self.storage.save_json(self.configurations.global_config_file, self.config)
+        self.fill_profile_rows(profile_name)
+        # Con otra organización, proyecto o PAT el mismo nombre de perfil apunta a otros recursos
+        self.refreshed_profiles.discard(profile_name)
 
         # APLICAR EL TEMA INMEDIATAMENTE SIN REINICIAR
         self.apply_stored_theme()
+        self.apply_watch_mode()
+        self.reconcile_workspace()
 
         self.show_toast("💾 Configuración guardada")
         self.refresh_folder_list()
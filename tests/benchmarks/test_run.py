@@ -0,0 +1,27 @@
+from benchmarks.run import find_regressions
+
+
+def test_find_regressions_flags_only_cases_over_threshold():
+    """Solo se reportan los casos cuya mediana supera el umbral sobre la línea base."""
+    baseline = {"fast": {"median": 1.0}, "slow": {"median": 1.0}}
+    current = {"fast": {"median": 1.1}, "slow": {"median": 1.5}, "new": {"median": 9.0}}
+
+    regressions = find_regressions(current, baseline, threshold=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow")
+
+
+def test_compare_without_baseline_fails(tmp_path):
+    """Sin línea base el control no puede pasar."""
+    from benchmarks.run import main
+
+    assert main(["post_to_wi_body_small", "--repeat", "1", "--compare", "--baseline", str(tmp_path / "none.json")]) == 1
+
+
+def test_committed_baseline_covers_all_cases():
+    import json
+    from benchmarks.cases import CASES
+    from benchmarks.run import BASELINE_FILE
+
+    assert set(json.loads(BASELINE_FILE.read_text())) == set(CASES)
@@ -1,6 +1,8 @@
+import time
 import pytest
 from unittest.mock import patch, MagicMock
 from src.core.azure_client import AzureClient
+from src.core.rate_limit import Throttled
 
 
 @pytest.fixture
@@ -31,7 +33,7 @@ def test_get_auth_header(client):
     assert "Authorization" in header
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_post_to_pr_payload(mock_post, client, global_config):
     """Verifica que el POST al Pull Request envíe la URL y el JSON correctos."""
     # Configuración del mock
@@ -57,7 +59,7 @@ def test_post_to_pr_payload(mock_post, client, global_config):
     assert json_body["status"] == "active"
 
 
-@patch("requests.patch")
+@patch("requests.Session.patch")
 def test_post_to_wi_markdown_conversion(mock_patch, client, global_config):
     """Verifica la conversión de Markdown a HTML al enviar a Work Items."""
     mock_patch.return_value.status_code = 200
@@ -81,7 +83,7 @@ def test_post_to_wi_markdown_conversion(mock_patch, client, global_config):
 
 def test_post_to_pr_auth_headers(client, global_config):
     """Verifica que se inyecten los headers de autenticación en la petición."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         doc_config = {"repository_id": "r", "pull_request_id": "1"}
         client.post_to_pr(global_config, doc_config, "...")
 
@@ -89,3 +91,107 @@ def test_post_to_pr_auth_headers(client, global_config):
         assert "Authorization" in headers
         assert "Basic" in headers["Authorization"]
         assert headers["Content-Type"] == "application/json"
+
+
+@patch("requests.Session.get")
+def test_iter_pages_follows_continuation_token(mock_get, client):
+    """Cada página se entrega al llegar y se sigue el continuation token."""
+    first, second = MagicMock(), MagicMock()
+    first.json.return_value = {"value": [{"name": "a"}]}
+    first.headers = {"x-ms-continuationtoken": "tok"}
+    second.json.return_value = {"value": [{"name": "b"}]}
+    second.headers = {}
+    mock_get.side_effect = [first, second]
+
+    pages = list(client.iter_pages("https://example/repos", "pat"))
+
+    assert pages == [[{"name": "a"}], [{"name": "b"}]]
+    assert mock_get.call_args_list[1][1]["params"] == {"continuationToken": "tok"}
+
+
+@patch("requests.Session.get")
+def test_iter_pages_uses_skip_without_token(mock_get, client):
+    """Sin continuation token se pagina con $top/$skip hasta una página incompleta."""
+    full, partial = MagicMock(headers={}), MagicMock(headers={})
+    full.json.return_value = {"value": [{"id": 1}, {"id": 2}]}
+    partial.json.return_value = {"value": [{"id": 3}]}
+    mock_get.side_effect = [full, partial]
+
+    pages = list(client.iter_pages("https://example/prs", "pat", page_size=2))
+
+    assert len(pages) == 2
+    assert mock_get.call_args_list[1][1]["params"] == {"$top": 2, "$skip": 2}
+
+
+@patch("requests.Session.patch")
+def test_custom_base_url(mock_patch, global_config):
+    """Permite apuntar el cliente a un servidor distinto de dev.azure.com."""
+    AzureClient(base_url="http://127.0.0.1:8080/").post_to_wi(global_config, {"work_item_id": "1"}, "x")
+
+    assert mock_patch.call_args[0][0].startswith("http://127.0.0.1:8080/my_org/my_project/")
+
+
+@patch("requests.Session.post")
+def test_throttled_request_is_retried(mock_post, client, global_config):
+    """Un 429 con Retry-After se reintenta después de la pausa indicada."""
+    throttled = MagicMock(status_code=429, ok=False, headers={"Retry-After": "0"})
+    accepted = MagicMock(status_code=200, ok=True, headers={})
+    mock_post.side_effect = [throttled, accepted]
+
+    response = client.post_to_pr(global_config, {"repository_id": "r", "pull_request_id": "1"}, "x")
+
+    assert response is accepted
+    assert mock_post.call_count == 2
+
+
+@patch("requests.Session.post")
+def test_long_retry_after_is_returned_to_caller(mock_post, client, global_config):
+    throttled = MagicMock(status_code=503, ok=False, headers={"Retry-After": "3600"})
+    mock_post.return_value = throttled
+
+    response = client.post_to_pr(global_config, {"repository_id": "r", "pull_request_id": "1"}, "x")
+
+    assert response is throttled
+    # La siguiente petición del perfil falla al instante en lugar de dormir una hora
+    start = time.monotonic()
+    with pytest.raises(Throttled):
+        client.post_to_wi(global_config, {"work_item_id": "1"}, "x")
+    assert time.monotonic() - start < 1
+    assert mock_post.call_count == 1
+
+
+@patch("requests.Session.post")
+def test_throttled_profile_does_not_block_others(mock_post, client, global_config):
+    """La pausa de una organización no frena las peticiones de otra."""
+    mock_post.return_value = MagicMock(status_code=200, ok=True, headers={})
+    client.budget_for("my_org").max_wait = None
+    client.budget_for("my_org").pause(60)
+    other = {**global_config, "organization": "otra", "profile": "cliente"}
+
+    start = time.monotonic()
+    response = client.post_to_pr(other, {"repository_id": "r", "pull_request_id": "1"}, "x")
+
+    assert response.ok
+    assert time.monotonic() - start < 1
+    assert client.budget_for("my_org").remaining_pause() > 50
+
+
+def test_each_profile_gets_its_own_session(client):
+    a = client.session_for("cliente_a")
+
+    assert client.session_for("cliente_a") is a
+    assert client.session_for("cliente_b") is not a
+    assert client.budget_for("cliente_a") is not client.budget_for("cliente_b")
+
+
+def test_import_does_not_load_network_modules():
+    """Importar el cliente no debe cargar requests ni markdown (se cargan al primer uso)."""
+    import sys
+    import pathlib
+    import subprocess
+
+    code = "import sys, src.core.azure_client; print('requests' in sys.modules, 'markdown' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=pathlib.Path(__file__).parents[2])
+
+    assert result.stdout.strip() == "False False"
@@ -81,23 +81,96 @@ def test_create_doc_folder_already_exists_raises_error(manager, tmp_path):
 # --- TESTS DE LISTADO Y FILTRADO ---
 
 
+def make_doc(base_path, *parts):
+    path = os.path.join(base_path, *parts)
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "test_config.json"), "w") as f: f.write("{}")
+    return path
+
+
 def test_get_valid_folders_filtering(manager, mock_config, tmp_path):
-    """Verifica que ignore carpetas ocultas y las definidas en ignore_folders."""
+    """Verifica que ignore carpetas ocultas, las definidas en ignore_folders y las que no son documentación."""
     base_path = str(tmp_path)
 
     # Crear escenarios
-    os.makedirs(os.path.join(base_path, "valid_one"))
-    os.makedirs(os.path.join(base_path, "valid_two"))
-    os.makedirs(os.path.join(base_path, "venv"))           # En ignore_folders
-    os.makedirs(os.path.join(base_path, "secret_folder")) # En ignore_folders
-    os.makedirs(os.path.join(base_path, ".git"))          # Empieza con punto
+    make_doc(base_path, "valid_one")
+    make_doc(base_path, "valid_two")
+    make_doc(base_path, "venv")                           # En ignore_folders
+    make_doc(base_path, "secret_folder")                  # En ignore_folders
+    make_doc(base_path, ".git")                           # Empieza con punto
+    os.makedirs(os.path.join(base_path, "sin_config"))    # Sin doc_config_file
     with open(os.path.join(base_path, "file.txt"), "w") as f: f.write("") # Es un archivo
 
     folders = manager.get_valid_folders(base_path)
 
-    assert len(folders) == 2
-    assert "valid_one" in folders
-    assert "valid_two" in folders
-    assert "venv" not in folders
-    assert ".git" not in folders
-    assert "file.txt" not in folders
+    assert folders == ["valid_one", "valid_two"]
+
+
+def test_get_valid_folders_is_recursive(manager, tmp_path):
+    """Encuentra carpetas anidadas (equipo/sprint/feature) y no entra en las de documentación."""
+    base_path = str(tmp_path)
+    make_doc(base_path, "team", "sprint_1", "login")
+    make_doc(base_path, "team", "sprint_2", "pagos")
+    make_doc(base_path, "team", "sprint_2", "pagos", "adjuntos")  # Dentro de otra carpeta de documentación
+    make_doc(base_path, "team", "venv", "paquete")                # venv ignorado a cualquier profundidad
+
+    assert manager.get_valid_folders(base_path) == ["team/sprint_1/login", "team/sprint_2/pagos"]
+
+
+def test_get_valid_folders_honors_ignore_file(manager, tmp_path):
+    base_path = str(tmp_path)
+    make_doc(base_path, "archivo", "2023", "viejo")
+    make_doc(base_path, "archivo", "2024", "vigente")
+    make_doc(base_path, "borradores", "idea")
+    with open(os.path.join(base_path, ".azure_posterignore"), "w") as f:
+        f.write("# Histórico\n/archivo/*\n!/archivo/2024\nborradores/\n")
+
+    assert manager.get_valid_folders(base_path) == ["archivo/2024/vigente"]
+
+
+def test_get_valid_folders_follows_symlinks_once(manager, tmp_path):
+    """Los enlaces a carpetas fuera de la ruta se siguen; los ciclos y los enlaces internos no duplican nada."""
+    base_path = str(tmp_path / "docs")
+    external = tmp_path / "compartido"
+    make_doc(base_path, "equipo", "login")
+    make_doc(str(external), "pagos")
+    os.symlink(external, os.path.join(base_path, "compartido"))
+    os.symlink(external, os.path.join(base_path, "equipo", "otra_vez"))            # Mismo destino: se sigue una vez
+    os.symlink(tmp_path, os.path.join(str(external), "ciclo"))                     # Vuelve a un ancestro
+    os.symlink(os.path.join(base_path, "equipo"), os.path.join(base_path, "alias"))  # Apunta dentro de la ruta
+
+    assert manager.get_valid_folders(base_path) == ["compartido/pagos", "equipo/login"]
+
+# --- TESTS DEL ÍNDICE ---
+
+
+def test_writes_keep_index_in_sync(mock_config, tmp_path):
+    """Crear la carpeta, guardar su config y su Markdown actualiza el índice."""
+    from src.core.workspace_index import WorkspaceIndex, hash_text
+
+    index = WorkspaceIndex(":memory:")
+    manager = ConfigManager(configs=mock_config, index=index)
+    base_path = str(tmp_path)
+
+    manager.create_doc_folder(base_path, "Doc", {"pull_request_id": "5"})
+    manager.save_doc_config(base_path, "Doc", {"pull_request_id": "6"})
+    manager.save_markdown(base_path, "Doc", "texto")
+
+    assert index.folders_for_pr(base_path, "6") == ["Doc"]
+    assert index.get_folder(base_path, "Doc")["content_hash"] == hash_text("texto")
+    assert manager.list_folders(base_path) == ["Doc"]
+
+
+def test_list_folders_before_first_reconcile(mock_config, tmp_path):
+    """Con el índice vacío no se recorre el disco ni se reportan carpetas como pendientes."""
+    from src.core.workspace_index import WorkspaceIndex
+
+    manager = ConfigManager(configs=mock_config, index=WorkspaceIndex(":memory:"))
+    base_path = str(tmp_path)
+    make_doc(base_path, "nueva")
+
+    assert manager.list_folders(base_path, unpublished_only=True) == []
+    assert manager.list_folders(base_path) == []
+
+    manager.reconcile_index(base_path)
+    assert manager.list_folders(base_path, unpublished_only=True) == ["nueva"]
@@ -0,0 +1,75 @@
+import pytest
+import os
+from unittest.mock import MagicMock
+from src.core.history import ObjectStore, DocumentHistory
+from src.core.workspace_index import WorkspaceIndex, hash_text
+from src.core.constants import AppConfig
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    return AppConfig(
+        app_id="test_app",
+        config_dir=tmp_path,
+        global_config_file=tmp_path / "global.json",
+        md_file="content.md",
+        doc_config_file="config.json",
+        ignore_folders=set()
+    )
+
+
+def count_objects(root):
+    return sum(len(files) for _, _, files in os.walk(root))
+
+# --- TESTS ---
+
+
+def test_store_roundtrip_is_compressed(tmp_path):
+    store = ObjectStore(str(tmp_path / "objects"))
+    text = "# Título\n\n" + "línea repetida\n" * 500
+
+    digest = store.put(text)
+
+    assert digest == hash_text(text)
+    assert store.get(digest) == text
+    assert os.path.getsize(store.path(digest)) < len(text.encode("utf-8")) / 10
+
+
+def test_store_deduplicates_identical_content(tmp_path):
+    """Publicar lo mismo (en la misma u otra carpeta) no agrega objetos."""
+    store = ObjectStore(str(tmp_path / "objects"))
+
+    store.put("uno")
+    store.put("dos")
+    store.put("uno")
+
+    assert count_objects(store.root) == 2
+
+
+def test_store_missing_object_raises_key_error(tmp_path):
+    with pytest.raises(KeyError):
+        ObjectStore(str(tmp_path)).get(hash_text("nunca guardado"))
+
+
+def test_versions_mark_available_content(mock_config, tmp_path):
+    index = WorkspaceIndex(":memory:")
+    history = DocumentHistory(mock_config, index)
+    base_path = str(tmp_path)
+
+    digest = history.snapshot(base_path, "v2")
+    index.record_publish(base_path, "doc", hash_text("v1"), 200, 200, published_at=1)
+    index.record_publish(base_path, "doc", digest, 200, 200, published_at=2)
+
+    versions = history.versions(base_path, "doc")
+
+    assert [v["available"] for v in versions] == [True, False]
+    assert history.load(base_path, versions[0]["content_hash"]) == "v2"
+    assert os.path.isdir(os.path.join(base_path, ".azure_poster", "objects"))
+
+
+def test_diff_against_current_text():
+    diff = DocumentHistory.diff("a\nb\n", "a\nc\n")
+
+    assert "-b" in diff.splitlines()
+    assert "+c" in diff.splitlines()
+    assert DocumentHistory.diff("igual", "igual") == ""
@@ -0,0 +1,45 @@
+import pytest
+from src.core.ignore_rules import IgnoreRules, compile_pattern
+
+
+@pytest.mark.parametrize("pattern, path, expected", [
+    ("node_modules/", "node_modules", True),
+    ("node_modules/", "app/node_modules", True),
+    ("/build", "build", True),
+    ("/build", "app/build", False),
+    ("docs/*/tmp", "docs/v1/tmp", True),
+    ("docs/*/tmp", "docs/v1/v2/tmp", False),
+    ("docs/**/tmp", "docs/v1/v2/tmp", True),
+    ("**/cache", "a/b/cache", True),
+    ("sprint_?", "team/sprint_1", True),
+    ("sprint_[0-4]", "sprint_7", False),
+    ("*.bak", "viejo.bak", True),
+    ("# comentario", "# comentario", False),
+])
+def test_patterns(pattern, path, expected):
+    assert IgnoreRules([pattern]).ignored(path) is expected
+
+
+def test_last_matching_rule_wins():
+    rules = IgnoreRules(["archivo/*", "!archivo/2024", "archivo/2024"])
+    assert rules.ignored("archivo/2023")
+    assert rules.ignored("archivo/2024")
+
+    rules = IgnoreRules(["archivo/*", "!archivo/2024"])
+    assert not rules.ignored("archivo/2024")
+
+
+def test_blank_and_comment_lines_are_skipped():
+    assert compile_pattern("   ") is None
+    assert compile_pattern("# nada") is None
+    assert compile_pattern("\\#literal") == (r"(?:.*/)?\#literal", False)
+
+
+def test_workspace_rules_include_defaults(tmp_path):
+    (tmp_path / ".ignore").write_text("tmp/\n")
+    rules = IgnoreRules.for_workspace(str(tmp_path), ".ignore", {"venv"})
+
+    assert rules.ignored(".git")
+    assert rules.ignored("team/venv")
+    assert rules.ignored("a/tmp")
+    assert not rules.ignored("team")
@@ -0,0 +1,79 @@
+import json
+import logging
+import pytest
+from src.core.log_handlers import SizeAndTimeRotatingFileHandler, JsonLinesFormatter, start_queued_logging
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Restaura los handlers del logger raíz al terminar la prueba."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def make_record(msg="hola"):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+# --- TESTS ---
+
+
+def test_rotates_by_size(tmp_path):
+    log_file = tmp_path / "app.log"
+    handler = SizeAndTimeRotatingFileHandler(str(log_file), maxBytes=50, interval=0, backupCount=2)
+    for _ in range(5):
+        handler.emit(make_record("x" * 30))
+    handler.close()
+
+    assert (tmp_path / "app.log.1").exists()
+    assert not (tmp_path / "app.log.3").exists()
+
+
+def test_rotates_by_time(tmp_path):
+    log_file = tmp_path / "app.log"
+    handler = SizeAndTimeRotatingFileHandler(str(log_file), maxBytes=0, interval=3600)
+    handler.emit(make_record())
+    handler.rollover_at = 0  # simula que pasó el intervalo
+    handler.emit(make_record())
+    handler.close()
+
+    assert (tmp_path / "app.log.1").exists()
+
+
+def test_json_lines_formatter():
+    entry = json.loads(JsonLinesFormatter().format(make_record("mensaje")))
+
+    assert entry["message"] == "mensaje"
+    assert entry["level"] == "INFO"
+
+
+def test_queued_logging_writes_from_listener(tmp_path, restore_root_logger):
+    """Los registros pasan por la cola y el listener los escribe al detenerse."""
+    log_file = tmp_path / "app.log"
+    listener = start_queued_logging(str(log_file), structured=True)
+    logging.getLogger("src.ui.app").info("guardado")
+    listener.stop()
+
+    lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert lines[-1]["message"] == "guardado"
+    assert isinstance(logging.getLogger().handlers[0], logging.handlers.QueueHandler)
+
+
+def test_queued_exception_keeps_structured_traceback(tmp_path, restore_root_logger):
+    """El traceback cruza la cola aparte del mensaje y termina en el campo `exc`."""
+    log_file = tmp_path / "app.log"
+    listener = start_queued_logging(str(log_file), structured=True)
+    try:
+        raise ValueError("config rota")
+    except ValueError:
+        logging.getLogger("src.core").exception("No se pudo leer %s", "config.json")
+    listener.stop()
+
+    entry = json.loads(log_file.read_text().splitlines()[-1])
+    assert entry["message"] == "No se pudo leer config.json"
+    assert "ValueError: config rota" in entry["exc"]
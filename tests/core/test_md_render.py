@@ -0,0 +1,45 @@
+import pytest
+import markdown
+from unittest.mock import patch
+from src.core.md_render import IncrementalRenderer, split_blocks
+
+
+DOCS = [
+    "# Título\n\nPárrafo **uno**.\n\n- a\n- b\n\n- c\n\n1. x\n2. y\n\n    code\n\n    more code\n\nfin",
+    "Setext\n======\n\ntexto\n---\n\n> cita\n\n> sigue\n\n* item\n\n    continuación\n\n* otro",
+    "```python\nprint(1)\n\nprint(2)\n```\n\nhola",
+    "- a\n\n  b\n- c\n\npárrafo\n\n1. uno\n\n3. tres",
+    "Ver [doc][ref].\n\n[ref]: https://example.com",
+    "<div>\n\nbloque html\n\n</div>\n\ntexto",
+    "- a\n\n\n- b",
+    "    x\n\n\n    y",
+    "> a\n\n\n> b",
+    "1. a\n\n\n2. b",
+    "párrafo\n\n \n\t\n\notro",
+    "# h\n- a\n\n- b",
+    "párrafo\n> q\n\n> r",
+    "",
+]
+
+# --- TESTS ---
+
+
+@pytest.mark.parametrize("doc", DOCS)
+def test_render_matches_full_markdown(doc):
+    """La vista previa debe mostrar exactamente lo que `post_to_wi` envía."""
+    assert IncrementalRenderer().render(doc) == markdown.markdown(doc)
+
+
+def test_split_keeps_loose_lists_together():
+    assert split_blocks("# h\n\n- a\n\n- b\n\n    c\n\nfin") == ["# h", "- a\n\n- b\n\n    c", "fin"]
+
+
+def test_only_edited_blocks_are_rendered_again():
+    renderer = IncrementalRenderer()
+    doc = "\n\n".join(f"Párrafo {i}" for i in range(50))
+    renderer.render(doc)
+
+    with patch("markdown.markdown", wraps=markdown.markdown) as spy:
+        renderer.render(doc.replace("Párrafo 7", "Párrafo siete"))
+
+    assert spy.call_count == 1
@@ -0,0 +1,50 @@
+import pytest
+from src.core.metrics import Metrics
+
+
+@pytest.fixture
+def metrics():
+    return Metrics()
+
+# --- TESTS ---
+
+
+def test_observe_groups_by_labels(metrics):
+    """Cada combinación de etiquetas tiene su propio histograma."""
+    metrics.observe("http_request_seconds", 0.02, endpoint="pr_threads", status="200")
+    metrics.observe("http_request_seconds", 0.04, endpoint="pr_threads", status="200")
+    metrics.observe("http_request_seconds", 1.5, endpoint="pr_threads", status="429")
+
+    series = metrics.snapshot()["http_request_seconds"]
+
+    assert [(s["labels"]["status"], s["count"]) for s in series] == [("200", 2), ("429", 1)]
+    assert series[1]["max"] == 1.5
+
+
+def test_span_records_elapsed_time(metrics):
+    with metrics.span("file_io_seconds", op="read"):
+        pass
+
+    assert metrics.snapshot()["file_io_seconds"][0]["count"] == 1
+
+
+def test_quantile_estimate_is_within_bucket(metrics):
+    for _ in range(100):
+        metrics.observe("latency", 0.03)
+
+    p50 = metrics.snapshot()["latency"][0]["p50"]
+
+    assert 0.025 <= p50 <= 0.05
+
+
+def test_prometheus_export_is_cumulative(metrics):
+    """Los buckets exportados son acumulativos y terminan en +Inf con el total."""
+    metrics.observe("latency", 0.001, endpoint="x")
+    metrics.observe("latency", 20.0, endpoint="x")
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE azure_poster_latency histogram" in text
+    assert 'azure_poster_latency_bucket{endpoint="x",le="0.005"} 1' in text
+    assert 'azure_poster_latency_bucket{endpoint="x",le="+Inf"} 2' in text
+    assert 'azure_poster_latency_count{endpoint="x"} 2' in text
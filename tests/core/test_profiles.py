@@ -0,0 +1,39 @@
+import pytest
+from src.core import profiles
+
+
+@pytest.fixture
+def legacy_config():
+    return {"organization": "org", "project": "proj", "pat": "pat", "base_path": "/docs"}
+
+# --- TESTS ---
+
+
+def test_legacy_config_is_a_single_default_profile(legacy_config):
+    resolved = profiles.resolve(legacy_config)
+
+    assert resolved["profile"] == profiles.DEFAULT_PROFILE
+    assert resolved["organization"] == "org"
+    assert resolved["base_path"] == "/docs"
+
+
+def test_doc_folder_uses_its_profile(legacy_config):
+    config = profiles.save_profile(legacy_config, "cliente", {"organization": "otra", "project": "p", "pat": "t"})
+
+    assert profiles.for_doc(config, {"profile": "cliente"})["organization"] == "otra"
+    assert profiles.for_doc(config, {})["organization"] == "org"
+    with pytest.raises(KeyError):
+        profiles.for_doc(config, {"profile": "borrado"})
+
+
+def test_default_profile_is_mirrored_at_top_level(legacy_config):
+    """El perfil por defecto se replica arriba para quien lee el formato anterior."""
+    config = profiles.save_profile(legacy_config, "cliente", {"organization": "otra", "project": "p", "pat": "t"},
+                                   make_default=True)
+
+    assert config["organization"] == "otra"
+    assert profiles.profile_names(config) == ["cliente", "default"]
+
+    config = profiles.remove_profile(config, "cliente")
+    assert config["default_profile"] == "default"
+    assert config["organization"] == "org"
@@ -0,0 +1,68 @@
+import time
+import threading
+from src.core.profiling import Profiler, StallWatchdog, profiled, enabled_from_env
+
+
+def busy_function():
+    return sum(i * i for i in range(20000))
+
+
+class Screen:
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    @profiled("refresh")
+    def refresh(self):
+        with self.profiler.section("inner"):
+            return busy_function()
+
+# --- TESTS ---
+
+
+def test_disabled_profiler_writes_nothing(tmp_path):
+    profiler = Profiler(tmp_path / "profiles")
+
+    assert Screen(profiler).refresh() == busy_function()
+    assert not (tmp_path / "profiles").exists()
+
+
+def test_section_writes_dump_and_summary(tmp_path):
+    profiler = Profiler(tmp_path, enabled=True)
+    try:
+        Screen(profiler).refresh()
+    finally:
+        profiler.disable()
+
+    # La sección anidada queda dentro del perfil exterior
+    assert len(list(tmp_path.glob("*-refresh.prof"))) == 1
+    assert not list(tmp_path.glob("*-inner.*"))
+    summary = next(tmp_path.glob("*-refresh.txt")).read_text()
+    assert "busy_function" in summary
+    assert "Memoria" in summary
+
+
+def test_env_flag(monkeypatch):
+    monkeypatch.setenv("AZURE_POSTER_PROFILE", "1")
+    assert enabled_from_env()
+    monkeypatch.setenv("AZURE_POSTER_PROFILE", "0")
+    assert not enabled_from_env()
+
+
+def test_watchdog_samples_blocked_thread():
+    """Un bloqueo mayor al umbral se reporta con las pilas del hilo vigilado."""
+    stalls = []
+    watchdog = StallWatchdog(lambda duration, samples: stalls.append((duration, samples)),
+                             threshold=0.05, interval=0.01, thread_id=threading.get_ident())
+    watchdog.start()
+    try:
+        watchdog.beat()
+        time.sleep(0.2)  # el "main loop" no late
+        watchdog.beat()
+        watchdog.beat()  # sin bloqueo: no se reporta
+    finally:
+        watchdog.stop()
+
+    assert len(stalls) == 1
+    duration, samples = stalls[0]
+    assert duration >= 0.2
+    assert any("test_watchdog_samples_blocked_thread" in stack for stack in samples)
@@ -0,0 +1,165 @@
+import pytest
+import os
+import json
+from unittest.mock import MagicMock
+from src.core.publisher import Publisher
+from src.core.constants import AppConfig
+
+GLOBAL_CONFIG = {"organization": "org", "project": "proj", "pat": "pat"}
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    return AppConfig(
+        app_id="test_app",
+        config_dir=tmp_path,
+        global_config_file=tmp_path / "global.json",
+        md_file="content.md",
+        doc_config_file="config.json",
+        ignore_folders=set()
+    )
+
+
+@pytest.fixture
+def folder(tmp_path):
+    path = tmp_path / "doc"
+    path.mkdir()
+    (path / "config.json").write_text(json.dumps({"repository_id": "r", "pull_request_id": "1", "work_item_id": "2"}))
+    (path / "content.md").write_text("# Guardado", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def base_path(folder):
+    return os.path.dirname(folder)
+
+
+@pytest.fixture
+def azure():
+    client = MagicMock()
+    client.post_to_pr.return_value.ok = True
+    client.post_to_pr.return_value.json.return_value = {"id": 55}
+    return client
+
+# --- TESTS ---
+
+
+def test_publish_uses_saved_content_by_default(mock_config, base_path, azure):
+    """Sin contenido explícito (p. ej. desde `--publish`) se publica el Markdown en disco."""
+    Publisher(mock_config, azure, MagicMock()).publish(GLOBAL_CONFIG, base_path, "doc")
+
+    assert azure.post_to_pr.call_args[0][2] == "# Guardado"
+    assert azure.post_to_wi.call_args[0][1]["work_item_id"] == "2"
+
+
+def test_publish_registers_created_thread(mock_config, folder, base_path, azure):
+    sync = MagicMock()
+
+    Publisher(mock_config, azure, sync).publish(GLOBAL_CONFIG, base_path, "doc", content="texto")
+
+    sync.register_thread.assert_called_once_with(folder, 55)
+    assert azure.post_to_pr.call_args[0][2] == "texto"
+
+
+def test_publish_is_recorded_in_index(mock_config, base_path, azure):
+    from src.core.workspace_index import WorkspaceIndex, hash_text
+
+    index = WorkspaceIndex(":memory:")
+    index.upsert_folder(base_path, "doc")
+    azure.post_to_pr.return_value.status_code = 200
+    azure.post_to_wi.return_value.status_code = 200
+
+    Publisher(mock_config, azure, MagicMock(), index=index).publish(GLOBAL_CONFIG, base_path, "doc")
+
+    history = index.publish_history(base_path, "doc")
+    assert history[0]["content_hash"] == hash_text("# Guardado")
+    assert index.list_folders(base_path, unpublished_only=True) == []
+
+
+def test_publish_snapshots_content_before_sending(mock_config, base_path, azure):
+    from src.core.history import DocumentHistory
+    from src.core.workspace_index import WorkspaceIndex, hash_text
+
+    index = WorkspaceIndex(":memory:")
+    index.upsert_folder(base_path, "doc")
+    history = DocumentHistory(mock_config, index)
+    azure.post_to_pr.side_effect = ConnectionError("sin red")
+
+    with pytest.raises(ConnectionError):
+        Publisher(mock_config, azure, MagicMock(), index=index, history=history).publish(
+            GLOBAL_CONFIG, base_path, "doc", content="borrador"
+        )
+
+    assert history.load(base_path, hash_text("borrador")) == "borrador"
+    # El intento fallido queda en el historial para poder restaurarlo, pero la carpeta sigue pendiente
+    [version] = history.versions(base_path, "doc")
+    assert version["available"] and version["pr_status"] is None and version["wi_status"] is None
+    assert index.list_folders(base_path, unpublished_only=True) == ["doc"]
+
+
+def test_publish_uses_folder_profile(mock_config, base_path, azure):
+    from src.core import profiles
+
+    config = profiles.save_profile(GLOBAL_CONFIG, "cliente", {"organization": "otra", "project": "p", "pat": "t"})
+    doc = os.path.join(base_path, "doc", "config.json")
+    with open(doc, "w") as f:
+        json.dump({"repository_id": "r", "pull_request_id": "1", "work_item_id": "2", "profile": "cliente"}, f)
+
+    Publisher(mock_config, azure, MagicMock()).publish(config, base_path, "doc")
+
+    assert azure.post_to_pr.call_args[0][0]["organization"] == "otra"
+    assert azure.post_to_pr.call_args[0][0]["profile"] == "cliente"
+
+
+def test_publish_many_isolates_profiles(mock_config, base_path, azure):
+    """Una organización lenta no retrasa la publicación en las demás; los fallos se devuelven por carpeta."""
+    import threading
+    from src.core import profiles
+
+    config = profiles.save_profile(GLOBAL_CONFIG, "lenta", {"organization": "lenta", "project": "p", "pat": "t"})
+    for name, profile in (("a", "lenta"), ("b", "default"), ("c", "default")):
+        path = os.path.join(base_path, name)
+        os.makedirs(path)
+        with open(os.path.join(path, "config.json"), "w") as f:
+            json.dump({"repository_id": "r", "pull_request_id": "1", "work_item_id": "2", "profile": profile}, f)
+
+    release = threading.Event()
+
+    def post_to_pr(global_config, doc_config, content):
+        if global_config["profile"] == "lenta":
+            assert release.wait(5)
+        return azure.post_to_pr.return_value
+
+    azure.post_to_pr.side_effect = post_to_pr
+    azure.post_to_wi.side_effect = [RuntimeError("falla"), MagicMock(), MagicMock()]
+    finished = []
+
+    def on_result(folder, result):
+        finished.append(folder)
+        if len(finished) == 2:
+            release.set()
+
+    results = Publisher(mock_config, azure, MagicMock()).publish_many(
+        config, base_path, ["a", "b", "c"], on_result=on_result
+    )
+
+    assert finished[-1] == "a"
+    assert sum(isinstance(r, Exception) for r in results.values()) == 1
+
+
+def test_throttled_pr_skips_work_item(mock_config, base_path, azure):
+    """Si Azure limita el PR no se envía el Work Item; el intento queda registrado sin estado de WI."""
+    from src.core.rate_limit import Throttled
+    from src.core.workspace_index import WorkspaceIndex
+
+    index = WorkspaceIndex(":memory:")
+    index.upsert_folder(base_path, "doc")
+    azure.profile_key.return_value = "default"
+    azure.post_to_pr.return_value = MagicMock(status_code=503, ok=False, headers={"Retry-After": "3600"})
+
+    with pytest.raises(Throttled):
+        Publisher(mock_config, azure, MagicMock(), index=index).publish(GLOBAL_CONFIG, base_path, "doc")
+
+    azure.post_to_wi.assert_not_called()
+    [attempt] = index.publish_history(base_path, "doc")
+    assert attempt["pr_status"] == 503 and attempt["wi_status"] is None
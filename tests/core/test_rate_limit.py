@@ -0,0 +1,50 @@
+import pytest
+from src.core.rate_limit import RateBudget, Throttled, retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+# --- TESTS ---
+
+
+def test_retry_after_only_applies_to_throttling():
+    assert retry_after(429, {"Retry-After": "5"}) == 5.0
+    assert retry_after(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert retry_after(200, {"Retry-After": "5", "X-RateLimit-Remaining": "0"}) == 5.0
+    assert retry_after(200, {"Retry-After": "5", "X-RateLimit-Remaining": "10"}) is None
+    assert retry_after(429, {}) is None
+
+
+def test_budget_waits_for_pause():
+    clock = FakeClock()
+    budget = RateBudget("org", clock=clock, sleep=clock.sleep)
+    budget.pause(2.5)
+
+    with budget as waited:
+        pass
+
+    assert waited == 2.5
+    assert clock.sleeps == [2.5]
+
+
+def test_budget_fails_fast_over_max_wait():
+    clock = FakeClock()
+    budget = RateBudget("org", max_wait=60, clock=clock, sleep=clock.sleep)
+    budget.pause(3600)
+
+    with pytest.raises(Throttled) as error:
+        with budget:
+            pass
+
+    assert clock.sleeps == []
+    assert error.value.seconds == 3600
@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import MagicMock
+from src.core.resource_index import ResourceIndex
+from src.core.constants import AppConfig
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    return AppConfig(
+        app_id="test_app",
+        config_dir=tmp_path,
+        global_config_file=tmp_path / "global.json",
+        md_file="content.md",
+        doc_config_file="config.json",
+        ignore_folders=set()
+    )
+
+
+@pytest.fixture
+def global_config():
+    return {"organization": "org", "project": "proj", "pat": "x"}
+
+
+@pytest.fixture
+def azure():
+    client = MagicMock()
+    client.list_repositories.return_value = iter([[{"name": "api"}], [{"name": "web"}]])
+    client.list_pull_requests.return_value = iter([[
+        {"pullRequestId": 12, "title": "Login", "repository": {"id": "guid-api", "name": "api"}},
+        {"pullRequestId": 13, "title": "Logo", "repository": {"id": "guid-web", "name": "web"}},
+    ]])
+    client.list_work_items.return_value = iter([[{"id": 99, "fields": {"System.Title": "Bug"}}]])
+    return client
+
+# --- TESTS ---
+
+
+def test_refresh_streams_pages(mock_config, azure, global_config):
+    """Cada página se entrega a `on_page` en cuanto llega."""
+    index = ResourceIndex(mock_config, azure)
+    received = []
+
+    index.refresh(global_config, on_page=lambda kind, entries: received.append((kind, len(entries))))
+
+    assert received == [("repositories", 1), ("repositories", 1), ("pull_requests", 2), ("work_items", 1)]
+
+
+def test_index_persists_and_lookup(mock_config, azure, global_config):
+    """Tras refrescar, un índice nuevo responde desde disco sin tocar la red."""
+    ResourceIndex(mock_config, azure).refresh(global_config)
+
+    index = ResourceIndex(mock_config, MagicMock())
+    index.load()
+
+    assert [e["id"] for e in index.lookup(global_config, "pull_requests", "logi")] == ["12"]
+    assert [e["id"] for e in index.lookup(global_config, "repositories", "")] == ["api", "web"]
+
+
+def test_refresh_drops_closed_pull_requests(mock_config, azure, global_config):
+    """Los PRs que ya no están activos salen del índice; los work items se fusionan."""
+    index = ResourceIndex(mock_config, azure)
+    index.refresh(global_config)
+
+    azure.list_repositories.return_value = iter([])
+    azure.list_pull_requests.return_value = iter([])
+    azure.list_work_items.return_value = iter([[{"id": 100, "fields": {}}]])
+    index.refresh(global_config)
+
+    assert index.entries(global_config, "pull_requests") == []
+    assert {e["id"] for e in index.entries(global_config, "work_items")} == {"99", "100"}
+    assert azure.list_work_items.call_args[1]["changed_since"]
+
+
+def test_pull_requests_filtered_by_repository(mock_config, azure, global_config):
+    """El selector de PRs solo ofrece los del repositorio elegido, por nombre o por id."""
+    index = ResourceIndex(mock_config, azure)
+    index.refresh(global_config)
+
+    assert [e["id"] for e in index.entries(global_config, "pull_requests", repository="API")] == ["12"]
+    assert [e["id"] for e in index.lookup(global_config, "pull_requests", "log", repository="guid-web")] == ["13"]
+    assert len(index.entries(global_config, "pull_requests")) == 2
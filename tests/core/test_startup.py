@@ -0,0 +1,23 @@
+from src.core.startup import StartupTimer
+
+
+def test_summary_lists_marks_with_deltas():
+    timer = StartupTimer()
+    timer.mark("import_ui")
+    timer.mark("first_frame")
+
+    summary = timer.summary()
+
+    assert summary.startswith("import_ui=")
+    assert "first_frame=" in summary and "(+" in summary
+
+
+def test_report_only_once(caplog):
+    timer = StartupTimer()
+    timer.mark("first_frame")
+
+    with caplog.at_level("INFO"):
+        timer.report()
+        timer.report()
+
+    assert len([r for r in caplog.records if r.message.startswith("Arranque")]) == 1
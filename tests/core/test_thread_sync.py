@@ -0,0 +1,99 @@
+import pytest
+import os
+import json
+from unittest.mock import MagicMock
+from src.core.thread_sync import ThreadSync, parse_azure_date
+from src.core.constants import AppConfig
+
+GLOBAL_CONFIG = {"organization": "org", "project": "proj", "pat": "pat"}
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    return AppConfig(
+        app_id="test_app",
+        config_dir=tmp_path,
+        global_config_file=tmp_path / "global.json",
+        md_file="content.md",
+        doc_config_file="config.json",
+        ignore_folders=set()
+    )
+
+
+@pytest.fixture
+def folder(tmp_path):
+    """Carpeta de documentación con un PR configurado."""
+    path = tmp_path / "doc"
+    path.mkdir()
+    (path / "config.json").write_text(json.dumps({"repository_id": "r", "pull_request_id": "1"}))
+    return str(path)
+
+
+def make_thread(thread_id, *comments):
+    return {
+        "id": thread_id,
+        "lastUpdatedDate": max(c["lastUpdatedDate"] for c in comments),
+        "comments": list(comments),
+    }
+
+
+def make_comment(comment_id, date, content="ok"):
+    return {"id": comment_id, "lastUpdatedDate": date, "content": content,
+            "commentType": "text", "author": {"displayName": "Ana"}}
+
+
+def read_replies(folder):
+    with open(os.path.join(folder, "replies.jsonl"), encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+# --- TESTS ---
+
+
+def test_parse_azure_date_handles_seven_digit_fraction():
+    """Azure devuelve hasta 7 decimales; deben ordenarse correctamente."""
+    assert parse_azure_date("2026-01-01T10:00:00.1234567Z") > parse_azure_date("2026-01-01T10:00:00.12Z")
+
+
+def test_sync_folder_is_incremental(mock_config, folder):
+    """La segunda sincronización solo agrega los comentarios posteriores al cursor."""
+    azure = MagicMock()
+    first = make_comment(1, "2026-01-01T10:00:00Z", "doc")
+    azure.get_pr_threads.return_value = [make_thread(7, first)]
+    sync = ThreadSync(mock_config, azure)
+
+    assert sync.sync_folder(GLOBAL_CONFIG, folder) == 1
+
+    reply = make_comment(2, "2026-01-02T10:00:00Z", "respuesta")
+    azure.get_pr_threads.return_value = [make_thread(7, first, reply)]
+    assert sync.sync_folder(GLOBAL_CONFIG, folder) == 1
+    assert sync.sync_folder(GLOBAL_CONFIG, folder) == 0
+
+    replies = read_replies(folder)
+    assert [r["comment"] for r in replies] == [1, 2]
+    assert replies[1]["content"] == "respuesta"
+
+
+def test_sync_folder_only_tracks_registered_threads(mock_config, folder):
+    """Si el hilo publicado está registrado, los demás hilos del PR se ignoran."""
+    azure = MagicMock()
+    azure.get_pr_threads.return_value = [
+        make_thread(7, make_comment(1, "2026-01-01T10:00:00Z")),
+        make_thread(8, make_comment(2, "2026-01-01T11:00:00Z")),
+    ]
+    sync = ThreadSync(mock_config, azure)
+    sync.register_thread(folder, 8)
+
+    sync.sync_folder(GLOBAL_CONFIG, folder)
+
+    assert [r["thread"] for r in read_replies(folder)] == [8]
+
+
+def test_sync_all_reports_failures(mock_config, folder, tmp_path):
+    """Una carpeta con error no detiene la sincronización de las demás."""
+    azure = MagicMock()
+    azure.get_pr_threads.side_effect = RuntimeError("boom")
+    sync = ThreadSync(mock_config, azure)
+
+    results = sync.sync_all(GLOBAL_CONFIG, str(tmp_path), ["doc"])
+
+    assert results == {"doc": -1}
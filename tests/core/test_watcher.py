@@ -0,0 +1,170 @@
+import queue
+import threading
+
+from gi.repository import Gio
+
+from src.core import constants, watcher
+from src.core.config_manager import ConfigManager
+from src.core.watcher import PublishThrottle, content_hash
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+# --- TESTS ---
+
+
+def test_unchanged_content_is_skipped():
+    throttle = PublishThrottle(min_interval=60, clock=FakeClock())
+    throttle.remember("doc", "abc")
+
+    assert throttle.decide("doc", "abc") is None
+
+
+def test_changed_content_publishes_immediately_first_time():
+    throttle = PublishThrottle(min_interval=60, clock=FakeClock())
+    throttle.remember("doc", "abc")
+
+    assert throttle.decide("doc", "def") == 0
+
+
+def test_min_interval_defers_next_publish():
+    """Tras publicar, un nuevo cambio espera lo que falte del intervalo mínimo."""
+    clock = FakeClock()
+    throttle = PublishThrottle(min_interval=60, clock=clock)
+    throttle.mark_published("doc", "v1")
+
+    clock.now += 20
+    assert throttle.decide("doc", "v2") == 40
+
+    clock.now += 40
+    assert throttle.decide("doc", "v2") == 0
+
+
+def test_content_hash(tmp_path):
+    md = tmp_path / "content.md"
+    md.write_text("hola")
+
+    assert content_hash(str(md)) == content_hash(str(md))
+    assert content_hash(str(tmp_path / "missing.md")) is None
+
+
+class FakeGLib:
+    SOURCE_REMOVE = False
+
+    def __init__(self):
+        self.timeouts = {}
+        self.idle = queue.Queue()
+
+    def timeout_add(self, delay_ms, callback):
+        source_id = len(self.timeouts) + 1
+        self.timeouts[source_id] = callback
+        return source_id
+
+    def source_remove(self, source_id):
+        self.timeouts.pop(source_id, None)
+
+    def idle_add(self, callback, *args):
+        self.idle.put((callback, args))
+
+
+class FakeFile:
+    def __init__(self, name):
+        self.name = name
+
+    def get_basename(self):
+        return self.name
+
+
+def make_watcher(tmp_path, monkeypatch):
+    monkeypatch.setattr(watcher, "GLib", FakeGLib())
+    configs = constants.AppConfig(
+        app_id="test_app",
+        config_dir=tmp_path,
+        global_config_file=tmp_path / "global.json",
+        md_file="content.md",
+        doc_config_file="config.json",
+        ignore_folders=set()
+    )
+    storage = ConfigManager(configs)
+    published = []
+    folder_watcher = watcher.FolderWatcher(configs, on_publish=published.append,
+                                           list_folders=storage.get_valid_folders, min_interval=60)
+    # Se evita `start()`: crea monitores de Gio reales
+    folder_watcher.base_path = str(tmp_path)
+    storage.on_markdown_write = folder_watcher.expect_write
+    (tmp_path / "doc").mkdir()
+    storage.save_markdown(str(tmp_path), "doc", "v1")
+    return folder_watcher, storage, published
+
+
+def fire_event(folder_watcher, folder="doc"):
+    md_file = folder_watcher.configs.md_file
+    folder_watcher._on_event(None, FakeFile(md_file), None, Gio.FileMonitorEvent.CHANGES_DONE_HINT, folder)
+    folder_watcher._flush()
+
+
+def test_own_save_does_not_publish(tmp_path, monkeypatch):
+    """Guardar, restaurar o el guardado previo a Ejecutar no deben publicar automáticamente."""
+    folder_watcher, storage, published = make_watcher(tmp_path, monkeypatch)
+
+    storage.save_markdown(str(tmp_path), "doc", "v2")
+    fire_event(folder_watcher)
+
+    assert published == []
+
+
+def test_external_edit_publishes(tmp_path, monkeypatch):
+    folder_watcher, storage, published = make_watcher(tmp_path, monkeypatch)
+
+    (tmp_path / "doc" / folder_watcher.configs.md_file).write_text("editado fuera", encoding="utf-8")
+    fire_event(folder_watcher)
+
+    assert published == ["doc"]
+
+
+def test_failed_auto_publish_is_retried(tmp_path, monkeypatch):
+    folder_watcher, storage, published = make_watcher(tmp_path, monkeypatch)
+    (tmp_path / "doc" / folder_watcher.configs.md_file).write_text("editado fuera", encoding="utf-8")
+    fire_event(folder_watcher)
+
+    # Mientras la publicación está en curso, otro evento no la duplica
+    fire_event(folder_watcher)
+    assert published == ["doc"]
+
+    folder_watcher.publish_failed("doc")
+    assert "doc" in folder_watcher._pending
+    folder_watcher.throttle.last_time["doc"] -= 60
+    folder_watcher._flush()
+    assert published == ["doc", "doc"]
+
+    folder_watcher.mark_published("doc")
+    fire_event(folder_watcher)
+    assert published == ["doc", "doc"]
+
+
+def test_folder_scan_runs_off_the_main_loop(tmp_path, monkeypatch):
+    """El recorrido recursivo corre en un hilo; lo que llega después de `stop()` se descarta."""
+    folder_watcher, storage, published = make_watcher(tmp_path, monkeypatch)
+    scan_threads = []
+
+    def list_folders(base_path):
+        scan_threads.append(threading.current_thread())
+        return ["doc"]
+
+    folder_watcher.list_folders = list_folders
+    folder_watcher._request_sync()
+    folder_watcher._request_sync()  # Llega mientras se recorre: se repite al terminar
+
+    callback, args = watcher.GLib.idle.get(timeout=5)
+    assert scan_threads and scan_threads[0] is not threading.current_thread()
+    assert args[1] == ["doc"] and "doc" in args[2]
+    assert folder_watcher._rescan
+
+    folder_watcher.stop()
+    callback(*args)
+    assert folder_watcher._monitors == {}
@@ -0,0 +1,90 @@
+import pytest
+import os
+import json
+from src.core.workspace_index import WorkspaceIndex, hash_text
+
+
+@pytest.fixture
+def index():
+    return WorkspaceIndex(":memory:")
+
+
+def make_folder(base, name, pr="1", content=""):
+    path = os.path.join(base, name)
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "config.json"), "w") as f:
+        json.dump({"repository_id": "r", "pull_request_id": pr, "work_item_id": "9"}, f)
+    with open(os.path.join(path, "content.md"), "w") as f:
+        f.write(content)
+
+# --- TESTS ---
+
+
+def test_reconcile_indexes_folders(index, tmp_path):
+    base = str(tmp_path)
+    make_folder(base, "a", pr="123", content="hola")
+    make_folder(base, "b", pr="7")
+
+    assert index.reconcile(base, ["a", "b"], "content.md", "config.json") == 2
+
+    assert index.folders_for_pr(base, "123") == ["a"]
+    assert index.get_folder(base, "a")["content_hash"] == hash_text("hola")
+
+
+def test_reconcile_only_rereads_changed_folders(index, tmp_path):
+    base = str(tmp_path)
+    make_folder(base, "a")
+    make_folder(base, "b")
+    index.reconcile(base, ["a", "b"], "content.md", "config.json")
+
+    md = os.path.join(base, "b", "content.md")
+    with open(md, "w") as f:
+        f.write("nuevo")
+    os.utime(md, (1, 1))
+
+    assert index.reconcile(base, ["a", "b"], "content.md", "config.json") == 1
+    assert index.get_folder(base, "b")["content_hash"] == hash_text("nuevo")
+
+
+def test_reconcile_removes_missing_folders(index, tmp_path):
+    base = str(tmp_path)
+    make_folder(base, "a")
+    index.reconcile(base, ["a"], "content.md", "config.json")
+
+    index.reconcile(base, [], "content.md", "config.json")
+
+    assert index.list_folders(base) == []
+
+
+def test_reconcile_skips_unreadable_folders(index, tmp_path):
+    """Un config.json roto o un Markdown que no es UTF-8 no frena el resto del índice."""
+    base = str(tmp_path)
+    make_folder(base, "bueno", pr="1")
+    make_folder(base, "roto")
+    make_folder(base, "binario")
+    with open(os.path.join(base, "roto", "config.json"), "w") as f:
+        f.write("{no es json")
+    with open(os.path.join(base, "binario", "content.md"), "wb") as f:
+        f.write(b"\xff\xfe\x00")
+
+    index.reconcile(base, ["binario", "bueno", "roto"], "content.md", "config.json")
+
+    assert index.folders_for_pr(base, "1") == ["bueno"]
+    assert index.list_folders(base) == ["binario", "bueno", "roto"]
+
+    with open(os.path.join(base, "roto", "config.json"), "w") as f:
+        json.dump({"pull_request_id": "2"}, f)
+    index.reconcile(base, ["binario", "bueno", "roto"], "content.md", "config.json")
+
+    assert index.folders_for_pr(base, "2") == ["roto"]
+
+
+def test_unpublished_and_order_queries(index):
+    index.upsert_folder("/ws", "viejo", mtime=10)
+    index.upsert_folder("/ws", "nuevo", mtime=20)
+    index.record_publish("/ws", "viejo", "h", 200, 200)
+    index.record_publish("/ws", "nuevo", "h", 500, 200)
+
+    assert index.list_folders("/ws", order="mtime") == ["nuevo", "viejo"]
+    assert index.list_folders("/ws", unpublished_only=True) == ["nuevo"]
+    assert len(index.publish_history("/ws", "nuevo")) == 1
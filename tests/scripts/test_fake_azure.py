@@ -0,0 +1,85 @@
+import pytest
+from src.core.azure_client import AzureClient
+from scripts.fake_azure import FakeAzureServer, FaultConfig
+
+
+@pytest.fixture
+def global_config():
+    return {"organization": "org", "project": "proj", "pat": "token"}
+
+
+@pytest.fixture
+def doc_config():
+    return {"repository_id": "repo", "pull_request_id": "7", "work_item_id": "42"}
+
+# --- TESTS ---
+
+
+def test_publish_roundtrip(global_config, doc_config):
+    """El cliente publica en el servidor local y puede leer el hilo creado."""
+    with FakeAzureServer() as server:
+        client = AzureClient(base_url=server.url)
+
+        assert client.post_to_pr(global_config, doc_config, "hola").ok
+        assert client.post_to_wi(global_config, doc_config, "**hola**").ok
+
+        threads = client.get_pr_threads(global_config, doc_config)
+        assert threads[0]["comments"][0]["content"] == "hola"
+        assert "<strong>hola</strong>" in server.state.history["42"][0]
+
+
+def test_invalid_pat_is_rejected(global_config):
+    with FakeAzureServer(faults=FaultConfig(invalid_pats={"token"})) as server:
+        assert AzureClient(base_url=server.url).verify_connection("org", "proj", "token") is False
+
+
+def test_fault_injection_sets_retry_after(global_config, doc_config):
+    """Los fallos inyectados responden 429/503 con Retry-After."""
+    with FakeAzureServer(faults=FaultConfig(fault_rate=1.0, retry_after=3)) as server:
+        response = AzureClient(base_url=server.url, max_retries=0).post_to_pr(global_config, doc_config, "x")
+
+        assert response.status_code in (429, 503)
+        assert response.headers["Retry-After"] == "3"
+
+
+def test_rate_limit_headers(global_config, doc_config):
+    """Al agotar el presupuesto por PAT se responde 429 con los headers de rate limit."""
+    with FakeAzureServer(faults=FaultConfig(rate_limit=1)) as server:
+        client = AzureClient(base_url=server.url, max_retries=0)
+        first = client.post_to_pr(global_config, doc_config, "x")
+        second = client.post_to_pr(global_config, doc_config, "x")
+
+        assert first.headers["X-RateLimit-Remaining"] == "0"
+        assert second.status_code == 429
+        assert "Retry-After" in second.headers
+
+
+def test_client_records_request_metrics(global_config, doc_config):
+    """Las peticiones reales registran latencia por endpoint/status y la fase de conexión."""
+    from src.core.metrics import METRICS
+
+    METRICS.reset()
+    with FakeAzureServer() as server:
+        AzureClient(base_url=server.url).post_to_pr(global_config, doc_config, "x")
+
+    snapshot = METRICS.snapshot()
+    assert snapshot["http_request_seconds"][0]["labels"] == {"endpoint": "pr_threads", "status": "200"}
+    phases = {s["labels"]["phase"] for s in snapshot["http_phase_seconds"]}
+    assert {"connect", "request", "response"} <= phases
+
+
+
+def test_binary_attachment_upload(global_config):
+    """Los adjuntos se suben como bytes; el servidor no intenta leerlos como JSON."""
+    import requests
+
+    data = bytes(range(256)) * 4
+    with FakeAzureServer() as server:
+        client = AzureClient(base_url=server.url)
+        response = requests.post(
+            f"{server.url}/org/proj/_apis/wit/attachments?fileName=logo.png&api-version=7.1",
+            data=data, headers={**client.get_auth_header("token"), "Content-Type": "application/octet-stream"},
+        )
+
+        assert response.status_code == 201
+        assert server.state.attachments[int(response.json()["id"])] == data
@@ -0,0 +1,92 @@
+import pytest
+import os
+import json
+from dataclasses import replace
+from src.core import constants, profiles
+from src.core.constants import AppConfig
+from scripts.fake_azure import FakeAzureServer, FaultConfig
+from scripts.pat_validation import health_check, classify, main
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    return AppConfig(
+        app_id="test_app",
+        config_dir=tmp_path,
+        global_config_file=tmp_path / "global.json",
+        md_file="content.md",
+        doc_config_file="config.json",
+        ignore_folders=set()
+    )
+
+
+@pytest.fixture
+def global_config(tmp_path):
+    config = {"base_path": str(tmp_path / "docs")}
+    config = profiles.save_profile(config, "default", {"organization": "org", "project": "proj", "pat": "token"})
+    return profiles.save_profile(config, "vencido", {"organization": "otra", "project": "p", "pat": "expirado"})
+
+
+def make_doc(base_path, name, **doc_config):
+    path = os.path.join(base_path, name)
+    os.makedirs(path)
+    with open(os.path.join(path, "config.json"), "w") as f:
+        json.dump(doc_config, f)
+
+# --- TESTS ---
+
+
+def test_classify_statuses():
+    assert [classify(s) for s in (200, 203, 401, 404, 500)] == ["ok", "unauthorized", "unauthorized", "missing", "error"]
+
+
+def test_health_check_reports_every_target(mock_config, global_config):
+    base_path = global_config["base_path"]
+    make_doc(base_path, "a", repository_id="repo", pull_request_id="7", work_item_id="42")
+    make_doc(base_path, "b", repository_id="repo", pull_request_id="8", work_item_id="42")
+    make_doc(base_path, "c", repository_id="repo", pull_request_id="7", profile="vencido")
+
+    with FakeAzureServer(faults=FaultConfig(invalid_pats={"expirado"})) as server:
+        server.state.pull_requests["repo"] = [7]
+        server.state.work_items.add(42)
+        report = health_check(global_config, replace(mock_config, azure_base_url=server.url), base_path, workers=4)
+
+    statuses = {(c["profile"], c["kind"], c["target"]): c["status"] for c in report["profiles"] + report["targets"]}
+    assert statuses[("default", "pat", "org/proj")] == "ok"
+    assert statuses[("vencido", "pat", "otra/p")] == "unauthorized"
+    assert statuses[("default", "pull_request", "repo/7")] == "ok"
+    assert statuses[("default", "pull_request", "repo/8")] == "missing"
+    assert statuses[("vencido", "pull_request", "repo/7")] == "skipped"
+    # El repo y el work item compartidos se verifican una sola vez
+    work_item = next(c for c in report["targets"] if c["kind"] == "work_item")
+    assert work_item["folders"] == ["a", "b"]
+    assert work_item["latency_ms"] is not None
+    assert report["healthy"] is False
+
+
+def test_main_writes_report_and_exit_code(tmp_path, global_config, monkeypatch):
+    config_file = tmp_path / "global.json"
+    config_file.write_text(json.dumps(profiles.remove_profile(global_config, "vencido")))
+    output = tmp_path / "health.json"
+
+    with FakeAzureServer() as server:
+        monkeypatch.setattr(constants, "DEFAULT_CONFIG", replace(constants.DEFAULT_CONFIG, azure_base_url=server.url))
+        code = main(["--config", str(config_file), "--output", str(output)])
+
+    assert code == 0
+    assert json.loads(output.read_text())["summary"] == {"ok": 1}
+
+
+def test_unknown_profile_fails(tmp_path, global_config):
+    """Un `--profile` mal escrito no puede terminar en un reporte sano sin verificaciones."""
+    config_file = tmp_path / "global.json"
+    config_file.write_text(json.dumps(global_config))
+
+    assert main(["--config", str(config_file), "--profile", "typo"]) == 2
+
+
+def test_empty_health_check_is_not_healthy(mock_config):
+    report = health_check({}, mock_config, None)
+
+    assert report["summary"] == {}
+    assert report["healthy"] is False